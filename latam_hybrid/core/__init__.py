@@ -12,6 +12,7 @@ from .data_models import (
     TimeZoneOffset,
     # Input data models
     WindData,
+    WindHistogram,
     SolarData,
     GISData,
     MarketData,
@@ -26,6 +27,7 @@ from .data_models import (
     HybridResult,
     # Utilities
     validate_timeseries_alignment,
+    STANDARD_AIR_DENSITY,
 )
 
 # Time alignment
@@ -65,6 +67,7 @@ __all__ = [
     'TimeZoneOffset',
     # Data models
     'WindData',
+    'WindHistogram',
     'SolarData',
     'GISData',
     'MarketData',
@@ -99,4 +102,5 @@ __all__ = [
     'GIS_DATA_DIR',
     # Utilities
     'validate_timeseries_alignment',
+    'STANDARD_AIR_DENSITY',
 ]
@@ -7,7 +7,7 @@ All data models follow the principle: frozen after creation to ensure data integ
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Union, Sequence
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -22,10 +22,16 @@ class WakeModel(str, Enum):
     """Available wake models for wind simulation."""
     NOJ = "NOJ"  # Jensen (N.O. Jensen)
     BASTANKHAH_GAUSSIAN = "Bastankhah_Gaussian"
+    NIAYIFAR_GAUSSIAN = "Niayifar_Gaussian"  # Gaussian, wake expansion from local TI
     TURBO_PARK = "TurboPark"
     FUGA = "Fuga"
 
 
+# IEC 61400-12-1 reference air density (kg/m³) and dry-air gas constant (J/(kg·K))
+STANDARD_AIR_DENSITY = 1.225
+GAS_CONSTANT_DRY_AIR = 287.05
+
+
 class TimeZoneOffset(int, Enum):
     """Common timezone offsets for the project."""
     UTC = 0
@@ -45,6 +51,8 @@ class WindData:
     Attributes:
         timeseries: DataFrame with DatetimeIndex and columns for wind components
                    Expected columns: ['ws' (wind speed), 'wd' (wind direction)]
+                   Optional: 'air_density' (kg/m³), 'temperature' (°C),
+                   'pressure' (hPa)
         height: Measurement height in meters
         timezone_offset: UTC offset in hours
         source: Data source identifier (e.g., "Vortex", "Measured")
@@ -55,6 +63,7 @@ class WindData:
     timezone_offset: int = TimeZoneOffset.UTC_MINUS_4
     source: str = "Unknown"
     metadata: Dict = field(default_factory=dict)
+    _memo: Dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate wind data structure."""
@@ -64,6 +73,361 @@ class WindData:
         if not isinstance(self.timeseries.index, pd.DatetimeIndex):
             raise ValueError("WindData timeseries must have DatetimeIndex")
 
+    def window(self, start=None, end=None) -> 'WindData':
+        """
+        Time window sharing this data's buffers (no copy).
+
+        Args:
+            start: First timestamp or partial date string (inclusive, None for open)
+            end: Last timestamp or partial date string (inclusive, None for open),
+                 e.g. window('2020', '2020') selects the calendar year 2020
+
+        Returns:
+            WindData whose timeseries is a view of this one
+
+        Example:
+            >>> year_2020 = wind_data.window('2020-01-01', '2020-12-31 23:00')
+        """
+        timeseries = self.timeseries.loc[start:end]
+        if timeseries.empty:
+            raise ValueError(f"No wind data between {start} and {end}")
+
+        return self._derive(
+            timeseries,
+            metadata={'window': (timeseries.index[0], timeseries.index[-1])}
+        )
+
+    def scaled(self, factor: float, description: Optional[str] = None) -> 'WindData':
+        """
+        Wind speeds multiplied by a factor, sharing all other columns.
+
+        Only the 'ws' column is new; the index, 'wd' and any further
+        columns reference this data's buffers.
+
+        Args:
+            factor: Wind speed multiplier (e.g. 1.02 for a +2% sensitivity)
+            description: Note appended to the source (default: the factor)
+
+        Returns:
+            WindData with scaled wind speeds
+        """
+        if factor <= 0:
+            raise ValueError(f"Scale factor must be positive, got {factor}")
+
+        timeseries = self.timeseries.copy(deep=False)
+        timeseries['ws'] = self.timeseries['ws'].values * factor
+
+        return self._derive(
+            timeseries,
+            source=f"{self.source} ({description or f'ws × {factor:.4f}'})",
+            metadata={'correction_factor': self.metadata.get('correction_factor', 1.0) * factor}
+        )
+
+    def at_height(self, height: float, alpha: float) -> 'WindData':
+        """
+        Wind speeds shifted to another height with the power law.
+
+        V_h = V_ref × (h / h_ref)^alpha; see scaled() for buffer sharing.
+
+        Args:
+            height: Target height in meters
+            alpha: Power-law shear exponent
+
+        Returns:
+            WindData at the target height (self if the heights match)
+
+        Example:
+            >>> hub_wind = wind_data.at_height(125, alpha=0.1846)
+        """
+        if np.isclose(height, self.height):
+            return self
+
+        factor = (height / self.height) ** alpha
+        shifted = self.scaled(
+            factor,
+            description=f"shear corrected to {height:g}m, α={alpha:.4f}"
+        )
+
+        return shifted._derive(
+            shifted.timeseries,
+            height=height,
+            metadata={
+                'extrapolated_from': self.height,
+                'alpha': alpha,
+                'target_hub_height': height
+            }
+        )
+
+    def air_density(self) -> Optional[np.ndarray]:
+        """
+        Hourly air density in kg/m³.
+
+        Taken from the 'air_density' column, or derived from 'pressure'
+        (hPa) and 'temperature' (°C) as rho = B / (R × T) for dry air.
+
+        Returns:
+            Air density per timestep, or None if the data carry neither
+        """
+        columns = self.timeseries.columns
+        if 'air_density' in columns:
+            return self.timeseries['air_density'].to_numpy(dtype=float)
+        if 'pressure' in columns and 'temperature' in columns:
+            pressure_pa = self.timeseries['pressure'].to_numpy(dtype=float) * 100.0
+            temperature_k = self.timeseries['temperature'].to_numpy(dtype=float) + 273.15
+            return pressure_pa / (GAS_CONSTANT_DRY_AIR * temperature_k)
+        return None
+
+    def density_normalized(self, reference_density: float = STANDARD_AIR_DENSITY) -> 'WindData':
+        """
+        Wind speeds normalized to a reference air density (IEC 61400-12-1).
+
+        V_n = V × (rho / rho_ref)^(1/3) per timestep, so a power curve at
+        rho_ref evaluated at V_n gives the power at the actual density.
+        Hours without a valid density keep their wind speed. See scaled()
+        for buffer sharing.
+
+        Args:
+            reference_density: Air density of the power curve (kg/m³)
+
+        Returns:
+            Normalized WindData (self without density data or if already
+            normalized to this reference)
+
+        Example:
+            >>> effective = wind_data.density_normalized(turbine.reference_air_density)
+        """
+        normalized_to = self.metadata.get('density_normalized_to')
+        if normalized_to is not None:
+            if not np.isclose(normalized_to, reference_density):
+                raise ValueError(
+                    f"Wind data are already normalized to {normalized_to} kg/m³"
+                )
+            return self
+
+        density = self.air_density()
+        if density is None:
+            return self
+
+        with np.errstate(invalid='ignore'):
+            factor = np.cbrt(density / reference_density)
+        factor[~np.isfinite(factor) | (factor <= 0)] = 1.0
+
+        timeseries = self.timeseries.copy(deep=False)
+        timeseries['ws'] = self.timeseries['ws'].to_numpy(dtype=float) * factor
+
+        return self._derive(
+            timeseries,
+            metadata={
+                'density_normalized_to': float(reference_density),
+                'mean_air_density': float(np.nanmean(density)),
+                'mean_density_factor': float(np.mean(factor))
+            }
+        )
+
+    def histogram(
+        self,
+        ws_bins: Union[float, Sequence[float]] = 1.0,
+        n_sectors: int = 12
+    ) -> 'WindHistogram':
+        """
+        Joint wind speed × direction histogram, computed once per binning.
+
+        The result is memoized on this instance, so Weibull fitting, wind
+        roses and sector statistics share one pass over the timeseries.
+        The timeseries is treated as immutable; derive new WindData
+        (window, scaled, ...) instead of editing it in place.
+
+        Args:
+            ws_bins: Wind speed bin width (m/s) or explicit bin edges
+            n_sectors: Number of direction sectors
+
+        Returns:
+            WindHistogram
+
+        Example:
+            >>> hist = wind_data.histogram(ws_bins=1.0, n_sectors=12)
+            >>> hist.sector_frequency
+        """
+        key = (
+            'histogram',
+            float(ws_bins) if np.ndim(ws_bins) == 0 else tuple(np.asarray(ws_bins, dtype=float)),
+            int(n_sectors)
+        )
+        return self.memoized(key, lambda: WindHistogram.from_arrays(
+            self.timeseries['ws'].to_numpy(),
+            self.timeseries['wd'].to_numpy(),
+            ws_bins=ws_bins,
+            n_sectors=n_sectors
+        ))
+
+    def memoized(self, key, compute):
+        """
+        Derived quantity computed once per instance.
+
+        Used for per-dataset results that several analyses share (the
+        histogram, stability classes, ...). Keys must be hashable and
+        describe every option the result depends on.
+
+        Args:
+            key: Hashable cache key
+            compute: Callable returning the value on a miss
+
+        Returns:
+            The memoized value
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def _derive(self, timeseries: pd.DataFrame, **changes) -> 'WindData':
+        """New WindData with a timeseries, updated fields and merged metadata."""
+        metadata = {**self.metadata, **changes.pop('metadata', {})}
+        return WindData(
+            timeseries=timeseries,
+            height=changes.pop('height', self.height),
+            timezone_offset=self.timezone_offset,
+            source=changes.pop('source', self.source),
+            metadata=metadata
+        )
+
+
+@dataclass(frozen=True)
+class WindHistogram:
+    """
+    Joint wind speed × direction histogram of a wind timeseries.
+
+    Sector k covers directions [k × width, (k + 1) × width) after wrapping
+    to [0, 360). Wind speeds above the last edge count in the last bin and
+    timesteps with missing wind speed or direction are excluded.
+
+    Attributes:
+        counts: Timesteps per (sector, ws bin), shape (n_sectors, n_ws_bins)
+        ws_sum: Sum of wind speeds per cell (exact cell means), same shape
+        ws_edges: Wind speed bin edges in m/s, shape (n_ws_bins + 1,)
+        ws_max: Highest wind speed in the data (m/s)
+    """
+    counts: np.ndarray
+    ws_sum: np.ndarray
+    ws_edges: np.ndarray
+    ws_max: float = 0.0
+
+    @classmethod
+    def from_arrays(
+        cls,
+        ws: np.ndarray,
+        wd: np.ndarray,
+        ws_bins: Union[float, Sequence[float]] = 1.0,
+        n_sectors: int = 12
+    ) -> 'WindHistogram':
+        """
+        Histogram of wind speed and direction arrays in one bincount pass.
+
+        Args:
+            ws: Wind speeds (m/s)
+            wd: Wind directions (degrees)
+            ws_bins: Wind speed bin width (m/s) or explicit bin edges
+            n_sectors: Number of direction sectors
+
+        Returns:
+            WindHistogram
+        """
+        if n_sectors < 1:
+            raise ValueError(f"n_sectors must be at least 1, got {n_sectors}")
+
+        ws = np.asarray(ws, dtype=float)
+        wd = np.asarray(wd, dtype=float)
+        valid = np.isfinite(ws) & np.isfinite(wd)
+        ws = ws[valid]
+        wd = wd[valid]
+        ws_max = float(ws.max()) if len(ws) else 0.0
+
+        if np.ndim(ws_bins) == 0:
+            if ws_bins <= 0:
+                raise ValueError(f"ws bin width must be positive, got {ws_bins}")
+            ws_edges = np.arange(int(ws_max // ws_bins) + 2) * float(ws_bins)
+        else:
+            ws_edges = np.asarray(ws_bins, dtype=float)
+            if len(ws_edges) < 2 or np.any(np.diff(ws_edges) <= 0):
+                raise ValueError("ws bin edges must be increasing with at least two values")
+
+        n_ws = len(ws_edges) - 1
+        ws_index = np.clip(np.searchsorted(ws_edges, ws, side='right') - 1, 0, n_ws - 1)
+        sector = cls._sector_of(wd, n_sectors)
+
+        cell = sector * n_ws + ws_index
+        size = n_sectors * n_ws
+        return cls(
+            counts=np.bincount(cell, minlength=size).reshape(n_sectors, n_ws),
+            ws_sum=np.bincount(cell, weights=ws, minlength=size).reshape(n_sectors, n_ws),
+            ws_edges=ws_edges,
+            ws_max=ws_max
+        )
+
+    @property
+    def n_sectors(self) -> int:
+        """Number of direction sectors."""
+        return self.counts.shape[0]
+
+    @property
+    def sector_width(self) -> float:
+        """Direction sector width (degrees)."""
+        return 360.0 / self.n_sectors
+
+    @property
+    def sector_centers(self) -> np.ndarray:
+        """Direction sector centers (degrees)."""
+        return (np.arange(self.n_sectors) + 0.5) * self.sector_width
+
+    @property
+    def ws_centers(self) -> np.ndarray:
+        """Wind speed bin centers (m/s)."""
+        return (self.ws_edges[:-1] + self.ws_edges[1:]) / 2
+
+    @property
+    def n_samples(self) -> int:
+        """Number of timesteps counted."""
+        return int(self.counts.sum())
+
+    @property
+    def frequency(self) -> np.ndarray:
+        """Joint frequency per (sector, ws bin), summing to 1."""
+        return self.counts / max(self.n_samples, 1)
+
+    @property
+    def sector_frequency(self) -> np.ndarray:
+        """Frequency per direction sector, summing to 1."""
+        return self.counts.sum(axis=1) / max(self.n_samples, 1)
+
+    @property
+    def ws_frequency(self) -> np.ndarray:
+        """Frequency per wind speed bin, summing to 1."""
+        return self.counts.sum(axis=0) / max(self.n_samples, 1)
+
+    @property
+    def sector_mean_ws(self) -> np.ndarray:
+        """Mean wind speed per sector (m/s, NaN for empty sectors)."""
+        counts = self.counts.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, self.ws_sum.sum(axis=1) / counts, np.nan)
+
+    def sector_index(self, wd: np.ndarray) -> np.ndarray:
+        """
+        Sector of each direction under this histogram's binning.
+
+        Args:
+            wd: Wind directions (degrees, finite)
+
+        Returns:
+            Integer sector index per direction
+        """
+        return self._sector_of(np.asarray(wd, dtype=float), self.n_sectors)
+
+    @staticmethod
+    def _sector_of(wd: np.ndarray, n_sectors: int) -> np.ndarray:
+        width = 360.0 / n_sectors
+        return (np.mod(wd, 360.0) // width).astype(np.int64) % n_sectors
+
+
 
 @dataclass(frozen=True)
 class SolarData:
@@ -214,24 +578,34 @@ class WindSimulationResult:
         aep_gwh: Net Annual Energy Production in GWh (after all losses)
         capacity_factor: Overall capacity factor (0-1)
         wake_loss_percent: Wake loss percentage (0-100)
-        turbine_production_gwh: Per-turbine production in GWh (list)
+        turbine_production_gwh: Per-turbine production in GWh (list, or a
+                                float32 array for compact results, like
+                                the '*_per_turbine_gwh' metadata entries)
         wake_model: WakeModel
         sector_loss_percent: Sector management curtailment loss percentage (0-100, future)
         gross_aep_gwh: Gross AEP before non-wake losses (optional, for loss tracking)
         loss_breakdown: Detailed breakdown of all loss categories (optional)
         total_loss_factor: Combined loss factor (1-l1)*(1-l2)*...*(1-ln) (optional)
         metadata: Simulation metadata (wake model, version, runtime, etc.)
+        arrays: Requested result variables of a compact result as float32
+                arrays (e.g. {'Power': (n_turbines, n_timesteps)}), possibly
+                memory-mapped from disk, plus 'NetPower' after
+                WindSite.apply_operational_losses(); empty otherwise
+        hourly_energy: Hourly farm energy and losses (MWh) on the wind data's
+                       DatetimeIndex for time-series results, else None
     """
     aep_gwh: float
     capacity_factor: float
     wake_loss_percent: float
-    turbine_production_gwh: List[float]
+    turbine_production_gwh: Union[List[float], np.ndarray]
     wake_model: WakeModel
     sector_loss_percent: float = 0.0  # Future: sector management losses
     gross_aep_gwh: Optional[float] = None
     loss_breakdown: Optional[Dict[str, Dict]] = None  # Changed to Dict[str, Dict]
     total_loss_factor: Optional[float] = None
     metadata: Dict = field(default_factory=dict)
+    arrays: Dict[str, np.ndarray] = field(default_factory=dict, repr=False, compare=False)
+    hourly_energy: Optional[pd.DataFrame] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate simulation results."""
@@ -245,6 +619,27 @@ class WindSimulationResult:
             if not (0 <= self.total_loss_factor <= 1):
                 raise ValueError("Total loss factor must be between 0 and 1")
 
+    @property
+    def turbine_production(self) -> np.ndarray:
+        """Per-turbine production in GWh as a float array."""
+        return np.asarray(self.turbine_production_gwh, dtype=float)
+
+    def per_turbine(self, name: str) -> np.ndarray:
+        """
+        Per-turbine metadata figure as a float array.
+
+        Args:
+            name: Metadata key with or without the '_per_turbine_gwh' suffix,
+                  e.g. 'wake_loss' or 'ideal_per_turbine_gwh'
+
+        Returns:
+            Array of shape (n_turbines,) in GWh/year
+        """
+        key = name if name.endswith('_per_turbine_gwh') else f'{name}_per_turbine_gwh'
+        if key not in self.metadata:
+            raise KeyError(f"No per-turbine figure '{key}' in result metadata")
+        return np.asarray(self.metadata[key], dtype=float)
+
 
 @dataclass(frozen=True)
 class SolarProductionResult:
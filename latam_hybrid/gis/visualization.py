@@ -258,11 +258,12 @@ def plot_distance_heatmap(
 
 
 def plot_wind_rose(
-    wind_directions: np.ndarray,
-    wind_speeds: np.ndarray,
+    wind_directions: Optional[np.ndarray] = None,
+    wind_speeds: Optional[np.ndarray] = None,
     bins: int = 16,
     figsize: Tuple[int, int] = (10, 10),
-    save_path: Optional[Union[str, Path]] = None
+    save_path: Optional[Union[str, Path]] = None,
+    histogram=None
 ):
     """
     Plot wind rose diagram.
@@ -273,6 +274,8 @@ def plot_wind_rose(
         bins: Number of direction bins (default 16 = 22.5° sectors)
         figsize: Figure size
         save_path: Optional path to save figure
+        histogram: Precomputed WindHistogram (e.g. wind_data.histogram(n_sectors=16))
+                   used instead of the arrays
 
     Returns:
         Matplotlib figure and axes
@@ -281,41 +284,38 @@ def plot_wind_rose(
         >>> directions = np.random.uniform(0, 360, 1000)
         >>> speeds = np.random.weibull(2, 1000) * 8
         >>> fig, ax = plot_wind_rose(directions, speeds)
+        >>> fig, ax = plot_wind_rose(histogram=wind_data.histogram(n_sectors=16))
     """
     try:
         import matplotlib.pyplot as plt
     except ImportError:
         raise ImportError("matplotlib required")
 
+    from ..core import WindHistogram
+
+    if histogram is None:
+        if wind_directions is None or wind_speeds is None:
+            raise ValueError("Provide wind_directions and wind_speeds, or a histogram")
+        histogram = WindHistogram.from_arrays(wind_speeds, wind_directions, n_sectors=bins)
+
     # Create polar plot
     fig = plt.figure(figsize=figsize)
     ax = fig.add_subplot(111, projection='polar')
 
-    # Calculate direction bins
-    dir_bins = np.linspace(0, 360, bins + 1)
-    dir_centers = (dir_bins[:-1] + dir_bins[1:]) / 2
-
     # Convert to radians (0° = North = π/2 in math, adjust)
-    theta = np.radians(90 - dir_centers)
-
-    # Calculate frequency in each direction bin
-    frequencies = np.zeros(bins)
-    for i in range(bins):
-        mask = (wind_directions >= dir_bins[i]) & (wind_directions < dir_bins[i + 1])
-        frequencies[i] = mask.sum()
+    theta = np.radians(90 - histogram.sector_centers)
 
-    # Normalize to percentages
-    frequencies = frequencies / len(wind_directions) * 100
+    # Frequency in each direction bin (percent)
+    frequencies = histogram.sector_frequency * 100
 
     # Plot bars
-    width = 2 * np.pi / bins
+    width = 2 * np.pi / histogram.n_sectors
     bars = ax.bar(theta, frequencies, width=width, bottom=0.0, alpha=0.7)
 
     # Color bars by average speed in that direction
-    for i, bar in enumerate(bars):
-        mask = (wind_directions >= dir_bins[i]) & (wind_directions < dir_bins[i + 1])
-        avg_speed = wind_speeds[mask].mean() if mask.any() else 0
-        bar.set_facecolor(plt.cm.viridis(avg_speed / wind_speeds.max()))
+    mean_speeds = np.nan_to_num(histogram.sector_mean_ws)
+    for bar, avg_speed in zip(bars, mean_speeds, strict=True):
+        bar.set_facecolor(plt.cm.viridis(avg_speed / histogram.ws_max if histogram.ws_max else 0))
 
     # Set 0° to North
     ax.set_theta_zero_location('N')
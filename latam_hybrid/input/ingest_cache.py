@@ -0,0 +1,152 @@
+"""
+Binary ingest cache for parsed wind data text files.
+
+Parsing a multi-year Vortex export (whitespace splitting plus timestamp
+parsing) takes seconds and is repeated by every script. The parsed frame is
+stored once as one ``.npy`` file per column plus a JSON index, keyed by the
+source file's path, size and modification time and the reader options.
+Later reads memory-map the columns, so loading the full record takes
+milliseconds and the columns are shared with the page cache.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Bump when the stored layout or key recipe change so stale entries are ignored
+INGEST_FORMAT_VERSION = "1"
+
+
+def ingest_cache_key(filepath: Union[str, Path], **options) -> str:
+    """
+    Compute the cache key of a source file and reader options.
+
+    The key changes whenever the file is replaced or edited (size or
+    modification time) or the reader is called with different options.
+
+    Args:
+        filepath: Source data file
+        **options: Reader options that affect the parsed frame
+                  (e.g. skiprows, column_mapping)
+
+    Returns:
+        Hex digest string
+
+    Example:
+        >>> key = ingest_cache_key("vortex.serie.txt", skiprows=3)
+    """
+    filepath = Path(filepath).resolve()
+    stat = filepath.stat()
+
+    hasher = hashlib.sha256()
+    hasher.update(f"v{INGEST_FORMAT_VERSION}|{filepath}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+    for name in sorted(options):
+        hasher.update(f"|{name}={options[name]!r}".encode())
+
+    return hasher.hexdigest()
+
+
+def load_cached_frame(cache_dir: Union[str, Path], key: str) -> Optional[pd.DataFrame]:
+    """
+    Load a parsed frame from the ingest cache.
+
+    Columns are memory-mapped read-only arrays; selecting or assigning
+    columns works as usual, in-place edits of cached columns do not.
+
+    Args:
+        cache_dir: Ingest cache directory
+        key: Key from ingest_cache_key()
+
+    Returns:
+        DataFrame with DatetimeIndex, or None if the entry does not exist
+    """
+    entry = _entry_dir(cache_dir, key)
+    index_path = entry / 'index.json'
+    if not index_path.exists():
+        return None
+
+    try:
+        index = json.loads(index_path.read_text())
+        if index.get('key') != key:
+            return None
+
+        time = np.load(entry / 'time.npy', mmap_mode='r')
+        columns = {
+            name: np.load(entry / f'col_{i:03d}.npy', mmap_mode='r')
+            for i, name in enumerate(index['columns'])
+        }
+    except (OSError, KeyError, ValueError):
+        # Corrupt or partial entry - drop it and re-parse
+        shutil.rmtree(entry, ignore_errors=True)
+        return None
+
+    datetime_index = pd.DatetimeIndex(time.view('datetime64[ns]'), name=index['index_name'])
+    if index.get('tz'):
+        datetime_index = datetime_index.tz_localize('UTC').tz_convert(index['tz'])
+
+    return pd.DataFrame(columns, index=datetime_index, copy=False)
+
+
+def store_cached_frame(
+    cache_dir: Union[str, Path],
+    key: str,
+    df: pd.DataFrame,
+    source: Optional[Union[str, Path]] = None
+) -> Optional[Path]:
+    """
+    Write a parsed frame to the ingest cache.
+
+    Only frames with a DatetimeIndex and numeric columns are cached.
+
+    Args:
+        cache_dir: Ingest cache directory (created if missing)
+        key: Key from ingest_cache_key()
+        df: Parsed frame
+        source: Source file path, recorded in the JSON index
+
+    Returns:
+        Entry directory, or None if the frame cannot be cached
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return None
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        return None
+
+    entry = _entry_dir(cache_dir, key)
+    tmp_entry = entry.with_name(f"{entry.name}.tmp{os.getpid()}")
+    shutil.rmtree(tmp_entry, ignore_errors=True)
+    tmp_entry.mkdir(parents=True)
+
+    index = df.index
+    tz = str(index.tz) if index.tz is not None else None
+    if tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+
+    np.save(tmp_entry / 'time.npy', index.as_unit('ns').asi8)
+    for i, name in enumerate(df.columns):
+        np.save(tmp_entry / f'col_{i:03d}.npy', df[name].to_numpy())
+
+    (tmp_entry / 'index.json').write_text(json.dumps({
+        'key': key,
+        'format_version': INGEST_FORMAT_VERSION,
+        'source': str(source) if source is not None else None,
+        'columns': [str(name) for name in df.columns],
+        'index_name': df.index.name,
+        'tz': tz,
+        'n_records': len(df)
+    }, indent=2))
+
+    shutil.rmtree(entry, ignore_errors=True)
+    os.replace(tmp_entry, entry)
+    return entry
+
+
+def _entry_dir(cache_dir: Union[str, Path], key: str) -> Path:
+    return Path(cache_dir) / key[:24]
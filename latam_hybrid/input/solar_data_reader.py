@@ -4,8 +4,9 @@ Solar data readers for PV analysis.
 Supports PVGIS CSV format and prepares data for pvlib integration.
 """
 
+import io
 from pathlib import Path
-from typing import Optional, Union, Dict
+from typing import Optional, Union, Dict, Iterator, List, Tuple
 import pandas as pd
 import numpy as np
 
@@ -13,6 +14,19 @@ from ..core import SolarData, TimeZoneOffset, DataValidator, align_pvgis_time
 from .loaders import FileLoader
 
 
+# PVGIS hourly timestamps, e.g. '20200101:0010'
+PVGIS_TIME_FORMAT = '%Y%m%d:%H%M'
+
+# Header names recognised as the timestamp column when locating the header line
+PVGIS_TIME_COLUMNS = (b'time', b'timestamp')
+
+# Power columns kept in float64; irradiance and weather columns are read as float32
+PVGIS_FLOAT64_COLUMNS = ('P', 'p', 'power', 'Power')
+
+# Trailing bytes searched for the legend footer
+PVGIS_FOOTER_SCAN_BYTES = 64 * 1024
+
+
 class PVGISReader:
     """
     Reader for PVGIS (Photovoltaic Geographical Information System) data.
@@ -28,23 +42,33 @@ class PVGISReader:
     def read_pvgis_csv(
         filepath: Union[str, Path],
         capacity_kw: float,
-        skiprows: int = 10,
+        skiprows: Optional[int] = None,
         timezone_offset: int = TimeZoneOffset.UTC_MINUS_4,
         shift_minutes: int = 30,
         apply_time_shift: bool = True,
-        validate: bool = True
+        validate: bool = True,
+        chunksize: Optional[int] = None
     ) -> SolarData:
         """
         Read PVGIS CSV time series file.
 
+        The file is parsed in a single pass: the metadata header and the
+        legend footer are located once, only the data block between them is
+        handed to the CSV parser, and the PVGIS 'YYYYMMDD:HHMM' timestamps
+        are converted with an explicit format. Irradiance and weather columns
+        are stored as float32; the power column stays float64.
+
         Args:
             filepath: Path to PVGIS CSV file
             capacity_kw: Installed PV capacity in kW
-            skiprows: Number of header rows to skip (PVGIS typically has 10)
+            skiprows: Number of header rows to skip (None to locate the
+                     'time' header line automatically)
             timezone_offset: Local timezone UTC offset
             shift_minutes: Time shift to apply (PVGIS typically needs +30min)
             apply_time_shift: Whether to apply timezone/shift adjustments
             validate: Whether to validate loaded data
+            chunksize: Rows parsed per chunk (None to parse in one go); bounds
+                      parser memory for very long series
 
         Returns:
             SolarData object with timeseries and metadata
@@ -56,59 +80,17 @@ class PVGISReader:
         Example:
             >>> solar_data = PVGISReader.read_pvgis_csv(
             ...     "PVGIS_timeseries.csv",
-            ...     capacity_kw=10000,
-            ...     skiprows=10
+            ...     capacity_kw=10000
             ... )
         """
         filepath = Path(filepath)
 
-        # Load PVGIS CSV
-        df = FileLoader.load_csv(
+        chunks = list(PVGISReader.iter_pvgis_chunks(
             filepath,
             skiprows=skiprows,
-            parse_dates=['time'] if 'time' in pd.read_csv(filepath, nrows=1).columns else None
-        )
-
-        # PVGIS column names (may vary)
-        # Common columns: time, G(i), H_sun, T2m, Int, WS10m, P
-        # Required: time, P (power)
-        # Optional: G(i) (irradiance), T2m (temperature)
-
-        # Handle timestamp column
-        time_col_candidates = ['time', 'Time', 'timestamp', 'Timestamp']
-        time_col = None
-        for col in time_col_candidates:
-            if col in df.columns:
-                time_col = col
-                break
-
-        # If no time column but index looks like dates, use it
-        if time_col is None:
-            if pd.api.types.is_datetime64_any_dtype(df.index):
-                # Already has datetime index, nothing to do
-                pass
-            else:
-                # Try to parse first column as datetime
-                if len(df.columns) > 0:
-                    try:
-                        df.iloc[:, 0] = pd.to_datetime(df.iloc[:, 0])
-                        time_col = df.columns[0]
-                    except:
-                        raise ValueError(
-                            f"No time column found in PVGIS file. "
-                            f"Available columns: {df.columns.tolist()}"
-                        )
-                else:
-                    raise ValueError(
-                        f"No time column found in PVGIS file. "
-                        f"Available columns: {df.columns.tolist()}"
-                    )
-
-        # Convert to datetime and set as index
-        if time_col is not None:
-            df[time_col] = pd.to_datetime(df[time_col])
-            df = df.set_index(time_col)
-        # else: already has datetime index
+            chunksize=chunksize
+        ))
+        df = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
 
         # Identify power column
         power_col_candidates = ['P', 'p', 'power', 'Power']
@@ -182,6 +164,135 @@ class PVGISReader:
         )
 
 
+    @staticmethod
+    def iter_pvgis_chunks(
+        filepath: Union[str, Path],
+        skiprows: Optional[int] = None,
+        chunksize: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the data block of a PVGIS CSV file in parsed chunks.
+
+        Each chunk has a DatetimeIndex and the file's columns with PVGIS
+        names; no time shift is applied.
+
+        Args:
+            filepath: Path to PVGIS CSV file
+            skiprows: Number of header rows to skip (None to locate the
+                     'time' header line automatically)
+            chunksize: Rows per chunk (None for a single chunk)
+
+        Yields:
+            DataFrame per chunk
+
+        Example:
+            >>> for chunk in PVGISReader.iter_pvgis_chunks("PVGIS_timeseries.csv"):
+            ...     energy_wh += chunk['P'].sum()
+        """
+        filepath = Path(filepath)
+
+        if not filepath.exists():
+            raise FileNotFoundError(f"CSV file not found: {filepath}")
+
+        if filepath.stat().st_size == 0:
+            raise ValueError(f"CSV file is empty: {filepath}")
+
+        with open(filepath, 'rb') as f:
+            columns, data_start, data_end = _locate_pvgis_data(f, skiprows)
+            if data_end <= data_start:
+                raise ValueError(f"CSV file loaded but contains no data: {filepath}")
+
+            time_col = columns[0]
+            dtypes = {
+                col: (np.float64 if col in PVGIS_FLOAT64_COLUMNS else np.float32)
+                for col in columns[1:]
+            }
+            dtypes[time_col] = str
+
+            reader = pd.read_csv(
+                io.BufferedReader(_ByteRange(f, data_start, data_end)),
+                header=None,
+                names=columns,
+                dtype=dtypes,
+                chunksize=chunksize
+            )
+            for chunk in (reader if chunksize is not None else [reader]):
+                chunk.index = _parse_pvgis_time(chunk.pop(time_col))
+                yield chunk
+
+
+def _locate_pvgis_data(f, skiprows: Optional[int]) -> Tuple[List[str], int, int]:
+    """
+    Locate the header line and the data block of a PVGIS CSV file.
+
+    Args:
+        f: File opened in binary mode
+        skiprows: Lines before the header line (None to search for it)
+
+    Returns:
+        (column names, byte offset of the first data row, byte offset
+        after the last data row)
+    """
+    line_number = 0
+    while True:
+        line = f.readline()
+        if not line:
+            raise ValueError("No header line found in PVGIS file")
+        if skiprows is not None:
+            if line_number == skiprows:
+                break
+        elif line.split(b',', 1)[0].strip().lower() in PVGIS_TIME_COLUMNS:
+            break
+        line_number += 1
+
+    columns = [name.strip() for name in line.decode('utf-8').split(',')]
+    data_start = f.tell()
+
+    # The legend footer follows the last data row (which starts with a digit)
+    data_end = f.seek(0, io.SEEK_END)
+    tail_start = max(data_start, data_end - PVGIS_FOOTER_SCAN_BYTES)
+    f.seek(tail_start)
+    tail = f.read()
+    offset = len(tail)
+    for row in reversed(tail.splitlines(keepends=True)):
+        if row[:1].isdigit():
+            data_end = tail_start + offset
+            break
+        offset -= len(row)
+
+    return columns, data_start, data_end
+
+
+def _parse_pvgis_time(values: pd.Series) -> pd.DatetimeIndex:
+    """Parse PVGIS 'YYYYMMDD:HHMM' stamps, falling back to inferred formats."""
+    try:
+        stamps = pd.to_datetime(values, format=PVGIS_TIME_FORMAT)
+    except ValueError:
+        stamps = pd.to_datetime(values)
+    return pd.DatetimeIndex(stamps, name=values.name)
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only stream over a byte range of an open binary file."""
+
+    def __init__(self, f, start: int, end: int):
+        f.seek(start)
+        self._file = f
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        data = self._file.read(size)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
 class GenericSolarReader:
     """
     Generic solar data reader for CSV/Excel formats.
@@ -4,14 +4,26 @@ Wind data readers for various meteorological data sources.
 Supports Vortex time series format and prepares data for pywake integration.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, Dict, Tuple
+from typing import Optional, Union, Dict, Tuple, Sequence
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 from ..core import WindData, TimeZoneOffset, DataValidator, TimeAlignmentService
 from .loaders import FileLoader
+from .ingest_cache import ingest_cache_key, load_cached_frame, store_cached_frame
+
+
+# Vortex atmospheric columns kept next to ws and wd (standard name → file column)
+VORTEX_ATMOSPHERE_COLUMNS = {
+    'temperature': 'T(C)',
+    'air_density': 'De(k/m3)',
+    'pressure': 'PRE(hPa)',
+    'richardson': 'RiNumber',
+    'rmol': 'RMOL(1/m)'
+}
 
 
 class VortexWindReader:
@@ -32,11 +44,23 @@ class VortexWindReader:
         skiprows: int = 0,
         column_mapping: Optional[Dict[str, str]] = None,
         timezone_offset: int = TimeZoneOffset.UTC,
-        validate: bool = True
+        validate: bool = True,
+        cache_dir: Optional[Union[str, Path]] = None,
+        atmosphere_columns: Sequence[str] = tuple(VORTEX_ATMOSPHERE_COLUMNS),
+        atmosphere_dtype: str = 'float64'
     ) -> WindData:
         """
         Read Vortex wind time series file.
 
+        Besides ws and wd, the atmospheric columns (temperature, air density,
+        pressure, Richardson number, inverse Obukhov length) are kept when
+        present, for the air density correction (WindData.density_normalized)
+        and atmospheric stability (latam_hybrid.wind.stability).
+
+        With cache_dir, the parsed file (timestamps and all Vortex columns)
+        is stored as memory-mappable binary columns on the first read and
+        loaded from there while the file and reader options are unchanged.
+
         Args:
             filepath: Path to Vortex data file
             height: Measurement height in meters
@@ -45,6 +69,14 @@ class VortexWindReader:
                           Default: {'ws': 'ws', 'wd': 'wd', 'time': 'time'}
             timezone_offset: UTC offset of timestamps in file
             validate: Whether to validate loaded data
+            cache_dir: Directory of the binary ingest cache (None to always
+                      parse the text file)
+            atmosphere_columns: Standard names of the atmospheric columns to
+                               keep if present ('temperature', 'air_density',
+                               'pressure', 'richardson', 'rmol'; empty for
+                               ws and wd only)
+            atmosphere_dtype: dtype of the kept atmospheric columns
+                             ('float32' halves their memory)
 
         Returns:
             WindData object with timeseries and metadata
@@ -57,7 +89,8 @@ class VortexWindReader:
             >>> wind_data = VortexWindReader.read_vortex_timeseries(
             ...     "vortex.serie.100m.txt",
             ...     height=100.0,
-            ...     skiprows=3
+            ...     skiprows=3,
+            ...     cache_dir=".cache/ingest"
             ... )
         """
         filepath = Path(filepath)
@@ -70,18 +103,28 @@ class VortexWindReader:
                 'wd': 'wd'
             }
 
-        # Load file (Vortex typically whitespace-delimited)
-        df = FileLoader.load_text_file(
-            filepath,
-            skiprows=skiprows,
-            delimiter=None  # Whitespace
-        )
-
-        # Rename columns if needed
-        if column_mapping:
-            # Try to map columns
-            reverse_mapping = {v: k for k, v in column_mapping.items()}
-            df = df.rename(columns=reverse_mapping)
+        df = None
+        if cache_dir is not None:
+            if not filepath.exists():
+                raise FileNotFoundError(f"Text file not found: {filepath}")
+            cache_key = ingest_cache_key(
+                filepath, skiprows=skiprows, column_mapping=column_mapping
+            )
+            df = load_cached_frame(cache_dir, cache_key)
+
+        if df is None:
+            df = VortexWindReader._parse_vortex_file(filepath, skiprows, column_mapping)
+            if cache_dir is not None:
+                store_cached_frame(cache_dir, cache_key, df, source=filepath)
+
+        # Standard names for the Vortex atmospheric columns (no data copy)
+        mapped = set(column_mapping)
+        renames = {
+            file_col: name for name, file_col in VORTEX_ATMOSPHERE_COLUMNS.items()
+            if name not in mapped and name not in df.columns
+        }
+        if any(col in renames for col in df.columns):
+            df.columns = [renames.get(col, col) for col in df.columns]
 
         # Ensure required columns exist
         required_cols = ['ws', 'wd']
@@ -92,23 +135,11 @@ class VortexWindReader:
                 f"Available columns: {df.columns.tolist()}"
             )
 
-        # Handle timestamp column
-        if 'time' in df.columns:
-            # Convert to datetime
-            df['time'] = pd.to_datetime(df['time'])
-            df = df.set_index('time')
-        elif not isinstance(df.index, pd.DatetimeIndex):
-            # Try to parse index as datetime
-            try:
-                df.index = pd.to_datetime(df.index)
-            except Exception:
-                raise ValueError(
-                    "No valid timestamp column found. Vortex data must have "
-                    "datetime index or 'time' column."
-                )
-
-        # Ensure only required columns
-        df = df[required_cols]
+        # Keep the required and available atmospheric columns
+        atmosphere = [col for col in atmosphere_columns if col in df.columns]
+        df = df[required_cols + atmosphere]
+        if atmosphere and any(df[col].dtype != atmosphere_dtype for col in atmosphere):
+            df = df.astype(dict.fromkeys(atmosphere, atmosphere_dtype))
 
         # Validate data if requested
         if validate:
@@ -135,23 +166,83 @@ class VortexWindReader:
 
         return wind_data
 
+    @staticmethod
+    def _parse_vortex_file(
+        filepath: Path,
+        skiprows: int,
+        column_mapping: Dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Parse a Vortex text file into a frame with all columns and DatetimeIndex.
+
+        Args:
+            filepath: Path to Vortex data file
+            skiprows: Number of header rows to skip
+            column_mapping: Map of standard names to file columns
+
+        Returns:
+            DataFrame indexed by timestamp, columns renamed to standard names
+        """
+        # Load file (Vortex typically whitespace-delimited)
+        df = FileLoader.load_text_file(
+            filepath,
+            skiprows=skiprows,
+            delimiter=None  # Whitespace
+        )
+
+        # Rename columns if needed
+        if column_mapping:
+            # Try to map columns
+            reverse_mapping = {v: k for k, v in column_mapping.items()}
+            df = df.rename(columns=reverse_mapping)
+
+        # Handle timestamp column
+        if 'YYYYMMDD' in df.columns and 'HHMM' in df.columns and 'time' not in df.columns:
+            # Native Vortex layout: separate date and time-of-day columns
+            stamps = df['YYYYMMDD'].astype(np.int64) * 10000 + df['HHMM'].astype(np.int64)
+            df.index = pd.DatetimeIndex(
+                pd.to_datetime(stamps.astype(str), format='%Y%m%d%H%M'), name='time'
+            )
+        elif 'time' in df.columns:
+            # Convert to datetime
+            df['time'] = pd.to_datetime(df['time'])
+            df = df.set_index('time')
+        elif not isinstance(df.index, pd.DatetimeIndex):
+            # Try to parse index as datetime
+            try:
+                df.index = pd.to_datetime(df.index)
+            except Exception:
+                raise ValueError(
+                    "No valid timestamp column found. Vortex data must have "
+                    "datetime index or 'time' column."
+                )
+
+        return df
+
     @staticmethod
     def read_vortex_multiple_heights(
         filepath_pattern: str,
         heights: list[float],
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> Dict[float, WindData]:
         """
         Read Vortex files for multiple heights.
 
+        Files are read concurrently in a thread pool (the CSV parser
+        releases the GIL while tokenizing).
+
         Args:
             filepath_pattern: Path pattern with {height} placeholder
                             Example: "vortex.serie.{height}m.txt"
             heights: List of heights to read
+            max_workers: Reader threads (default: one per height, 1 reads
+                        sequentially)
             **kwargs: Additional arguments passed to read_vortex_timeseries
 
         Returns:
-            Dictionary mapping heights to WindData objects
+            Dictionary mapping heights to WindData objects, in the order of
+            heights
 
         Example:
             >>> wind_data_dict = VortexWindReader.read_vortex_multiple_heights(
@@ -160,17 +251,23 @@ class VortexWindReader:
             ... )
             >>> ws_100m = wind_data_dict[100].timeseries['ws']
         """
-        wind_data = {}
-
-        for height in heights:
-            filepath = filepath_pattern.format(height=int(height))
-            wind_data[height] = VortexWindReader.read_vortex_timeseries(
-                filepath,
+        def read(height):
+            return VortexWindReader.read_vortex_timeseries(
+                filepath_pattern.format(height=int(height)),
                 height=height,
                 **kwargs
             )
 
-        return wind_data
+        if max_workers is None:
+            max_workers = max(len(heights), 1)
+
+        if max_workers == 1:
+            results = [read(height) for height in heights]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(read, heights))
+
+        return dict(zip(heights, results, strict=True))
 
 
 class GenericWindReader:
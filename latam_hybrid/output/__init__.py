@@ -20,7 +20,8 @@ from .export import (
     export_to_excel,
     export_summary_table,
     export_all,
-    export_per_turbine_losses_table
+    export_per_turbine_losses_table,
+    per_turbine_losses_dataframe
 )
 
 # Report generation
@@ -46,6 +47,7 @@ __all__ = [
     'export_summary_table',
     'export_all',
     'export_per_turbine_losses_table',
+    'per_turbine_losses_dataframe',
 
     # Reports
     'generate_text_report',
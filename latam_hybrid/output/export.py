@@ -5,6 +5,8 @@ Support for CSV, JSON, Excel, and other formats.
 """
 
 from typing import Union, Optional, Dict, Any
+from dataclasses import fields
+from enum import Enum
 from pathlib import Path
 import json
 import pandas as pd
@@ -15,14 +17,24 @@ from ..economics import FinancialMetrics
 from ..core.data_models import WindSimulationResult
 
 
+# Hourly (turbine × time) data left out of JSON exports of wind results
+_SKIPPED_WIND_FIELDS = ('arrays', 'hourly_energy')
+_SKIPPED_WIND_METADATA = ('pywake_sim_result', 'hourly_power_w')
+
+
 def export_to_json(
-    result: Union[HybridProjectResult, HybridProductionResult, FinancialMetrics],
+    result: Union[HybridProjectResult, HybridProductionResult, FinancialMetrics, WindSimulationResult],
     filepath: Union[str, Path],
     indent: int = 2
 ) -> None:
     """
     Export result to JSON file.
 
+    For a WindSimulationResult the hourly data (result.arrays,
+    hourly_energy, and the PyWake result and hourly power in metadata) is
+    skipped on purpose; save result.arrays with np.save and hourly_energy
+    with to_csv instead. Per-turbine arrays are written as lists.
+
     Args:
         result: Result object to export
         filepath: Output file path
@@ -35,7 +47,16 @@ def export_to_json(
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
     # Get summary dict
-    if hasattr(result, 'get_summary'):
+    if isinstance(result, WindSimulationResult):
+        data = {
+            f.name: getattr(result, f.name)
+            for f in fields(result) if f.name not in _SKIPPED_WIND_FIELDS
+        }
+        data['metadata'] = {
+            key: value for key, value in result.metadata.items()
+            if key not in _SKIPPED_WIND_METADATA
+        }
+    elif hasattr(result, 'get_summary'):
         data = result.get_summary()
     else:
         # For FinancialMetrics, create dict manually
@@ -66,6 +87,10 @@ def _make_json_serializable(obj: Any) -> Any:
         return [_make_json_serializable(item) for item in obj]
     elif isinstance(obj, (int, float, str, bool, type(None))):
         return obj
+    elif isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    elif isinstance(obj, Enum):
+        return obj.value
     elif hasattr(obj, '__dict__'):
         return _make_json_serializable(obj.__dict__)
     else:
@@ -313,57 +338,30 @@ def export_all(
     return exported_files
 
 
-def export_per_turbine_losses_table(
-    result: WindSimulationResult,
-    filepath: Union[str, Path],
-    format: str = 'csv'
-) -> None:
+def per_turbine_losses_dataframe(result: WindSimulationResult) -> pd.DataFrame:
     """
-    Export per-turbine loss breakdown to table format.
-
-    Creates a comprehensive table showing ideal production, losses by category,
-    and net production for each turbine. Loss values are shown in both absolute
-    (GWh/yr) and percentage terms.
+    Build the per-turbine loss breakdown table.
 
     Args:
         result: WindSimulationResult object with per-turbine loss data in metadata
-        filepath: Output file path (.csv, .xlsx, or .md)
-        format: Output format ('csv', 'excel', or 'markdown')
 
-    Example:
-        >>> export_per_turbine_losses_table(
-        ...     result,
-        ...     "output/turbine_losses.csv",
-        ...     format='csv'
-        ... )
-
-    Table columns:
-        - Turbine_ID: Turbine number (1-N)
-        - Ideal_Production_GWh: Production before any losses
-        - Wake_Loss_GWh: Absolute wake losses
-        - Wake_Loss_Percent: Wake losses as % of ideal
-        - Sector_Loss_GWh: Absolute sector management losses
-        - Sector_Loss_Percent: Sector losses as % of ideal
-        - Other_Loss_GWh: Absolute other losses (availability, electrical, etc.)
-        - Other_Loss_Percent: Other losses as % of ideal
-        - Net_Production_GWh: Final production after all losses
-        - Capacity_Factor_Percent: Per-turbine capacity factor (%)
-        - Full_Load_Hours: Equivalent full load hours per turbine
+    Returns:
+        DataFrame with one row per turbine plus a 'TOTAL' row; columns as
+        described in export_per_turbine_losses_table()
 
-    Notes:
-        - All loss values are in absolute GWh/yr (not cumulative percentages)
-        - Percentages are calculated relative to ideal production
-        - Requires per-turbine loss data in result.metadata (added by run_simulation)
+    Example:
+        >>> df = per_turbine_losses_dataframe(result)
+        >>> print(df[['Turbine_ID', 'Wake_Loss_Percent']])
     """
-    filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
     # Extract per-turbine data from metadata
     ideal_per_turbine = np.array(result.metadata.get('ideal_per_turbine_gwh', []))
     wake_loss_per_turbine = np.array(result.metadata.get('wake_loss_per_turbine_gwh', []))
     sector_loss_per_turbine = np.array(result.metadata.get('sector_loss_per_turbine_gwh', []))
-    other_loss_per_turbine = np.array(result.metadata.get('other_loss_per_turbine_gwh', []))
     net_production = np.array(result.turbine_production_gwh)
+    # Other losses are only present once apply_losses() has run
+    other_loss_per_turbine = np.array(
+        result.metadata.get('other_loss_per_turbine_gwh', np.zeros(len(net_production)))
+    )
 
     # Check if data exists
     if len(ideal_per_turbine) == 0:
@@ -427,6 +425,56 @@ def export_per_turbine_losses_table(
     }
     df = pd.concat([df, pd.DataFrame([summary_row])], ignore_index=True)
 
+    return df
+
+
+def export_per_turbine_losses_table(
+    result: WindSimulationResult,
+    filepath: Union[str, Path],
+    format: str = 'csv'
+) -> None:
+    """
+    Export per-turbine loss breakdown to table format.
+
+    Creates a comprehensive table showing ideal production, losses by category,
+    and net production for each turbine. Loss values are shown in both absolute
+    (GWh/yr) and percentage terms.
+
+    Args:
+        result: WindSimulationResult object with per-turbine loss data in metadata
+        filepath: Output file path (.csv, .xlsx, or .md)
+        format: Output format ('csv', 'excel', or 'markdown')
+
+    Example:
+        >>> export_per_turbine_losses_table(
+        ...     result,
+        ...     "output/turbine_losses.csv",
+        ...     format='csv'
+        ... )
+
+    Table columns:
+        - Turbine_ID: Turbine number (1-N)
+        - Ideal_Production_GWh: Production before any losses
+        - Wake_Loss_GWh: Absolute wake losses
+        - Wake_Loss_Percent: Wake losses as % of ideal
+        - Sector_Loss_GWh: Absolute sector management losses
+        - Sector_Loss_Percent: Sector losses as % of ideal
+        - Other_Loss_GWh: Absolute other losses (availability, electrical, etc.)
+        - Other_Loss_Percent: Other losses as % of ideal
+        - Net_Production_GWh: Final production after all losses
+        - Capacity_Factor_Percent: Per-turbine capacity factor (%)
+        - Full_Load_Hours: Equivalent full load hours per turbine
+
+    Notes:
+        - All loss values are in absolute GWh/yr (not cumulative percentages)
+        - Percentages are calculated relative to ideal production
+        - Requires per-turbine loss data in result.metadata (added by run_simulation)
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    df = per_turbine_losses_dataframe(result)
+
     # Export based on format
     if format == 'csv':
         df.to_csv(filepath, index=False)
@@ -6,13 +6,43 @@ and comprehensive losses modeling following WindPRO methodology.
 """
 
 from .turbine import TurbineModel, load_turbine
+from .curve_lookup import CurveLookup
 from .layout import TurbineLayout, load_layout
 from .site import WindSite, create_wind_site
-from .losses import WindFarmLosses, LossCategory, LossType, create_default_losses
+from .losses import (
+    WindFarmLosses,
+    LossCategory,
+    LossType,
+    HysteresisResult,
+    create_default_losses,
+    simulate_high_wind_hysteresis,
+)
+from .loss_engine import (
+    OperationalLossEngine,
+    OperationalLossResult,
+    LossTransform,
+    UniformLoss,
+    OutageLoss,
+    ElectricalLossCurve,
+    DegradationRamp,
+    StoppedMaskLoss,
+)
+from .availability import OutageModel, AvailabilityResult, simulate_availability
+from .simulation_cache import SimulationCache, SimulationArrays, get_simulation_cache
+from .timeseries_binning import BinnedWindTimeseries, bin_wind_timeseries
+from .power_table import WakePowerTable
+from .production_breakdown import energy_breakdown, exceedance_levels
+from .sector_optimization import SectorScenarioEngine, StopRequirement
+from .shear import ShearProfile, load_shear_profile
+from .stability import StabilityModel, stability_classes, stability_at_height, stability_table
+from .weibull import fit_weibull, weibull_table
+from .turbine_comparison import TurbineComparisonResult, compare_turbine_configurations
+from .power_curve_engine import power_curve_matrix, screen_turbine_models
 
 __all__ = [
     'TurbineModel',
     'load_turbine',
+    'CurveLookup',
     'TurbineLayout',
     'load_layout',
     'WindSite',
@@ -21,4 +51,39 @@ __all__ = [
     'LossCategory',
     'LossType',
     'create_default_losses',
+    'HysteresisResult',
+    'simulate_high_wind_hysteresis',
+    'OperationalLossEngine',
+    'OperationalLossResult',
+    'LossTransform',
+    'UniformLoss',
+    'OutageLoss',
+    'ElectricalLossCurve',
+    'DegradationRamp',
+    'StoppedMaskLoss',
+    'OutageModel',
+    'AvailabilityResult',
+    'simulate_availability',
+    'SimulationCache',
+    'SimulationArrays',
+    'get_simulation_cache',
+    'BinnedWindTimeseries',
+    'bin_wind_timeseries',
+    'WakePowerTable',
+    'energy_breakdown',
+    'exceedance_levels',
+    'SectorScenarioEngine',
+    'StopRequirement',
+    'ShearProfile',
+    'load_shear_profile',
+    'StabilityModel',
+    'stability_classes',
+    'stability_at_height',
+    'stability_table',
+    'fit_weibull',
+    'weibull_table',
+    'TurbineComparisonResult',
+    'compare_turbine_configurations',
+    'power_curve_matrix',
+    'screen_turbine_models',
 ]
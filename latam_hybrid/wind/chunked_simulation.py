@@ -0,0 +1,242 @@
+"""
+Chunked, parallel PyWake time-series simulation.
+
+A full PyWake time-series run materializes every (turbine × time) variable at
+once, so memory grows with the length of the wind record. Here the time axis
+is split into chunks that are simulated independently (optionally in a
+process pool) and reduced into a compact accumulator holding per-turbine
+energy, sector-loss energy and, optionally, hourly power.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Tuple, Iterator
+
+import numpy as np
+
+from .sector_management import SectorEngine
+from .simulation_cache import SimulationArrays
+
+
+# Hours per chunk when none is given (one year of hourly data)
+DEFAULT_CHUNK_HOURS = 8760
+
+
+class TimeseriesAccumulator:
+    """
+    Running reduction of chunked time-series simulation results.
+
+    Only per-turbine totals are kept unless hourly power is requested, so
+    memory does not depend on the number of simulated hours.
+
+    Example:
+        >>> acc = TimeseriesAccumulator(n_turbines=13, n_hours=87600)
+        >>> acc.add(0, power_chunk, wd_chunk)
+        >>> arrays = acc.to_arrays()
+    """
+
+    def __init__(
+        self,
+        n_turbines: int,
+        n_hours: int,
+        turbine_sectors: Optional[Dict[int, List[Tuple[float, float]]]] = None,
+        keep_hourly_power: bool = False
+    ):
+        """
+        Initialize accumulator.
+
+        Args:
+            n_turbines: Number of turbines
+            n_hours: Total number of hours that will be added
+            turbine_sectors: Allowed sectors per turbine ID for sector-loss
+                           energy (None for no sector management)
+            keep_hourly_power: Also keep the full (turbine × time) power array
+        """
+        self.n_turbines = n_turbines
+        self.n_hours = n_hours
+        self.sector_engine = SectorEngine(turbine_sectors) if turbine_sectors else None
+        self.energy_wh = np.zeros(n_turbines)
+        self.sector_loss_wh = np.zeros(n_turbines)
+        self.hourly_power_w = np.zeros((n_turbines, n_hours)) if keep_hourly_power else None
+        self.hours_added = 0
+
+    def add(self, start: int, power_w: np.ndarray, wd: np.ndarray) -> None:
+        """
+        Add one simulated chunk.
+
+        Args:
+            start: Index of the first hour of the chunk
+            power_w: Power per turbine and hour in W, shape (n_turbines, n_chunk)
+            wd: Wind directions of the chunk (degrees), shape (n_chunk,)
+        """
+        # Hourly power (W) × 1 h = Wh
+        self.energy_wh += power_w.sum(axis=1)
+
+        if self.sector_engine is not None:
+            self.sector_loss_wh += self.sector_engine.prohibited_energy(power_w, wd)
+
+        if self.hourly_power_w is not None:
+            self.hourly_power_w[:, start:start + power_w.shape[1]] = power_w
+
+        self.hours_added += power_w.shape[1]
+
+    def to_arrays(self) -> SimulationArrays:
+        """
+        Convert the accumulated totals to SimulationArrays.
+
+        With hourly power kept, the result is identical to an unchunked
+        time-series run. Otherwise it holds annual energy per turbine and the
+        precomputed sector-loss energy.
+
+        Returns:
+            SimulationArrays (GWh/year)
+        """
+        if self.hours_added != self.n_hours:
+            raise ValueError(
+                f"Accumulated {self.hours_added} hours, expected {self.n_hours}"
+            )
+
+        # Wh over the record → GWh/year
+        annualization = 1e-9 * 8760 / self.n_hours
+
+        if self.hourly_power_w is not None:
+            return SimulationArrays(
+                aep_gwh=self.hourly_power_w * annualization,
+                power_w=self.hourly_power_w,
+                dims=('wt', 'time')
+            )
+
+        return SimulationArrays(
+            aep_gwh=self.energy_wh * annualization,
+            power_w=None,
+            dims=('wt',),
+            sector_loss_gwh=self.sector_loss_wh * annualization
+        )
+
+
+def iter_chunks(n_hours: int, chunk_hours: int) -> Iterator[Tuple[int, int]]:
+    """
+    Split the time axis into consecutive (start, stop) index ranges.
+
+    Args:
+        n_hours: Total number of hours
+        chunk_hours: Hours per chunk
+
+    Yields:
+        (start, stop) tuples covering range(n_hours)
+    """
+    if chunk_hours <= 0:
+        raise ValueError(f"chunk_hours must be positive, got {chunk_hours}")
+
+    for start in range(0, n_hours, chunk_hours):
+        yield start, min(start + chunk_hours, n_hours)
+
+
+def _simulate_chunk(task) -> np.ndarray:
+    """
+    Process-pool worker: simulate one chunk and return its power array.
+
+    Args:
+        task: Tuple of (wind_data, turbine, layout, wake_model, operating, ti)
+              where wind_data holds only the chunk's hours, operating is
+              the chunk's operating mask (None to run all turbines) and ti
+              the chunk's turbulence intensity (None for the IEC NTM)
+
+    Returns:
+        Power per turbine and hour in W, shape (n_turbines, n_chunk)
+    """
+    from .site import WindSite
+
+    wind_data, turbine, layout, wake_model, operating, ti = task
+    site = WindSite(wind_data, turbine=turbine, layout=layout)
+    sim_result = site._execute_pywake_simulation(
+        wake_model, 12, 'timeseries', operating=operating, ti=ti
+    )
+
+    return np.asarray(sim_result.Power.transpose('wt', 'time').values, dtype=float)
+
+
+def run_chunked_timeseries(
+    site,
+    wake_model,
+    chunk_hours: Optional[int] = None,
+    n_workers: int = 1,
+    keep_hourly_power: bool = False,
+    sector_aware: bool = False
+) -> SimulationArrays:
+    """
+    Run a PyWake time-series simulation in chunks and reduce the results.
+
+    At most ``2 × n_workers`` chunks are in flight at once, so peak memory
+    is bounded by the chunk size rather than the record length. The default
+    chunk size is fixed (DEFAULT_CHUNK_HOURS) for the same reason. With
+    keep_hourly_power the (turbine × time) power array is kept, so memory
+    grows with the record length again.
+
+    Args:
+        site: Configured WindSite (wind data, turbine and layout)
+        wake_model: Wake model (None for no-wake baseline)
+        chunk_hours: Hours per chunk (default: DEFAULT_CHUNK_HOURS)
+        n_workers: Number of worker processes (1 runs in-process)
+        keep_hourly_power: Keep the full hourly power array in the result
+        sector_aware: Pass each chunk's sector-management operating mask
+                     to PyWake so stopped turbines cast no wake
+
+    Returns:
+        SimulationArrays from TimeseriesAccumulator.to_arrays()
+
+    Example:
+        >>> arrays = run_chunked_timeseries(site, WakeModel.NOJ,
+        ...                                 chunk_hours=8760, n_workers=4)
+    """
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+
+    timeseries = site.simulation_wind_data.timeseries
+    n_hours = len(timeseries)
+    if chunk_hours is None:
+        chunk_hours = DEFAULT_CHUNK_HOURS
+
+    turbine_sectors = (
+        site.sector_management.turbine_sectors if site.sector_management else None
+    )
+    accumulator = TimeseriesAccumulator(
+        site.layout.n_turbines,
+        n_hours,
+        turbine_sectors=turbine_sectors,
+        keep_hourly_power=keep_hourly_power
+    )
+    wd = timeseries['wd'].values
+    ti = site._turbulence_intensity(timeseries['ws'].values)
+
+    def make_task(start: int, stop: int):
+        wind_data = site.wind_data.__class__(
+            timeseries=timeseries.iloc[start:stop][['ws', 'wd']],
+            height=site.wind_data.height
+        )
+        operating = site._operating_mask(wd[start:stop]) if sector_aware else None
+        chunk_ti = ti[start:stop] if ti is not None else None
+        return wind_data, site.turbine, site.layout, wake_model, operating, chunk_ti
+
+    chunks = list(iter_chunks(n_hours, chunk_hours))
+
+    if n_workers == 1:
+        for start, stop in chunks:
+            accumulator.add(start, _simulate_chunk(make_task(start, stop)), wd[start:stop])
+        return accumulator.to_arrays()
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = deque()
+        for start, stop in chunks:
+            pending.append((start, stop, executor.submit(_simulate_chunk, make_task(start, stop))))
+
+            # Bound the number of chunks in flight
+            if len(pending) >= 2 * n_workers:
+                first, last, future = pending.popleft()
+                accumulator.add(first, future.result(), wd[first:last])
+
+        while pending:
+            first, last, future = pending.popleft()
+            accumulator.add(first, future.result(), wd[first:last])
+
+    return accumulator.to_arrays()
@@ -3,12 +3,19 @@ Wind farm losses model following WindPRO methodology.
 
 Implements multiplicative loss calculation: Loss = (1-l1)*(1-l2)...(1-ln)
 where l_n are individual loss categories as fractions (e.g., 0.03 for 3%).
+
+The high-wind hysteresis loss can also be computed from the wind speed
+sequence instead of taken from losses.csv, see
+simulate_high_wind_hysteresis.
 """
 
 from dataclasses import dataclass, field
 from typing import Dict, Optional, List
 from enum import Enum
 
+import numpy as np
+import pandas as pd
+
 
 class LossType(str, Enum):
     """Loss category types."""
@@ -260,6 +267,26 @@ class WindFarmLosses:
             for name, loss in self._losses.items()
         }
 
+    def add_category(self, category: LossCategory) -> 'WindFarmLosses':
+        """
+        Add or replace a loss category object (e.g. a computed one).
+
+        Args:
+            category: LossCategory to store under its name
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> losses.add_category(hysteresis_result.to_loss_category())
+        """
+        self._losses[category.name] = category
+        return self
+
+    def get_categories(self) -> Dict[str, LossCategory]:
+        """Get all loss categories in the order they were added."""
+        return dict(self._losses)
+
     def get_computed_losses(self) -> Dict[str, LossCategory]:
         """Get only computed losses (wake, curtailment)."""
         return {
@@ -351,3 +378,157 @@ def create_default_losses(
     losses.add_default_losses(**kwargs)
 
     return losses
+
+
+# Typical gap between cut-out and restart wind speed (m/s)
+DEFAULT_RESTART_MARGIN = 3.0
+
+
+@dataclass
+class HysteresisResult:
+    """
+    High-wind hysteresis from the cut-out/restart state machine.
+
+    Attributes:
+        stopped: Stopped state per turbine and sample (n_turbines, n_samples)
+        episodes: One row per stop episode: turbine, start and stop sample,
+                  samples and lost energy (MWh)
+        loss_per_turbine_gwh: Annualized lost energy per turbine (GWh/year)
+        production_per_turbine_gwh: Annualized energy before hysteresis
+        cut_out_ws: Cut-out wind speed (m/s)
+        restart_ws: Restart wind speed (m/s)
+    """
+    stopped: np.ndarray
+    episodes: pd.DataFrame
+    loss_per_turbine_gwh: np.ndarray
+    production_per_turbine_gwh: np.ndarray
+    cut_out_ws: float
+    restart_ws: float
+
+    @property
+    def loss_fraction(self) -> float:
+        """Farm hysteresis loss as fraction of the energy before it."""
+        production = self.production_per_turbine_gwh.sum()
+        return float(self.loss_per_turbine_gwh.sum() / production) if production > 0 else 0.0
+
+    def to_loss_category(self) -> LossCategory:
+        """Computed high_hysteresis_losses category for WindFarmLosses."""
+        return LossCategory(
+            name=LossType.HIGH_HYSTERESIS.value,
+            value=self.loss_fraction,
+            is_computed=True,
+            description=(
+                f"Cut-out at {self.cut_out_ws:g} m/s, restart below {self.restart_ws:g} m/s "
+                f"({len(self.episodes)} stop episodes)"
+            )
+        )
+
+
+def simulate_high_wind_hysteresis(
+    wind_speed: np.ndarray,
+    power_w: np.ndarray,
+    cut_out_ws: float,
+    restart_ws: Optional[float] = None,
+    hours_per_sample: float = 1.0
+) -> HysteresisResult:
+    """
+    Energy lost while turbines wait to restart after a high-wind cut-out.
+
+    A turbine stops when the wind speed reaches cut_out_ws and restarts
+    only once it falls below restart_ws. With the band ws >= restart_ws
+    split into runs (run-length encoding over all turbines at once), a
+    turbine is stopped from the first cut-out sample of a run to the end of
+    that run, so the state machine is a handful of array operations rather
+    than a loop over samples. Missing wind speeds end a run.
+
+    The loss is the energy power_w assigns to stopped samples; samples at
+    or above cut-out count only if power_w is non-zero there.
+
+    Args:
+        wind_speed: Effective wind speed per turbine and sample
+                   (n_turbines, n_samples), or one series for all turbines
+        power_w: Power per turbine and sample in W (n_turbines, n_samples)
+        cut_out_ws: Cut-out wind speed (m/s)
+        restart_ws: Restart wind speed (default: cut_out_ws - 3 m/s)
+        hours_per_sample: Sample length in hours (1/6 for 10-minute data)
+
+    Returns:
+        HysteresisResult
+
+    Example:
+        >>> result = simulate_high_wind_hysteresis(ws_eff, power_w, cut_out_ws=25.0, restart_ws=22.0)
+        >>> losses.add_category(result.to_loss_category())
+        >>> print(f"{result.loss_fraction:.2%}")
+    """
+    if restart_ws is None:
+        restart_ws = cut_out_ws - DEFAULT_RESTART_MARGIN
+    if not restart_ws < cut_out_ws:
+        raise ValueError(f"restart_ws ({restart_ws}) must be below cut_out_ws ({cut_out_ws})")
+    if hours_per_sample <= 0:
+        raise ValueError(f"hours_per_sample must be positive, got {hours_per_sample}")
+
+    power_w = np.asarray(power_w, dtype=float)
+    if power_w.ndim != 2:
+        raise ValueError(f"power_w must be (n_turbines, n_samples), got shape {power_w.shape}")
+    n_turbines, n_samples = power_w.shape
+    ws = np.broadcast_to(np.asarray(wind_speed, dtype=float), power_w.shape)
+
+    # One padding column per turbine ends every run at the row boundary
+    width = n_samples + 1
+    band = np.zeros((n_turbines, width), dtype=bool)
+    trip = np.zeros((n_turbines, width), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        np.greater_equal(ws, restart_ws, out=band[:, :n_samples])
+        np.greater_equal(ws, cut_out_ws, out=trip[:, :n_samples])
+    band, trip = band.ravel(), trip.ravel()
+
+    # Run-length encoding of the high-wind band
+    edges = np.diff(band.view(np.int8), prepend=np.int8(0))
+    run_start = np.flatnonzero(edges == 1)
+    run_end = np.flatnonzero(edges == -1)
+
+    # First cut-out sample of each run (trip implies band)
+    stop_start = np.empty(0, dtype=np.intp)
+    stop_end = np.empty(0, dtype=np.intp)
+    if len(run_start):
+        trip_position = np.where(trip, np.arange(len(trip)), len(trip))
+        first_trip = np.minimum.reduceat(trip_position, run_start)
+        tripped = first_trip < run_end
+        stop_start, stop_end = first_trip[tripped], run_end[tripped]
+
+    delta = np.zeros(len(band) + 1, dtype=np.int8)
+    delta[stop_start] = 1
+    delta[stop_end] -= 1
+    stopped = np.cumsum(delta[:-1], dtype=np.int8).astype(bool).reshape(n_turbines, width)[:, :n_samples]
+
+    # Energy per episode (Wh) from interleaved reduceat bounds
+    padded_power = np.zeros((n_turbines, width))
+    padded_power[:, :n_samples] = np.nan_to_num(power_w)
+    flat_power = padded_power.ravel()
+    if len(stop_start):
+        bounds = np.column_stack([stop_start, stop_end]).ravel()
+        episode_wh = np.add.reduceat(flat_power, bounds)[::2] * hours_per_sample
+    else:
+        episode_wh = np.empty(0)
+
+    turbine = stop_start // width
+    episodes = pd.DataFrame({
+        'turbine': turbine,
+        'start': stop_start % width,
+        'stop': stop_end - turbine * width,
+        'samples': stop_end - stop_start,
+        'lost_energy_mwh': episode_wh / 1e6
+    })
+
+    annualize = 8760 / (n_samples * hours_per_sample) * 1e-9 if n_samples else 0.0
+    loss = np.bincount(turbine, weights=episode_wh, minlength=n_turbines) * annualize
+    production = padded_power.sum(axis=1) * hours_per_sample * annualize
+
+    return HysteresisResult(
+        stopped=stopped,
+        episodes=episodes,
+        loss_per_turbine_gwh=loss,
+        production_per_turbine_gwh=production,
+        cut_out_ws=float(cut_out_ws),
+        restart_ws=float(restart_ws)
+    )
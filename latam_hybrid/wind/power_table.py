@@ -0,0 +1,221 @@
+"""
+Wake-aware per-turbine power lookup table.
+
+For a fixed layout, turbine and wake model, the effective power of every
+turbine depends only on the free-stream (ws, wd) of the flow case (the
+time-series site derives TI from ws). Simulating a regular (ws, wd) grid once
+gives a table P_i(ws, wd) from which any wind timeseries — a new Vortex
+delivery, a single year or a shear-shifted record — is evaluated by bilinear
+lookup in milliseconds instead of a full PyWake run. The wind speed grid has
+extra nodes at the power curve's cut-in and cut-out so that the power ramps
+there are not smeared over a whole grid cell.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union, Dict
+
+import numpy as np
+
+from ..core import SectorManagementConfig
+
+
+def cut_in_out_nodes(curve_ws: np.ndarray, curve_power: np.ndarray) -> np.ndarray:
+    """
+    Wind speed grid nodes at the cut-in and cut-out of a power curve.
+
+    Args:
+        curve_ws: Power curve wind speeds (m/s), increasing
+        curve_power: Power at each wind speed
+
+    Returns:
+        First and last wind speed with power, plus the zero-power curve
+        points next to them, so both ramps are reproduced exactly
+    """
+    curve_ws = np.asarray(curve_ws, dtype=float)
+    producing = np.flatnonzero(np.asarray(curve_power, dtype=float) > 0)
+    if len(producing) == 0:
+        return np.empty(0)
+
+    first, last = producing[0], producing[-1]
+    return np.unique(curve_ws[[max(first - 1, 0), first, last, min(last + 1, len(curve_ws) - 1)]])
+
+
+@dataclass
+class WakePowerTable:
+    """
+    Effective power per turbine on a regular (wd, ws) grid.
+
+    Attributes:
+        ws: Wind speed grid (m/s), increasing, shape (n_ws,); uniformly
+            spaced from 0 plus the cut-in/cut-out nodes (see cut_in_out_nodes)
+        wd: Wind direction grid (degrees), uniformly spaced over [0, 360),
+            shape (n_wd,)
+        power_w: Power per turbine in W, shape (n_turbines, n_wd, n_ws)
+        metadata: Build information (turbine, wake model, content key)
+
+    Example:
+        >>> table = site.build_power_table(wake_model='NOJ', table_dir='results/tables')
+        >>> power = table.power(ws, wd)           # (n_turbines, n_hours) in W
+        >>> aep = table.aep_per_turbine(ws, wd)   # GWh/year per turbine
+    """
+    ws: np.ndarray
+    wd: np.ndarray
+    power_w: np.ndarray
+    metadata: Dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Validate grid shapes and spacing."""
+        if self.power_w.shape[1:] != (len(self.wd), len(self.ws)):
+            raise ValueError(
+                f"power_w must have shape (n_turbines, {len(self.wd)}, {len(self.ws)}), "
+                f"got {self.power_w.shape}"
+            )
+        if len(self.ws) < 2 or np.any(np.diff(self.ws) <= 0):
+            raise ValueError("ws grid must be strictly increasing with at least two points")
+        if not np.isclose(len(self.wd) * self.wd_step, 360.0) or self.wd[0] != 0:
+            raise ValueError("wd grid must start at 0° and divide 360° uniformly")
+
+    @property
+    def n_turbines(self) -> int:
+        """Number of turbines."""
+        return self.power_w.shape[0]
+
+    @property
+    def ws_step(self) -> float:
+        """Largest wind speed grid spacing (m/s)."""
+        return float(np.diff(self.ws).max())
+
+    @property
+    def wd_step(self) -> float:
+        """Wind direction grid spacing (degrees)."""
+        return 360.0 / len(self.wd)
+
+    def power(self, ws: np.ndarray, wd: np.ndarray) -> np.ndarray:
+        """
+        Hourly power per turbine by bilinear lookup.
+
+        Wind speeds outside the grid are clamped to its ends (the grid of
+        WindSite.build_power_table reaches past the cut-out); directions
+        wrap at 360°. Timesteps with missing (NaN) wind produce no power.
+
+        Args:
+            ws: Free-stream wind speed per timestep (m/s)
+            wd: Wind direction per timestep (degrees)
+
+        Returns:
+            Power in W, shape (n_turbines, n_timesteps)
+        """
+        ws = np.asarray(ws, dtype=float)
+        wd = np.asarray(wd, dtype=float)
+        valid = np.isfinite(ws) & np.isfinite(wd)
+        if not valid.all():
+            ws = np.where(valid, ws, 0.0)
+            wd = np.where(valid, wd, 0.0)
+
+        n_ws = len(self.ws)
+        n_wd = len(self.wd)
+
+        # Fractional grid positions: ws clamped (non-uniform grid), wd periodic
+        i0 = np.clip(np.searchsorted(self.ws, ws, side='right') - 1, 0, n_ws - 2)
+        a = np.clip((ws - self.ws[i0]) / (self.ws[i0 + 1] - self.ws[i0]), 0.0, 1.0)
+
+        fj = np.mod(wd, 360.0) / self.wd_step
+        j0 = np.floor(fj).astype(np.int64)
+        b = fj - j0
+        j0 %= n_wd
+        j1 = (j0 + 1) % n_wd
+
+        # Gather the four corners from the flattened (wd, ws) plane
+        flat = self.power_w.reshape(self.n_turbines, -1)
+        p00 = np.take(flat, j0 * n_ws + i0, axis=1)
+        p01 = np.take(flat, j0 * n_ws + i0 + 1, axis=1)
+        p10 = np.take(flat, j1 * n_ws + i0, axis=1)
+        p11 = np.take(flat, j1 * n_ws + i0 + 1, axis=1)
+
+        power = (1 - b) * ((1 - a) * p00 + a * p01) + b * ((1 - a) * p10 + a * p11)
+        power[:, ~valid] = 0.0
+        return power
+
+    def aep_per_turbine(
+        self,
+        ws: np.ndarray,
+        wd: np.ndarray,
+        sector_management: Optional[SectorManagementConfig] = None
+    ) -> np.ndarray:
+        """
+        Annual energy per turbine for a wind timeseries.
+
+        Uses the same annualization as a time-series run (8760 h / n_hours).
+        With sector management, production in prohibited sectors is removed
+        (stopped turbines are assumed to still cast wakes, as in
+        WindSite.run_simulation).
+
+        Args:
+            ws: Free-stream wind speed per hour (m/s)
+            wd: Wind direction per hour (degrees)
+            sector_management: Optional sector curtailment
+
+        Returns:
+            AEP per turbine in GWh/year, shape (n_turbines,)
+        """
+        power = self.power(ws, wd)
+        energy_wh = power.sum(axis=1)
+
+        if sector_management is not None:
+            from .sector_management import SectorEngine
+
+            engine = SectorEngine.from_config(sector_management)
+            energy_wh = energy_wh - engine.prohibited_energy(power, wd)
+
+        n_hours = power.shape[1]
+        return energy_wh * (8760 / n_hours) * 1e-9 if n_hours else energy_wh
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Persist the table as a compressed .npz file.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                ws=self.ws,
+                wd=self.wd,
+                power_w=self.power_w,
+                metadata=np.array(json.dumps(self.metadata))
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'WakePowerTable':
+        """
+        Load a table written by save().
+
+        Args:
+            path: .npz file path
+
+        Returns:
+            WakePowerTable instance
+        """
+        with np.load(path) as data:
+            return cls(
+                ws=data['ws'],
+                wd=data['wd'],
+                power_w=data['power_w'],
+                metadata=json.loads(str(data['metadata']))
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"WakePowerTable(n_turbines={self.n_turbines}, "
+            f"ws={self.ws[0]:g}-{self.ws[-1]:g} m/s step {self.ws_step:g}, "
+            f"wd step {self.wd_step:g}°, wake_model={self.metadata.get('wake_model')})"
+        )
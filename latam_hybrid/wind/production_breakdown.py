@@ -0,0 +1,126 @@
+"""
+Temporal breakdown of wind farm energy and losses.
+
+A time-series simulation already contains every hour of the wind record, so
+per-year, per-month and per-hour-of-day energy and losses are grouped sums
+over the hourly farm energy rather than separate PyWake runs. Yearly totals
+then feed the inter-annual P50/P90 estimate.
+"""
+
+from statistics import NormalDist
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# Hourly energy columns (MWh) kept on WindSimulationResult.hourly_energy
+ENERGY_COLUMNS = ('ideal_mwh', 'wake_loss_mwh', 'sector_loss_mwh', 'other_loss_mwh', 'net_mwh')
+
+# Grouping periods: calendar periods are totals, profiles are annualized
+BREAKDOWN_PERIODS = ('year', 'month', 'month_of_year', 'hour')
+
+
+def energy_breakdown(hourly_energy: pd.DataFrame, by: str = 'year') -> pd.DataFrame:
+    """
+    Group hourly farm energy and losses by a time period.
+
+    'year' and 'month' give the energy of each calendar period (GWh) and,
+    for comparison of partial periods, the annualized net energy.
+    'month_of_year' and 'hour' (of day) give the long-term profile: each
+    group's contribution to the AEP, so the groups sum to the AEP.
+
+    Args:
+        hourly_energy: Hourly farm energy with DatetimeIndex and the
+                      ENERGY_COLUMNS (MWh), see WindSimulationResult.hourly_energy
+        by: 'year', 'month', 'month_of_year' or 'hour'
+
+    Returns:
+        DataFrame indexed by period with ideal/loss/net energy (GWh), hours,
+        loss percentages of ideal and, for calendar periods, the annualized
+        net energy (GWh/year)
+
+    Example:
+        >>> yearly = energy_breakdown(result.hourly_energy, by='year')
+        >>> print(yearly[['net_gwh', 'wake_loss_percent']])
+    """
+    if by not in BREAKDOWN_PERIODS:
+        raise ValueError(f"Unknown period '{by}'. Available: {list(BREAKDOWN_PERIODS)}")
+
+    index = hourly_energy.index
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("hourly_energy must have a DatetimeIndex")
+
+    keys = {
+        'year': index.year,
+        'month': index.to_period('M'),
+        'month_of_year': index.month,
+        'hour': index.hour
+    }[by]
+
+    grouped = hourly_energy[list(ENERGY_COLUMNS)].groupby(keys)
+    table = grouped.sum() / 1000
+    table.columns = [column.replace('_mwh', '_gwh') for column in table.columns]
+    table.index.name = by
+
+    hours = grouped.size().values
+    if by in ('month_of_year', 'hour'):
+        # Contribution to the long-term AEP
+        table *= 8760 / len(hourly_energy)
+        table['hours'] = hours
+    else:
+        table['hours'] = hours
+        table['annualized_net_gwh'] = table['net_gwh'] * 8760 / hours
+
+    ideal = table['ideal_gwh'].replace(0.0, np.nan)
+    for loss in ('wake', 'sector', 'other'):
+        table[f'{loss}_loss_percent'] = (table[f'{loss}_loss_gwh'] / ideal * 100).fillna(0.0)
+
+    return table
+
+
+def exceedance_levels(
+    annual_values: Sequence[float],
+    levels: Sequence[float] = (50, 90),
+    method: str = 'normal'
+) -> Dict[str, float]:
+    """
+    P-values of annual energy from a sample of yearly values.
+
+    Only the inter-annual variability of the sample is represented; other
+    uncertainties (measurement, model, long-term correction) are not.
+
+    Args:
+        annual_values: Annual energy per year (GWh)
+        levels: Exceedance probabilities in percent (90 → P90)
+        method: 'normal' (mean and sample standard deviation) or
+               'empirical' (sample quantiles)
+
+    Returns:
+        Dict like {'P50': ..., 'P90': ...} in the units of annual_values
+
+    Example:
+        >>> exceedance_levels([101.2, 95.4, 99.8, 104.1], levels=(50, 90, 99))
+    """
+    values = np.asarray(annual_values, dtype=float)
+    if len(values) < 2:
+        raise ValueError(f"At least two annual values are required, got {len(values)}")
+    if method not in ('normal', 'empirical'):
+        raise ValueError(f"Unknown method '{method}'. Available: ['normal', 'empirical']")
+
+    std = values.std(ddof=1)
+    result = {}
+    for level in levels:
+        if not 0 < level < 100:
+            raise ValueError(f"Exceedance level must be between 0 and 100, got {level}")
+
+        if method == 'empirical':
+            value = np.quantile(values, 1 - level / 100)
+        elif std == 0:
+            value = values.mean()
+        else:
+            value = NormalDist(values.mean(), std).inv_cdf(1 - level / 100)
+
+        result[f'P{level:g}'] = float(value)
+
+    return result
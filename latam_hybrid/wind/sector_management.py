@@ -10,6 +10,10 @@ import pandas as pd
 import numpy as np
 
 
+# Resolution of the compiled direction lookup tables (degrees)
+DEFAULT_LUT_RESOLUTION = 0.1
+
+
 def is_direction_in_sectors(
     wd: float,
     sectors: List[Tuple[float, float]]
@@ -43,6 +47,218 @@ def is_direction_in_sectors(
     return False
 
 
+def _directions_in_sectors(
+    wd: np.ndarray,
+    sectors: List[Tuple[float, float]]
+) -> np.ndarray:
+    """
+    Vectorized is_direction_in_sectors for already normalized directions.
+
+    Args:
+        wd: Wind directions normalized with ``wd % 360``
+        sectors: List of allowed sector ranges as (start, end) tuples
+
+    Returns:
+        Boolean array, True where the direction is in an allowed sector
+    """
+    allowed = np.zeros(wd.shape, dtype=bool)
+    for start, end in sectors:
+        allowed |= (start <= wd) & (wd <= end)
+    return allowed
+
+
+class SectorEngine:
+    """
+    Compiled sector configuration for array-based curtailment.
+
+    Each restricted turbine's allowed sectors are compiled into a boolean
+    lookup table over fixed-width direction cells (0.1° by default), so the
+    operating state of every hour is a single table lookup. Cells within one
+    cell of a sector boundary are flagged and evaluated exactly, which keeps
+    results identical to is_direction_in_sectors (inclusive boundaries,
+    ``wd % 360`` normalization, NaN directions treated as prohibited).
+
+    Example:
+        >>> engine = SectorEngine({1: [(60, 120), (240, 300)]})
+        >>> mask = engine.operating_mask(wind_directions, n_turbines=13)
+        >>> losses_wh = engine.prohibited_energy(power_w, wind_directions)
+    """
+
+    def __init__(
+        self,
+        turbine_sectors: Dict[int, List[Tuple[float, float]]],
+        resolution: float = DEFAULT_LUT_RESOLUTION
+    ):
+        """
+        Compile the lookup tables.
+
+        Args:
+            turbine_sectors: Dict mapping turbine_id to allowed sector ranges
+            resolution: Direction cell width of the lookup tables (degrees)
+        """
+        if resolution <= 0:
+            raise ValueError(f"resolution must be positive, got {resolution}")
+
+        self.turbine_sectors = turbine_sectors
+        self.resolution = resolution
+        self.turbine_ids = list(turbine_sectors.keys())
+        self.n_cells = int(np.ceil(360.0 / resolution))
+
+        lower = np.arange(self.n_cells) * resolution
+        centers = lower + resolution / 2
+
+        # lut[cell, j]: allowed state of restricted turbine j in that cell
+        # exact[cell, j]: a boundary lies within one cell, evaluate exactly
+        # Two extra rows: directions that round to 360° (evaluated exactly)
+        # and NaN directions (always prohibited)
+        self.lut = np.zeros((self.n_cells + 2, len(self.turbine_ids)), dtype=bool)
+        self.exact = np.zeros((self.n_cells + 2, len(self.turbine_ids)), dtype=bool)
+        self.exact[self.n_cells] = True
+
+        for j, turbine_id in enumerate(self.turbine_ids):
+            sectors = turbine_sectors[turbine_id]
+            self.lut[:self.n_cells, j] = _directions_in_sectors(centers, sectors)
+            for boundary in np.ravel(sectors):
+                near = (lower - resolution <= boundary) & (boundary <= lower + 2 * resolution)
+                self.exact[:self.n_cells][near, j] = True
+
+    @classmethod
+    def from_config(
+        cls,
+        config,
+        resolution: float = DEFAULT_LUT_RESOLUTION
+    ) -> 'SectorEngine':
+        """
+        Compile a SectorManagementConfig.
+
+        Args:
+            config: SectorManagementConfig instance
+            resolution: Direction cell width of the lookup tables (degrees)
+
+        Returns:
+            SectorEngine instance
+        """
+        return cls(config.turbine_sectors, resolution=resolution)
+
+    def allowed_matrix(self, wind_directions: np.ndarray) -> np.ndarray:
+        """
+        Operating state of the restricted turbines only.
+
+        Args:
+            wind_directions: Array of wind directions (n_timesteps,)
+
+        Returns:
+            Boolean array of shape (n_timesteps, n_restricted) with columns
+            ordered as ``turbine_ids``
+        """
+        with np.errstate(invalid='ignore'):
+            wd = np.mod(np.asarray(wind_directions, dtype=float), 360.0)
+
+        # Cell index per timestep; NaN maps to the last (prohibited) row
+        cell = np.nan_to_num(wd / self.resolution, nan=self.n_cells + 1)
+        cell = np.minimum(cell, self.n_cells + 1).astype(np.int64)
+
+        allowed = np.take(self.lut, cell, axis=0)
+        needs_exact = np.take(self.exact, cell, axis=0)
+
+        exact_rows, exact_cols = np.nonzero(needs_exact)
+        for j, turbine_id in enumerate(self.turbine_ids):
+            rows = exact_rows[exact_cols == j]
+            if len(rows):
+                allowed[rows, j] = _directions_in_sectors(
+                    wd[rows],
+                    self.turbine_sectors[turbine_id]
+                )
+
+        return allowed
+
+    def operating_mask(
+        self,
+        wind_directions: np.ndarray,
+        n_turbines: int
+    ) -> np.ndarray:
+        """
+        Operating mask for all turbines (unrestricted turbines always run).
+
+        Args:
+            wind_directions: Array of wind directions (n_timesteps,)
+            n_turbines: Total number of turbines
+
+        Returns:
+            Boolean array of shape (n_timesteps, n_turbines)
+        """
+        indices = self._turbine_indices(n_turbines)
+        mask = np.ones((len(wind_directions), n_turbines), dtype=bool)
+        mask[:, indices] = self.allowed_matrix(wind_directions)
+        return mask
+
+    def availability(self, wind_directions: np.ndarray) -> Dict[int, float]:
+        """
+        Fraction of timesteps each restricted turbine may operate.
+
+        Args:
+            wind_directions: Array of wind directions (n_timesteps,)
+
+        Returns:
+            Dict mapping turbine_id to availability fraction (0-1)
+        """
+        n_timesteps = len(wind_directions)
+        if n_timesteps == 0:
+            return dict.fromkeys(self.turbine_ids, 0.0)
+
+        allowed_counts = self.allowed_matrix(wind_directions).sum(axis=0)
+        return {
+            turbine_id: int(count) / n_timesteps
+            for turbine_id, count in zip(self.turbine_ids, allowed_counts, strict=True)
+        }
+
+    def prohibited_energy(
+        self,
+        power: np.ndarray,
+        wind_directions: np.ndarray
+    ) -> np.ndarray:
+        """
+        Energy each turbine would produce in its prohibited sectors.
+
+        Args:
+            power: Power per turbine and timestep, shape (n_turbines, n_timesteps)
+            wind_directions: Array of wind directions (n_timesteps,)
+
+        Returns:
+            Array of shape (n_turbines,) with the summed power of prohibited
+            timesteps (same unit as power × timestep, e.g. Wh for hourly W);
+            zero for unrestricted turbines
+        """
+        power = np.asarray(power)
+        if len(wind_directions) != power.shape[1]:
+            raise ValueError(
+                f"Wind direction length ({len(wind_directions)}) doesn't match "
+                f"power timeseries length ({power.shape[1]})"
+            )
+
+        indices = self._turbine_indices(power.shape[0])
+        prohibited = ~self.allowed_matrix(wind_directions)
+
+        losses = np.zeros(power.shape[0])
+        losses[indices] = np.einsum('jt,tj->j', power[indices], prohibited)
+        return losses
+
+    def _turbine_indices(self, n_turbines: int) -> np.ndarray:
+        """0-based column indices of the restricted turbines."""
+        for turbine_id in self.turbine_ids:
+            if turbine_id - 1 < 0 or turbine_id - 1 >= n_turbines:
+                raise ValueError(
+                    f"Turbine ID {turbine_id} out of range for {n_turbines} turbines"
+                )
+        return np.array([turbine_id - 1 for turbine_id in self.turbine_ids], dtype=int)
+
+    def __repr__(self) -> str:
+        return (
+            f"SectorEngine(turbines={self.turbine_ids}, "
+            f"resolution={self.resolution}°)"
+        )
+
+
 def calculate_sector_availability(
     wind_data: pd.DataFrame,
     turbine_sectors: Dict[int, List[Tuple[float, float]]]
@@ -73,22 +289,7 @@ def calculate_sector_availability(
     if 'wd' not in wind_data.columns:
         raise ValueError("wind_data must contain 'wd' (wind direction) column")
 
-    wind_directions = wind_data['wd'].values
-    total_timesteps = len(wind_directions)
-
-    availability = {}
-
-    for turbine_id, sectors in turbine_sectors.items():
-        # Count how many timesteps have wind in allowed sectors
-        allowed_timesteps = sum(
-            is_direction_in_sectors(wd, sectors)
-            for wd in wind_directions
-        )
-
-        # Calculate availability fraction
-        availability[turbine_id] = allowed_timesteps / total_timesteps if total_timesteps > 0 else 0.0
-
-    return availability
+    return SectorEngine(turbine_sectors).availability(wind_data['wd'].values)
 
 
 def validate_sector_ranges(sectors: List[Tuple[float, float]]) -> None:
@@ -151,21 +352,7 @@ def create_sector_mask(
         >>> mask[:, 1]  # Turbine 2 (no restrictions)
         array([True, True, True, True])
     """
-    n_timesteps = len(wind_directions)
-    mask = np.ones((n_timesteps, n_turbines), dtype=bool)  # All True by default
-
-    # Apply sector restrictions
-    for turbine_id, sectors in turbine_sectors.items():
-        turbine_idx = turbine_id - 1  # Convert to 0-indexed
-
-        if turbine_idx < 0 or turbine_idx >= n_turbines:
-            raise ValueError(f"Turbine ID {turbine_id} out of range for {n_turbines} turbines")
-
-        # Set mask to False for prohibited directions
-        for t, wd in enumerate(wind_directions):
-            mask[t, turbine_idx] = is_direction_in_sectors(wd, sectors)
-
-    return mask
+    return SectorEngine(turbine_sectors).operating_mask(wind_directions, n_turbines)
 
 
 def get_sector_statistics(
@@ -0,0 +1,546 @@
+"""
+Sector-configuration what-if analysis and optimization.
+
+Sector losses are post-processed from the wake simulation's hourly power, so
+any candidate SectorManagementConfig can be evaluated without re-running
+PyWake. Hourly energy is grouped by unique wind direction once; a candidate
+configuration then reduces to a boolean mask over those directions and its
+losses to a matrix product, which makes thousands of candidates per second
+practical. Like run_simulation(), stopped turbines are assumed to still cast
+wakes (see the loss decomposition notes in WindSite.run_simulation).
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Union, Dict, List, Tuple, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core import SectorManagementConfig
+from .sector_management import _directions_in_sectors, DEFAULT_LUT_RESOLUTION
+
+
+SectorSpec = Optional[Union[SectorManagementConfig, Dict[int, List[Tuple[float, float]]]]]
+
+
+@dataclass(frozen=True)
+class StopRequirement:
+    """
+    Minimum stop time for a turbine in a direction range.
+
+    Attributes:
+        turbine_id: Turbine ID (1-based, as in SectorManagementConfig)
+        directions: Direction ranges as (start, end) tuples, inclusive
+        min_hours_per_year: Hours per year the turbine must be stopped while
+                           the wind comes from ``directions``
+    """
+    turbine_id: int
+    directions: List[Tuple[float, float]]
+    min_hours_per_year: float
+
+    def __post_init__(self):
+        """Validate requirement."""
+        if not isinstance(self.turbine_id, int) or self.turbine_id <= 0:
+            raise ValueError(f"Turbine ID must be positive integer, got {self.turbine_id}")
+        if not self.directions:
+            raise ValueError("directions must contain at least one range")
+        if self.min_hours_per_year < 0:
+            raise ValueError("min_hours_per_year must be non-negative")
+
+
+@dataclass
+class SectorScenarioResults:
+    """
+    Sector losses of a batch of candidate configurations.
+
+    Attributes:
+        turbine_loss_gwh: Sector loss per configuration and turbine (GWh/year),
+                          shape (n_configs, n_turbines)
+        turbine_aep_gwh: Production per turbine without sector management
+                         (GWh/year), shape (n_turbines,)
+        labels: Name of each configuration
+    """
+    turbine_loss_gwh: np.ndarray
+    turbine_aep_gwh: np.ndarray
+    labels: List[str] = field(default_factory=list)
+
+    @property
+    def farm_loss_gwh(self) -> np.ndarray:
+        """Farm sector loss per configuration (GWh/year)."""
+        return self.turbine_loss_gwh.sum(axis=1)
+
+    @property
+    def farm_aep_gwh(self) -> np.ndarray:
+        """Farm production after sector curtailment per configuration (GWh/year)."""
+        return self.turbine_aep_gwh.sum() - self.farm_loss_gwh
+
+    @property
+    def farm_loss_percent(self) -> np.ndarray:
+        """Farm sector loss per configuration in percent of unrestricted AEP."""
+        total = self.turbine_aep_gwh.sum()
+        if total == 0:
+            return np.zeros(len(self.turbine_loss_gwh))
+        return self.farm_loss_gwh / total * 100
+
+    def best(self) -> int:
+        """Index of the configuration with the highest farm AEP."""
+        return int(np.argmax(self.farm_aep_gwh))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Summarize as a DataFrame.
+
+        Returns:
+            DataFrame indexed by configuration label with farm AEP, loss and
+            per-turbine loss columns (T1_loss_gwh, T2_loss_gwh, ...)
+        """
+        df = pd.DataFrame({
+            'farm_aep_gwh': self.farm_aep_gwh,
+            'sector_loss_gwh': self.farm_loss_gwh,
+            'sector_loss_percent': self.farm_loss_percent
+        }, index=self.labels or None)
+
+        for i in range(self.turbine_loss_gwh.shape[1]):
+            df[f'T{i + 1}_loss_gwh'] = self.turbine_loss_gwh[:, i]
+
+        return df
+
+
+@dataclass
+class SectorOptimizationResult:
+    """
+    Result of SectorScenarioEngine.optimize().
+
+    Attributes:
+        config: Optimized sector configuration (None if nothing is stopped)
+        turbine_loss_gwh: Sector loss per turbine (GWh/year)
+        farm_aep_gwh: Farm production after sector curtailment (GWh/year)
+        farm_loss_gwh: Farm sector loss (GWh/year)
+        stopped_hours_per_year: Achieved stop hours for each requirement
+    """
+    config: Optional[SectorManagementConfig]
+    turbine_loss_gwh: np.ndarray
+    farm_aep_gwh: float
+    farm_loss_gwh: float
+    stopped_hours_per_year: List[float]
+
+
+class SectorScenarioEngine:
+    """
+    Evaluate and optimize sector configurations from stored hourly power.
+
+    Example:
+        >>> engine = SectorScenarioEngine.from_site(site, wake_model='NOJ')
+        >>> results = engine.evaluate([SECTOR_MANAGEMENT_CONFIG, alternative])
+        >>> print(results.to_dataframe()[['farm_aep_gwh', 'sector_loss_percent']])
+        >>>
+        >>> best = engine.optimize([
+        ...     StopRequirement(turbine_id=1, directions=[(150, 210)],
+        ...                     min_hours_per_year=500)
+        ... ])
+    """
+
+    def __init__(
+        self,
+        power_w: np.ndarray,
+        wind_directions: np.ndarray,
+        resolution: float = DEFAULT_LUT_RESOLUTION
+    ):
+        """
+        Group hourly energy by unique wind direction.
+
+        Args:
+            power_w: Hourly power per turbine in W, shape (n_turbines, n_hours)
+            wind_directions: Wind direction per hour (degrees), shape (n_hours,)
+            resolution: Direction grid for the sector edges of optimized
+                       configurations (degrees)
+        """
+        power_w = np.asarray(power_w, dtype=float)
+        wind_directions = np.asarray(wind_directions, dtype=float)
+
+        if power_w.ndim != 2 or power_w.shape[1] != len(wind_directions):
+            raise ValueError(
+                f"power_w must have shape (n_turbines, {len(wind_directions)}), "
+                f"got {power_w.shape}"
+            )
+        if resolution <= 0:
+            raise ValueError(f"resolution must be positive, got {resolution}")
+
+        self.n_turbines, self.n_hours = power_w.shape
+        self.resolution = resolution
+        # Hourly W → annual GWh
+        self._to_annual_gwh = 1e-9 * 8760 / self.n_hours if self.n_hours else 0.0
+
+        with np.errstate(invalid='ignore'):
+            normalized = np.mod(wind_directions, 360.0)
+        self.directions, inverse, counts = np.unique(
+            normalized, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.reshape(-1)
+
+        # Energy per turbine and unique direction (GWh/year), hours per direction
+        self.energy_gwh = np.zeros((self.n_turbines, len(self.directions)))
+        for t in range(self.n_turbines):
+            self.energy_gwh[t] = np.bincount(
+                inverse, weights=power_w[t], minlength=len(self.directions)
+            ) * self._to_annual_gwh
+        self.hours = counts.astype(float)
+
+        self.turbine_aep_gwh = self.energy_gwh.sum(axis=1)
+        self._allowed_cache: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def from_site(cls, site, wake_model='NOJ') -> 'SectorScenarioEngine':
+        """
+        Build from a configured WindSite using its wake simulation.
+
+        The PyWake time-series run is served from the site's result cache
+        when enabled (see WindSite.enable_cache).
+
+        Args:
+            site: WindSite with wind data, turbine and layout
+            wake_model: Wake model name or WakeModel
+
+        Returns:
+            SectorScenarioEngine instance
+        """
+        from ..core import WakeModel
+
+        if isinstance(wake_model, str):
+            wake_model = WakeModel[wake_model.upper().replace(' ', '_')]
+
+        site.validate_configuration()
+        sim_result = site._run_pywake_simulation(wake_model, 12, 'timeseries')
+
+        return cls(sim_result.power_w, site.wind_data.timeseries['wd'].values)
+
+    @property
+    def hours_per_year_factor(self) -> float:
+        """Factor converting record hours to hours per year."""
+        return 8760 / self.n_hours if self.n_hours else 0.0
+
+    def allowed_directions(self, sectors: List[Tuple[float, float]]) -> np.ndarray:
+        """
+        Allowed state of each unique direction for one sector list.
+
+        Args:
+            sectors: Allowed sector ranges as (start, end) tuples
+
+        Returns:
+            Boolean array over ``directions`` (NaN directions never allowed)
+        """
+        key = tuple(tuple(sector) for sector in sectors)
+        if key not in self._allowed_cache:
+            self._allowed_cache[key] = _directions_in_sectors(self.directions, sectors)
+        return self._allowed_cache[key]
+
+    def evaluate(
+        self,
+        configs: Sequence[SectorSpec],
+        labels: Optional[List[str]] = None
+    ) -> SectorScenarioResults:
+        """
+        Evaluate sector losses of many candidate configurations.
+
+        Args:
+            configs: SectorManagementConfig, turbine_sectors dicts or None
+            labels: Optional name per configuration
+
+        Returns:
+            SectorScenarioResults with per-turbine and farm figures
+        """
+        losses = np.zeros((len(configs), self.n_turbines))
+
+        for c, config in enumerate(configs):
+            turbine_sectors = self._turbine_sectors(config)
+            if not turbine_sectors:
+                continue
+
+            prohibited = np.zeros((self.n_turbines, len(self.directions)), dtype=bool)
+            for turbine_id, sectors in turbine_sectors.items():
+                self._check_turbine(turbine_id)
+                prohibited[turbine_id - 1] = ~self.allowed_directions(sectors)
+
+            losses[c] = np.einsum('tk,tk->t', self.energy_gwh, prohibited)
+
+        if labels is None:
+            labels = [f"config_{c}" for c in range(len(configs))]
+
+        return SectorScenarioResults(
+            turbine_loss_gwh=losses,
+            turbine_aep_gwh=self.turbine_aep_gwh.copy(),
+            labels=list(labels)
+        )
+
+    def stopped_hours_per_year(
+        self,
+        config: SectorSpec,
+        turbine_id: int,
+        directions: List[Tuple[float, float]]
+    ) -> float:
+        """
+        Hours per year a turbine is stopped while the wind is in ``directions``.
+
+        Args:
+            config: Sector configuration
+            turbine_id: Turbine ID (1-based)
+            directions: Direction ranges as (start, end) tuples
+
+        Returns:
+            Stopped hours per year
+        """
+        sectors = self._turbine_sectors(config).get(turbine_id)
+        if sectors is None:
+            return 0.0
+
+        stopped = ~self.allowed_directions(sectors) & self.allowed_directions(directions)
+        return float(self.hours[stopped].sum() * self.hours_per_year_factor)
+
+    def optimize(
+        self,
+        requirements: List[StopRequirement],
+        strategy: str = 'contiguous'
+    ) -> SectorOptimizationResult:
+        """
+        Find the sectors that meet the stop requirements at minimum AEP loss.
+
+        Turbines are independent (stopped turbines still cast wakes), so each
+        turbine's stop set is chosen separately over the observed directions.
+        Requirements on the same turbine and directions are merged (the
+        largest stop time applies), and a turbine's requirements are met in
+        order of decreasing stop time, counting the hours already stopped
+        for earlier ones:
+
+        - 'contiguous' (default): stop the contiguous direction window with
+          the lowest additional energy that meets each requirement (search
+          over all sector edges).
+        - 'greedy': stop the directions with the lowest energy per hour
+          first, then drop any stop that is not needed. It usually loses
+          less energy than 'contiguous' but is not guaranteed optimal, and
+          the stop set is usually fragmented into many sectors as narrow as
+          one observed direction, which a turbine controller cannot
+          implement as such.
+
+        Only the observed directions chosen as stops are prohibited; the
+        allowed sectors extend to the nearest point of the direction grid
+        (``resolution``) next to each stop, also across directions without
+        data.
+
+        Args:
+            requirements: Stop requirements (several per turbine allowed)
+            strategy: 'contiguous' or 'greedy'
+
+        Returns:
+            SectorOptimizationResult with the optimized configuration
+
+        Raises:
+            ValueError: If a requirement cannot be met
+        """
+        if strategy not in ('greedy', 'contiguous'):
+            raise ValueError(f"Unknown strategy '{strategy}'. Available: ['greedy', 'contiguous']")
+
+        stopped = np.zeros((self.n_turbines, len(self.directions)), dtype=bool)
+
+        for t, in_range, needed in self._merged_requirements(requirements):
+            if strategy == 'greedy':
+                stopped[t] |= self._greedy_stops(t, in_range, stopped[t], needed)
+            else:
+                stopped[t] |= self._contiguous_stops(t, in_range, stopped[t], needed)
+
+        turbine_sectors = {}
+        for t in range(self.n_turbines):
+            if stopped[t].any():
+                turbine_sectors[t + 1] = self._allowed_ranges(stopped[t])
+
+        config = (
+            SectorManagementConfig(
+                turbine_sectors=turbine_sectors,
+                metadata={'source': f'SectorScenarioEngine.optimize ({strategy})'}
+            )
+            if turbine_sectors else None
+        )
+
+        evaluation = self.evaluate([config])
+        return SectorOptimizationResult(
+            config=config,
+            turbine_loss_gwh=evaluation.turbine_loss_gwh[0],
+            farm_aep_gwh=float(evaluation.farm_aep_gwh[0]),
+            farm_loss_gwh=float(evaluation.farm_loss_gwh[0]),
+            stopped_hours_per_year=[
+                self.stopped_hours_per_year(config, r.turbine_id, r.directions)
+                for r in requirements
+            ]
+        )
+
+    def _merged_requirements(
+        self,
+        requirements: List[StopRequirement]
+    ) -> List[Tuple[int, np.ndarray, float]]:
+        """
+        Check the requirements and merge them per turbine.
+
+        Returns:
+            (turbine index, in-range mask over ``directions``, required
+            record hours) per merged requirement, each turbine's in order of
+            decreasing required hours
+
+        Raises:
+            ValueError: If a requirement cannot be met
+        """
+        valid = ~np.isnan(self.directions)
+        merged: Dict[Tuple[int, tuple], float] = {}
+
+        for requirement in requirements:
+            self._check_turbine(requirement.turbine_id)
+            in_range = self.allowed_directions(requirement.directions) & valid
+            needed = requirement.min_hours_per_year / self.hours_per_year_factor \
+                if self.hours_per_year_factor else 0.0
+
+            if self.hours[in_range].sum() < needed:
+                raise ValueError(
+                    f"Turbine {requirement.turbine_id}: only "
+                    f"{self.hours[in_range].sum() * self.hours_per_year_factor:.0f} h/year "
+                    f"of wind from {requirement.directions}, "
+                    f"{requirement.min_hours_per_year} h/year required"
+                )
+
+            key = (requirement.turbine_id, tuple(sorted(tuple(r) for r in requirement.directions)))
+            merged[key] = max(merged.get(key, 0.0), needed)
+
+        ordered = sorted(merged.items(), key=lambda item: (item[0][0], -item[1]))
+        return [
+            (turbine_id - 1, self.allowed_directions(list(directions)) & valid, needed)
+            for (turbine_id, directions), needed in ordered
+        ]
+
+    def _greedy_stops(
+        self,
+        t: int,
+        in_range: np.ndarray,
+        already_stopped: np.ndarray,
+        needed: float
+    ) -> np.ndarray:
+        """Cheapest directions (energy per hour) covering the required hours."""
+        remaining = needed - self.hours[in_range & already_stopped].sum()
+        new = np.zeros(len(self.directions), dtype=bool)
+        if remaining <= 0:
+            return new
+
+        candidates = np.flatnonzero(in_range & ~already_stopped)
+        cost = self.energy_gwh[t, candidates] / self.hours[candidates]
+        order = candidates[np.argsort(cost, kind='stable')]
+
+        n_take = int(np.searchsorted(np.cumsum(self.hours[order]), remaining)) + 1
+        chosen = list(order[:n_take])
+
+        # Drop the most expensive stops that are not needed
+        covered = self.hours[chosen].sum()
+        for k in sorted(chosen, key=lambda k: -self.energy_gwh[t, k]):
+            if covered - self.hours[k] >= remaining:
+                chosen.remove(k)
+                covered -= self.hours[k]
+
+        new[chosen] = True
+        return new
+
+    def _contiguous_stops(
+        self,
+        t: int,
+        in_range: np.ndarray,
+        already_stopped: np.ndarray,
+        needed: float
+    ) -> np.ndarray:
+        """Cheapest contiguous window of in-range directions covering the hours."""
+        stops = np.zeros(len(self.directions), dtype=bool)
+        remaining = needed - self.hours[in_range & already_stopped].sum()
+        if remaining <= 0:
+            return stops
+
+        # Circular order over the observed (non-NaN) directions; directions
+        # stopped for an earlier requirement add neither hours nor energy
+        n = int((~np.isnan(self.directions)).sum())
+        new = ~already_stopped[:n]
+        hours = np.tile(self.hours[:n] * new, 2)
+        energy = np.tile(self.energy_gwh[t, :n] * new, 2)
+        usable = np.tile(in_range[:n], 2)
+
+        cum_hours = np.concatenate([[0.0], np.cumsum(hours)])
+        cum_energy = np.concatenate([[0.0], np.cumsum(energy)])
+
+        # Window [i, end) must stay inside one run of in-range directions
+        starts = np.flatnonzero(usable[:n])
+        blocked = np.flatnonzero(~usable)
+        run_end = np.append(blocked, 2 * n)[np.searchsorted(blocked, starts)]
+        run_end = np.minimum(run_end, starts + n)
+
+        ends = np.searchsorted(cum_hours, cum_hours[starts] + remaining, side='left')
+        feasible = ends <= run_end
+        if not feasible.any():
+            raise ValueError(
+                f"Turbine {t + 1}: no contiguous direction window covers "
+                f"{needed * self.hours_per_year_factor:.0f} h/year"
+            )
+
+        cost = np.where(feasible, cum_energy[np.minimum(ends, 2 * n)] - cum_energy[starts], np.inf)
+        best = int(np.argmin(cost))
+        window = np.arange(starts[best], ends[best]) % n
+        stops[window] = True
+        return stops
+
+    def _allowed_ranges(self, stopped: np.ndarray) -> List[Tuple[float, float]]:
+        """
+        Allowed sector ranges around runs of stopped observed directions.
+
+        Each run of consecutive stopped directions [first, last] is
+        prohibited; the allowed ranges next to it end on the nearest grid
+        point outside the run, or on the neighbouring observed direction if
+        that is closer, so directions without data stay allowed.
+        """
+        observed = ~np.isnan(self.directions)
+        directions = self.directions[observed]
+        stopped = stopped[observed]
+        if stopped.all():
+            raise ValueError("Stop requirements leave no allowed direction")
+
+        # Rounding guards grid points against floating point noise
+        steps = np.round(directions / self.resolution, 9)
+        below = (np.ceil(steps) - 1) * self.resolution
+        above = (np.floor(steps) + 1) * self.resolution
+
+        edges = np.diff(np.concatenate([[0], stopped.astype(np.int8), [0]]))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1) - 1
+
+        ranges = []
+        start = 0.0
+        for first, last in zip(run_starts, run_ends, strict=True):
+            end = below[first] if first == 0 else max(below[first], directions[first - 1])
+            if end >= start:
+                ranges.append((round(float(start), 9), round(float(end), 9)))
+            start = above[last] if last == len(directions) - 1 \
+                else min(above[last], directions[last + 1])
+        if start < 360.0:
+            ranges.append((round(float(start), 9), 360.0))
+
+        return ranges
+
+    def _turbine_sectors(self, config: SectorSpec) -> Dict[int, List[Tuple[float, float]]]:
+        """Normalize a configuration argument to a turbine_sectors dict."""
+        if config is None:
+            return {}
+        if isinstance(config, SectorManagementConfig):
+            return config.turbine_sectors
+        return dict(config)
+
+    def _check_turbine(self, turbine_id: int) -> None:
+        """Raise if a turbine ID is outside the simulated layout."""
+        if turbine_id - 1 < 0 or turbine_id - 1 >= self.n_turbines:
+            raise ValueError(
+                f"Turbine ID {turbine_id} out of range for {self.n_turbines} turbines"
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"SectorScenarioEngine(n_turbines={self.n_turbines}, "
+            f"n_hours={self.n_hours}, n_directions={len(self.directions)})"
+        )
@@ -0,0 +1,349 @@
+"""
+Vertical wind shear from multi-height wind data.
+
+Wind records at several heights (e.g. the Vortex 100/150/164/175 m series)
+are aligned once on their shared timestamps and stacked into a
+(n_heights, n_hours) array. Shear exponents then follow from vectorized
+log-log least squares, ln(V) = alpha × ln(h) + c, per hour, per direction
+sector or per hour of day, and any hub height is extrapolated in a single
+array expression. A hub-height sweep reuses the loaded profile instead of
+reloading files or assuming one constant alpha for every configuration.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union, Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core import WindData
+
+
+# Below this wind speed (m/s) hourly log ratios are dominated by noise
+DEFAULT_MIN_WS = 3.0
+
+# Alpha sources accepted by ShearProfile.extrapolate()
+ALPHA_METHODS = ('profile', 'sector', 'hour', 'timeseries')
+
+
+@dataclass
+class ShearProfile:
+    """
+    Wind speeds at several heights on a shared DatetimeIndex.
+
+    Attributes:
+        wind_data: WindData per height (ascending), all on the same index
+        ws: Wind speed per height and timestep, shape (n_heights, n_hours)
+        n_sectors: Direction sectors used by the sector alpha table
+        min_ws: Wind speed (m/s) below which an hour gets no hourly alpha
+
+    Example:
+        >>> profile = load_shear_profile("vortex.serie.{height}m.txt", [100, 150, 175],
+        ...                              skiprows=3, column_mapping=VORTEX_COLUMNS)
+        >>> profile.alpha_by_sector()
+        >>> hub_wind = profile.extrapolate(164.0, alpha='sector')
+    """
+    wind_data: Dict[float, WindData]
+    ws: np.ndarray = field(repr=False)
+    n_sectors: int = 12
+    min_ws: float = DEFAULT_MIN_WS
+
+    @classmethod
+    def from_wind_data(
+        cls,
+        wind_data: Union[Dict[float, WindData], Sequence[WindData]],
+        n_sectors: int = 12,
+        min_ws: float = DEFAULT_MIN_WS
+    ) -> 'ShearProfile':
+        """
+        Align wind data at several heights on their common timestamps.
+
+        Args:
+            wind_data: WindData per height (dict keyed by height or a list;
+                      each WindData's own height is used)
+            n_sectors: Direction sectors for alpha_by_sector()
+            min_ws: Minimum wind speed at every height for an hourly alpha
+
+        Returns:
+            ShearProfile
+        """
+        records = list(wind_data.values()) if isinstance(wind_data, dict) else list(wind_data)
+        if len(records) < 2:
+            raise ValueError(f"At least two heights are required, got {len(records)}")
+
+        records.sort(key=lambda data: data.height)
+        heights = [data.height for data in records]
+        if len(set(heights)) != len(heights):
+            raise ValueError(f"Heights must be unique, got {heights}")
+
+        index = records[0].timeseries.index
+        for data in records[1:]:
+            if not data.timeseries.index.equals(index):
+                index = index.intersection(data.timeseries.index)
+        if len(index) == 0:
+            raise ValueError("Wind data at the given heights share no timestamps")
+
+        aligned = {}
+        for data in records:
+            if not data.timeseries.index.equals(index):
+                data = WindData(
+                    timeseries=data.timeseries.loc[index],
+                    height=data.height,
+                    timezone_offset=data.timezone_offset,
+                    source=data.source,
+                    metadata=data.metadata
+                )
+            aligned[data.height] = data
+
+        ws = np.vstack([data.timeseries['ws'].to_numpy(dtype=float) for data in aligned.values()])
+        return cls(wind_data=aligned, ws=ws, n_sectors=n_sectors, min_ws=min_ws)
+
+    @property
+    def heights(self) -> np.ndarray:
+        """Measurement heights (m), ascending."""
+        return np.array(list(self.wind_data), dtype=float)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """Shared timestamps."""
+        return next(iter(self.wind_data.values())).timeseries.index
+
+    @property
+    def wd(self) -> np.ndarray:
+        """Wind direction at the highest measurement height (degrees)."""
+        return self.wind_data[self.heights[-1]].timeseries['wd'].to_numpy(dtype=float)
+
+    def alpha_timeseries(self) -> pd.Series:
+        """
+        Hourly shear exponent from a log-log fit over all heights.
+
+        Hours with a wind speed below min_ws at any height are NaN.
+
+        Returns:
+            Series of alpha on the shared index
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = _log_slope(self.heights, np.log(self.ws))
+        alpha[(self.ws < self.min_ws).any(axis=0) | ~np.isfinite(alpha)] = np.nan
+        return pd.Series(alpha, index=self.index, name='alpha')
+
+    def profile_alpha(self) -> float:
+        """
+        Shear exponent of the mean wind speed profile.
+
+        Returns:
+            Alpha fitted to the mean wind speed per height
+        """
+        return float(_log_slope(self.heights, np.log(np.nanmean(self.ws, axis=1))))
+
+    def alpha_by_sector(self) -> pd.DataFrame:
+        """
+        Shear exponent per direction sector.
+
+        Sectors are [k × width, (k + 1) × width) of the direction at the
+        highest measurement height; hours without a finite direction are
+        left out.
+
+        Returns:
+            DataFrame indexed by sector with the sector start/end (degrees),
+            profile alpha of the sector's mean wind speeds, median hourly
+            alpha and number of hours
+        """
+        width = 360.0 / self.n_sectors
+        table = self._grouped_alpha(self._sector_index(), self.n_sectors)
+        table.index.name = 'sector'
+        table.insert(0, 'wd_start', table.index * width)
+        table.insert(1, 'wd_end', (table.index + 1) * width)
+        return table
+
+    def alpha_by_hour(self) -> pd.DataFrame:
+        """
+        Shear exponent per hour of day (diurnal stability cycle).
+
+        Returns:
+            DataFrame indexed by hour (0-23) with profile alpha, median hourly
+            alpha and number of hours
+        """
+        table = self._grouped_alpha(np.asarray(self.index.hour), 24)
+        table.index.name = 'hour'
+        return table
+
+    def alpha_per_timestep(self, alpha: Union[float, str] = 'sector') -> np.ndarray:
+        """
+        Shear exponent applied to each timestep.
+
+        Args:
+            alpha: Constant exponent, or one of 'profile', 'sector', 'hour'
+                  or 'timeseries' (hourly fit; hours without one use the
+                  sector exponent, hours without a direction the profile
+                  exponent)
+
+        Returns:
+            Alpha per timestep, shape (n_hours,)
+        """
+        n_hours = self.ws.shape[1]
+        if not isinstance(alpha, str):
+            return np.full(n_hours, float(alpha))
+        if alpha not in ALPHA_METHODS:
+            raise ValueError(f"Unknown alpha method '{alpha}'. Available: {list(ALPHA_METHODS)}")
+
+        if alpha == 'profile':
+            return np.full(n_hours, self.profile_alpha())
+        if alpha == 'hour':
+            table = self.alpha_by_hour()['alpha'].fillna(self.profile_alpha()).to_numpy()
+            return table[np.asarray(self.index.hour)]
+
+        sector = self._sector_index()
+        table = self.alpha_by_sector()['alpha'].fillna(self.profile_alpha()).to_numpy()
+        sector_alpha = np.where(sector >= 0, table[sector], self.profile_alpha())
+        if alpha == 'sector':
+            return sector_alpha
+
+        hourly = self.alpha_timeseries().to_numpy()
+        return np.where(np.isnan(hourly), sector_alpha, hourly)
+
+    def extrapolate(
+        self,
+        height: Union[float, Sequence[float]],
+        alpha: Union[float, str] = 'sector'
+    ) -> Union[WindData, Dict[float, WindData]]:
+        """
+        Wind data at one or more hub heights.
+
+        Each target height is shifted from the nearest measurement height,
+        V_h = V_ref × (h / h_ref)^alpha_t, with all targets computed in one
+        array expression. Directions and further columns are shared with the
+        reference height's data.
+
+        Args:
+            height: Target height in meters, or a sequence of heights
+            alpha: Constant exponent or alpha method (see alpha_per_timestep)
+
+        Returns:
+            WindData for a single height, or a dict of height → WindData
+
+        Example:
+            >>> sweep = profile.extrapolate([125, 145, 164], alpha='timeseries')
+        """
+        targets = np.atleast_1d(np.asarray(height, dtype=float))
+        alpha_t = self.alpha_per_timestep(alpha)
+        method = alpha if isinstance(alpha, str) else f"{float(alpha):.4f}"
+
+        heights = self.heights
+        nearest = np.abs(targets[:, None] - heights[None, :]).argmin(axis=1)
+        ratio = targets / heights[nearest]
+        ws = self.ws[nearest] * ratio[:, None] ** alpha_t[None, :]
+
+        results = {}
+        for target, ref_height, target_ws in zip(targets, heights[nearest], ws, strict=True):
+            reference = self.wind_data[ref_height]
+            if np.isclose(target, ref_height):
+                results[float(target)] = reference
+                continue
+
+            timeseries = reference.timeseries.copy(deep=False)
+            timeseries['ws'] = target_ws
+            mean_ref = np.nanmean(reference.timeseries['ws'].to_numpy(dtype=float))
+            results[float(target)] = WindData(
+                timeseries=timeseries,
+                height=float(target),
+                timezone_offset=reference.timezone_offset,
+                source=f"{reference.source} (shear extrapolated to {target:g}m, α={method})",
+                metadata={
+                    **reference.metadata,
+                    'extrapolated_from': float(ref_height),
+                    'alpha': method,
+                    'mean_alpha': float(np.nanmean(alpha_t)),
+                    'target_hub_height': float(target),
+                    'correction_factor': float(np.nanmean(target_ws) / mean_ref) if mean_ref else 1.0
+                }
+            )
+
+        if np.ndim(height) == 0:
+            return results[float(targets[0])]
+        return results
+
+    def _sector_index(self) -> np.ndarray:
+        """Direction sector of each hour, -1 where the direction is not finite."""
+        wd = self.wd
+        finite = np.isfinite(wd)
+        sector = np.full(len(wd), -1, dtype=np.int64)
+        width = 360.0 / self.n_sectors
+        sector[finite] = (np.mod(wd[finite], 360.0) // width).astype(np.int64) % self.n_sectors
+        return sector
+
+    def _grouped_alpha(self, groups: np.ndarray, n_groups: int) -> pd.DataFrame:
+        """Profile alpha, median hourly alpha and hours per group (groups < 0 skipped)."""
+        known = groups >= 0
+        counts = np.bincount(groups[known], minlength=n_groups)
+        valid = known & np.isfinite(self.ws).all(axis=0)
+        sums = np.vstack([
+            np.bincount(groups[valid], weights=row[valid], minlength=n_groups)
+            for row in self.ws
+        ])
+        valid_counts = np.bincount(groups[valid], minlength=n_groups)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_ws = sums / valid_counts
+            profile = _log_slope(self.heights, np.log(mean_ws))
+
+        hourly = self.alpha_timeseries().to_numpy()
+        median = pd.Series(hourly[known]).groupby(groups[known]).median().reindex(range(n_groups))
+
+        return pd.DataFrame({
+            'alpha': np.where(valid_counts > 0, profile, np.nan),
+            'median_hourly_alpha': median.to_numpy(),
+            'hours': counts
+        })
+
+    def __repr__(self) -> str:
+        heights = ', '.join(f"{h:g}" for h in self.heights)
+        return (
+            f"ShearProfile(heights=[{heights}] m, n_hours={self.ws.shape[1]}, "
+            f"profile_alpha={self.profile_alpha():.4f})"
+        )
+
+
+def load_shear_profile(
+    filepath_pattern: Union[str, Path],
+    heights: Sequence[float],
+    n_sectors: int = 12,
+    min_ws: float = DEFAULT_MIN_WS,
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> ShearProfile:
+    """
+    Load Vortex files for several heights concurrently into a ShearProfile.
+
+    Args:
+        filepath_pattern: Path pattern with {height} placeholder
+        heights: Measurement heights to load
+        n_sectors: Direction sectors for alpha_by_sector()
+        min_ws: Minimum wind speed at every height for an hourly alpha
+        max_workers: Reader threads (default: one per height)
+        **kwargs: Arguments for VortexWindReader.read_vortex_timeseries
+                 (skiprows, column_mapping, cache_dir, ...)
+
+    Returns:
+        ShearProfile on the heights' common timestamps
+
+    Example:
+        >>> profile = load_shear_profile(
+        ...     "Inputdata/vortex.serie.{height}m.txt", [100, 150, 175],
+        ...     skiprows=3, column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'}
+        ... )
+    """
+    from ..input.wind_data_reader import VortexWindReader
+
+    wind_data = VortexWindReader.read_vortex_multiple_heights(
+        str(filepath_pattern), list(heights), max_workers=max_workers, **kwargs
+    )
+    return ShearProfile.from_wind_data(wind_data, n_sectors=n_sectors, min_ws=min_ws)
+
+
+def _log_slope(heights: np.ndarray, log_ws: np.ndarray) -> np.ndarray:
+    """Least-squares slope of ln(V) against ln(h) along the first axis."""
+    x = np.log(heights) - np.log(heights).mean()
+    x = x.reshape((-1,) + (1,) * (np.ndim(log_ws) - 1))
+    return (x * (log_ws - log_ws.mean(axis=0))).sum(axis=0) / (x ** 2).sum()
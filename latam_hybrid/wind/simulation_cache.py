@@ -0,0 +1,385 @@
+"""
+Content-addressed cache for PyWake simulation results.
+
+PyWake runs are keyed by a hash of everything that determines their output:
+the wind timeseries, the turbine power/CT curve, the layout coordinates, and
+the wake model and simulation method. Results are held in an in-process LRU
+tier and, optionally, in an on-disk tier of compressed ``.npz`` files with
+size-based eviction, so repeated report runs skip PyWake entirely.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union, Dict, Tuple, Sequence
+
+import numpy as np
+
+
+# Bump when the stored arrays or key recipe change so stale entries are ignored
+CACHE_FORMAT_VERSION = "1"
+
+
+@dataclass
+class SimulationArrays:
+    """
+    Per-turbine PyWake outputs needed for loss decomposition.
+
+    Attributes:
+        aep_gwh: Annualized energy per turbine and flow case (GWh/year),
+                 as returned by PyWake's ``SimulationResult.aep()``
+        power_w: Power per turbine and flow case in W (None for reduced
+                 results that only hold per-turbine totals)
+        dims: Dimension names of both arrays, e.g. ('wt', 'time')
+        sector_loss_gwh: Precomputed sector-loss energy per turbine
+                         (GWh/year) for reduced results, else None
+        variables: Additional PyWake result variables (e.g. 'WS_eff') as
+                   float32 arrays with the same dims
+        pywake_result: Original PyWake result object when freshly computed
+                       (never cached)
+    """
+    aep_gwh: np.ndarray
+    power_w: Optional[np.ndarray]
+    dims: Tuple[str, ...]
+    sector_loss_gwh: Optional[np.ndarray] = None
+    variables: Dict[str, np.ndarray] = field(default_factory=dict)
+    pywake_result: Optional[object] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_pywake(cls, sim_result, variables: Sequence[str] = ()) -> 'SimulationArrays':
+        """
+        Extract the arrays from a PyWake SimulationResult.
+
+        Args:
+            sim_result: PyWake simulation result object
+            variables: Additional result variables to keep (e.g. 'WS_eff', 'CT')
+
+        Returns:
+            SimulationArrays referencing the PyWake result
+        """
+        aep = sim_result.aep()
+        power = sim_result.Power.transpose(*aep.dims)
+
+        return cls(
+            aep_gwh=np.asarray(aep.values),
+            power_w=np.asarray(power.values),
+            dims=tuple(aep.dims),
+            variables={
+                name: np.asarray(
+                    sim_result[name].broadcast_like(power).transpose(*aep.dims).values,
+                    dtype=np.float32
+                )
+                for name in variables
+            },
+            pywake_result=sim_result
+        )
+
+    @property
+    def is_timeseries(self) -> bool:
+        """True if the arrays have a time dimension (turbine × time)."""
+        return 'time' in self.dims
+
+    @property
+    def n_turbines(self) -> int:
+        """Number of turbines."""
+        return self.aep_gwh.shape[0]
+
+    def aep_per_turbine(self) -> np.ndarray:
+        """
+        Annual energy per turbine (GWh/year), summed over all flow cases.
+
+        Returns:
+            Array of shape (n_turbines,)
+        """
+        return self.aep_gwh.reshape(self.n_turbines, -1).sum(axis=1)
+
+    def without_pywake_result(self) -> 'SimulationArrays':
+        """Return a copy that does not reference the PyWake result object."""
+        return SimulationArrays(
+            aep_gwh=self.aep_gwh,
+            power_w=self.power_w,
+            dims=self.dims,
+            sector_loss_gwh=self.sector_loss_gwh,
+            variables=self.variables
+        )
+
+
+def _hash_array(hasher, values) -> None:
+    """Feed a numeric array into a hash in a layout-independent way."""
+    array = np.ascontiguousarray(np.asarray(values, dtype=np.float64))
+    hasher.update(str(array.shape).encode())
+    hasher.update(array.tobytes())
+
+
+def compute_simulation_key(
+    ws: np.ndarray,
+    wd: np.ndarray,
+    turbine_spec,
+    x: np.ndarray,
+    y: np.ndarray,
+    wake_model: Optional[str],
+    simulation_method: str,
+    **options
+) -> str:
+    """
+    Compute a content hash identifying a PyWake simulation.
+
+    Args:
+        ws: Wind speed timeseries (m/s)
+        wd: Wind direction timeseries (degrees)
+        turbine_spec: TurbineSpec with power and CT curves
+        x: Turbine x coordinates (m)
+        y: Turbine y coordinates (m)
+        wake_model: Wake model name (None for no-wake baseline)
+        simulation_method: Simulation method ('timeseries', 'weibull', ...)
+        **options: Additional method options that affect the result
+                  (e.g. wind_direction_bins for Weibull)
+
+    Returns:
+        Hex digest string usable as cache key and file name
+
+    Example:
+        >>> key = compute_simulation_key(ws, wd, turbine.spec, x, y, 'NOJ', 'timeseries')
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"v{CACHE_FORMAT_VERSION}".encode())
+
+    # Wind timeseries
+    _hash_array(hasher, ws)
+    _hash_array(hasher, wd)
+
+    # Turbine power/CT curve and geometry
+    _hash_array(hasher, turbine_spec.power_curve['ws'].values)
+    _hash_array(hasher, turbine_spec.power_curve['power'].values)
+    if turbine_spec.ct_curve is not None:
+        _hash_array(hasher, turbine_spec.ct_curve['ws'].values)
+        _hash_array(hasher, turbine_spec.ct_curve['ct'].values)
+    _hash_array(hasher, [turbine_spec.hub_height, turbine_spec.rotor_diameter])
+
+    # Layout coordinates
+    _hash_array(hasher, x)
+    _hash_array(hasher, y)
+
+    # Wake model, simulation method and options
+    hasher.update(f"wake={wake_model}|method={simulation_method}".encode())
+    for name in sorted(options):
+        hasher.update(f"|{name}={options[name]!r}".encode())
+
+    return hasher.hexdigest()
+
+
+class SimulationCache:
+    """
+    Two-tier cache for PyWake simulation results.
+
+    The memory tier is an LRU of SimulationArrays. The optional disk tier
+    stores one compressed ``.npz`` file per key and evicts the least
+    recently used files once the directory exceeds ``max_disk_mb``.
+
+    Example:
+        >>> cache = SimulationCache(cache_dir="results/.pywake_cache")
+        >>> site.enable_cache(cache)
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 8,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_disk_mb: float = 2048.0
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_memory_entries: Maximum number of results held in memory
+            cache_dir: Directory for the on-disk tier (None disables it)
+            max_disk_mb: Size limit of the on-disk tier in MB
+        """
+        if max_memory_entries < 0:
+            raise ValueError("max_memory_entries must be non-negative")
+
+        self.max_memory_entries = max_memory_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_disk_mb = max_disk_mb
+        self._memory: OrderedDict[str, SimulationArrays] = OrderedDict()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[SimulationArrays]:
+        """
+        Look up a result, promoting disk hits into the memory tier.
+
+        Args:
+            key: Cache key from compute_simulation_key()
+
+        Returns:
+            Cached SimulationArrays or None on a miss
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self._stats['memory_hits'] += 1
+            return self._memory[key]
+
+        arrays = self._read_disk(key)
+        if arrays is not None:
+            self._stats['disk_hits'] += 1
+            self._put_memory(key, arrays)
+            return arrays
+
+        self._stats['misses'] += 1
+        return None
+
+    def put(self, key: str, arrays: SimulationArrays) -> None:
+        """
+        Store a result in both tiers.
+
+        Args:
+            key: Cache key from compute_simulation_key()
+            arrays: Simulation arrays (the PyWake object is not stored)
+        """
+        arrays = arrays.without_pywake_result()
+        self._put_memory(key, arrays)
+        self._write_disk(key, arrays)
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Remove all entries from the memory tier (and optionally from disk).
+
+        Args:
+            disk: Also delete the on-disk entries
+        """
+        self._memory.clear()
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob('*.npz'):
+                path.unlink(missing_ok=True)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters."""
+        return dict(self._stats)
+
+    def _put_memory(self, key: str, arrays: SimulationArrays) -> None:
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = arrays
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def _read_disk(self, key: str) -> Optional[SimulationArrays]:
+        if self.cache_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = SimulationArrays(
+                    aep_gwh=data['aep_gwh'],
+                    power_w=data['power_w'] if 'power_w' in data else None,
+                    dims=tuple(str(dim) for dim in data['dims']),
+                    sector_loss_gwh=(
+                        data['sector_loss_gwh'] if 'sector_loss_gwh' in data else None
+                    ),
+                    variables={
+                        name[len('var_'):]: data[name]
+                        for name in data.files if name.startswith('var_')
+                    }
+                )
+        except (OSError, KeyError, ValueError):
+            # Corrupt or partial entry - drop it and recompute
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for eviction ordering (another process may
+        # have evicted the file since it was read)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return arrays
+
+    def _write_disk(self, key: str, arrays: SimulationArrays) -> None:
+        if self.cache_dir is None:
+            return
+
+        path = self._disk_path(key)
+        # Per-process temp name: pool workers sharing cache_dir may write
+        # the same key concurrently
+        tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        stored = {'aep_gwh': arrays.aep_gwh, 'dims': np.array(arrays.dims)}
+        if arrays.power_w is not None:
+            stored['power_w'] = arrays.power_w
+        if arrays.sector_loss_gwh is not None:
+            stored['sector_loss_gwh'] = arrays.sector_loss_gwh
+        for name, values in arrays.variables.items():
+            stored[f'var_{name}'] = values
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **stored)
+        os.replace(tmp_path, path)
+
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until under the size limit."""
+        entries = []
+        for path in self.cache_dir.glob('*.npz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process sharing the directory
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in entries)
+        limit_bytes = self.max_disk_mb * 1024 * 1024
+
+        for _, size, path in sorted(entries):
+            if total_bytes <= limit_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def __repr__(self) -> str:
+        disk_str = str(self.cache_dir) if self.cache_dir else "disabled"
+        return (
+            f"SimulationCache(memory={len(self._memory)}/{self.max_memory_entries}, "
+            f"disk={disk_str})"
+        )
+
+
+# Process-wide caches shared by all WindSite instances, keyed by cache_dir
+_SHARED_CACHES: Dict[Optional[str], SimulationCache] = {}
+
+
+def get_simulation_cache(
+    cache_dir: Optional[Union[str, Path]] = None,
+    **kwargs
+) -> SimulationCache:
+    """
+    Get the process-wide cache for a cache directory.
+
+    WindSite instances created in a loop (one per turbine configuration or
+    year) share results through this registry.
+
+    Args:
+        cache_dir: Directory for the on-disk tier (None for memory only)
+        **kwargs: Arguments for SimulationCache when first created
+
+    Returns:
+        Shared SimulationCache instance
+    """
+    registry_key = str(Path(cache_dir).resolve()) if cache_dir is not None else None
+
+    if registry_key not in _SHARED_CACHES:
+        _SHARED_CACHES[registry_key] = SimulationCache(cache_dir=cache_dir, **kwargs)
+
+    return _SHARED_CACHES[registry_key]
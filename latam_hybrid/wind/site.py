@@ -4,7 +4,9 @@ Wind site analysis with pywake integration.
 Main orchestrator class for wind energy analysis using method chaining pattern.
 """
 
-from typing import Optional, Union, Dict, List
+import hashlib
+import warnings
+from typing import Optional, Union, Dict, List, Sequence, Tuple
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -12,7 +14,29 @@ from pathlib import Path
 from ..core import WindData, WindSimulationResult, WakeModel, SectorManagementConfig
 from .turbine import TurbineModel
 from .layout import TurbineLayout
-from .losses import WindFarmLosses, create_default_losses
+from .losses import (
+    WindFarmLosses, LossType, HysteresisResult, create_default_losses, simulate_high_wind_hysteresis
+)
+from .loss_engine import LossTransform, OperationalLossEngine, StoppedMaskLoss
+from .availability import OutageModel, AvailabilityResult, simulate_availability
+from .simulation_cache import (
+    SimulationArrays,
+    SimulationCache,
+    compute_simulation_key,
+    get_simulation_cache,
+)
+from .timeseries_binning import bin_wind_timeseries, estimate_binning_aep_error
+from .chunked_simulation import run_chunked_timeseries, DEFAULT_CHUNK_HOURS
+from .power_table import WakePowerTable, cut_in_out_nodes
+from .production_breakdown import energy_breakdown, exceedance_levels
+from .weibull import fit_weibull
+from .power_curve_engine import power_curve_arrays
+from .stability import (
+    StabilityModel,
+    DEFAULT_STABILITY_MODEL,
+    has_stability_data,
+    stability_classes,
+)
 
 
 class WindSite:
@@ -32,6 +56,11 @@ class WindSite:
         ... )
     """
 
+    SIMULATION_METHODS = ('timeseries', 'binned', 'weibull', 'power_curve')
+
+    # Wake models whose deficit depends on turbulence intensity
+    TI_DEPENDENT_WAKE_MODELS = (WakeModel.NIAYIFAR_GAUSSIAN,)
+
     def __init__(
         self,
         wind_data: WindData,
@@ -52,8 +81,54 @@ class WindSite:
         self._simulation_result = None
         self._production_result = None
         self._losses: Optional[WindFarmLosses] = None
+        self._hourly_power: Optional[Tuple[Optional[np.ndarray], bool]] = None
+        self._hysteresis: Optional[HysteresisResult] = None
         self._gross_aep: Optional[float] = None
         self.sector_management: Optional[SectorManagementConfig] = None
+        self._cache: Optional[SimulationCache] = None
+        self._compact_results: Optional[Dict] = None
+        self.air_density_correction = True
+        self.stability_model: Optional[StabilityModel] = None
+
+    @property
+    def wind_data(self) -> WindData:
+        """Wind timeseries data; assigning new data resets the model pool."""
+        return self._wind_data
+
+    @wind_data.setter
+    def wind_data(self, wind_data: WindData):
+        self._wind_data = wind_data
+        self._model_pool: Dict[tuple, object] = {}
+
+    @property
+    def turbine(self) -> Optional[TurbineModel]:
+        """Turbine model; assigning a new model resets the model pool."""
+        return self._turbine
+
+    @turbine.setter
+    def turbine(self, turbine: Optional[TurbineModel]):
+        self._turbine = turbine
+        self._model_pool = {}
+
+    @property
+    def simulation_wind_data(self) -> WindData:
+        """
+        Wind data fed to the simulations.
+
+        With air density correction enabled (the default) and air density in
+        the wind data, wind speeds are normalized to the turbine's reference
+        density (IEC 61400-12-1) in one vectorized pass, pooled until the
+        wind data or turbine change. Otherwise this is wind_data itself.
+        """
+        if not self.air_density_correction or self.turbine is None:
+            return self.wind_data
+
+        key = ('wind_data', self.turbine.reference_air_density)
+        if key not in self._model_pool:
+            self._model_pool[key] = self.wind_data.density_normalized(
+                self.turbine.reference_air_density
+            )
+        return self._model_pool[key]
 
     @classmethod
     def from_wind_data(cls, wind_data: WindData) -> 'WindSite':
@@ -155,6 +230,7 @@ class WindSite:
             from .layout import load_layout
             self.layout = load_layout(layout)
 
+        self._model_pool = {}
         return self
 
     def set_sector_management(
@@ -180,6 +256,137 @@ class WindSite:
         self.sector_management = config
         return self
 
+    def set_air_density_correction(self, enabled: bool = True) -> 'WindSite':
+        """
+        Enable or disable the air density correction (method chaining).
+
+        Only takes effect when the wind data carry air density (or pressure
+        and temperature), e.g. Vortex files read with their atmospheric
+        columns.
+
+        Args:
+            enabled: Normalize wind speeds to the power curve's air density
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> site = site.set_air_density_correction(False)  # standard density
+        """
+        self.air_density_correction = enabled
+        self._model_pool = {}
+        return self
+
+    def set_stability_model(
+        self,
+        model: Optional[StabilityModel] = DEFAULT_STABILITY_MODEL
+    ) -> 'WindSite':
+        """
+        Use stability-dependent turbulence intensity (method chaining).
+
+        Time-series simulations then get an hourly turbulence intensity from
+        each hour's stability class (RMOL / Richardson number columns of
+        the wind data) instead of the plain IEC NTM. Binned flow cases mix
+        hours of different classes and keep the NTM. Only TI-dependent wake
+        models (TI_DEPENDENT_WAKE_MODELS, e.g. 'Niayifar_Gaussian') turn
+        the hourly TI into different wake losses; run_simulation() warns
+        for the others (NOJ and Bastankhah use a fixed wake expansion).
+
+        Args:
+            model: StabilityModel (None to switch back to the IEC NTM)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> site = site.set_stability_model()  # default class tables
+            >>> site.run_simulation(wake_model='Niayifar_Gaussian')
+        """
+        if model is not None and not has_stability_data(self.wind_data):
+            raise ValueError(
+                "Wind data have no 'rmol' or 'richardson' column for the stability model"
+            )
+        self.stability_model = model
+        self._model_pool = {}
+        return self
+
+    def enable_cache(
+        self,
+        cache: Optional[SimulationCache] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        **kwargs
+    ) -> 'WindSite':
+        """
+        Enable caching of PyWake simulation results (method chaining).
+
+        Results are keyed by a hash of the wind timeseries, turbine curves,
+        layout coordinates, wake model and simulation method, so a rerun
+        with unchanged inputs skips PyWake.
+
+        Args:
+            cache: SimulationCache instance to use. If None, the process-wide
+                  cache for cache_dir is used (shared by all WindSite instances)
+            cache_dir: Directory for the on-disk tier (None for memory only)
+            **kwargs: Arguments for SimulationCache when first created
+                     (max_memory_entries, max_disk_mb)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> site = site.enable_cache(cache_dir="results/.pywake_cache")
+        """
+        if cache is None:
+            cache = get_simulation_cache(cache_dir, **kwargs)
+
+        self._cache = cache
+        return self
+
+    def enable_compact_results(
+        self,
+        variables: Sequence[str] = ('Power',),
+        memmap_dir: Optional[Union[str, Path]] = None
+    ) -> 'WindSite':
+        """
+        Keep only selected result variables as float32 arrays (method chaining).
+
+        Subsequent run_simulation() calls drop the PyWake SimulationResult
+        (metadata['pywake_sim_result'] is None) and store the requested
+        variables of the wake run in result.arrays instead, e.g.
+        result.arrays['Power'] with shape (n_turbines, n_timesteps). With
+        memmap_dir the arrays are written there as .npy files and opened
+        read-only memory-mapped; the files are not removed automatically.
+        The hourly loss methods (apply_operational_losses,
+        simulate_hysteresis, simulate_availability) read 'Power' from there.
+
+        Args:
+            variables: PyWake result variables to keep ('Power', 'WS_eff',
+                      'TI_eff', 'CT', ...). Only 'Power' is available for
+                      chunked runs.
+            memmap_dir: Directory for memory-mapped arrays (None keeps them
+                       in memory)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> result = (
+            ...     site.enable_compact_results(('Power', 'WS_eff'), memmap_dir='results/arrays')
+            ...     .run_simulation()
+            ...     .calculate_production()
+            ... )
+            >>> power = result.arrays['Power']  # float32, memory-mapped
+        """
+        variables = tuple(dict.fromkeys(variables))
+        if not variables:
+            raise ValueError("At least one result variable is required")
+
+        self._compact_results = {
+            'variables': variables,
+            'memmap_dir': Path(memmap_dir) if memmap_dir is not None else None
+        }
+        return self
+
     def validate_configuration(self) -> Dict:
         """
         Validate that site is properly configured.
@@ -243,18 +450,46 @@ class WindSite:
         wind_direction_bins: int = 12,
         compute_losses: bool = True,
         validate: bool = True,
-        simulation_method: str = 'timeseries'
+        simulation_method: str = 'timeseries',
+        ws_bin_width: float = 0.25,
+        wd_bin_width: float = 1.0,
+        chunk_hours: Optional[int] = None,
+        n_workers: int = 1,
+        keep_hourly_power: bool = False,
+        sector_aware_wakes: bool = False
     ) -> 'WindSite':
         """
         Run PyWake simulation with optional wake loss computation.
 
         Args:
-            wake_model: Wake model to use ('NOJ', 'Bastankhah_Gaussian', etc.)
+            wake_model: Wake model to use ('NOJ', 'Bastankhah_Gaussian',
+                       'Niayifar_Gaussian', ...); with a stability model
+                       only TI_DEPENDENT_WAKE_MODELS use the hourly TI
             wind_direction_bins: Number of direction bins for simulation
-            compute_losses: If True, run comparative simulations to compute wake losses
+            compute_losses: If True, report farm-level wake and sector loss percentages
+                          (derived from the shared no-wake and wake simulations)
             validate: Whether to validate configuration first
             simulation_method: 'timeseries' for hourly time series simulation,
-                             'weibull' for Weibull distribution simulation
+                             'binned' for time series compressed to unique
+                             (ws, wd) bins and scattered back to hours,
+                             'weibull' for Weibull distribution simulation,
+                             'power_curve' for gross no-wake energy straight
+                             from the power curve (fast screening, no PyWake;
+                             wake_model is ignored)
+            ws_bin_width: Wind speed resolution for 'binned' (m/s)
+            wd_bin_width: Wind direction resolution for 'binned' (degrees)
+            chunk_hours: Split a 'timeseries' run into chunks of this many hours
+                        so memory stays bounded for multi-year records
+            n_workers: Number of worker processes for chunked runs
+                      (>1 enables chunking, DEFAULT_CHUNK_HOURS per chunk
+                      unless chunk_hours is given)
+            keep_hourly_power: For chunked runs, also keep hourly power per
+                              turbine (stored in metadata['hourly_power_w'],
+                              or result.arrays['Power'] for compact results);
+                              memory then grows with the record length
+            sector_aware_wakes: Pass the hourly sector-management operating
+                               mask into PyWake so stopped turbines cast no
+                               wake ('timeseries' only, composes with chunking)
 
         Returns:
             Self for method chaining
@@ -267,130 +502,659 @@ class WindSite:
             >>> # Weibull distribution simulation
             >>> site = site.run_simulation(wake_model='NOJ',
             ...                            simulation_method='weibull')
+            >>>
+            >>> # Binned time series (0.25 m/s × 1°)
+            >>> site = site.run_simulation(simulation_method='binned',
+            ...                            ws_bin_width=0.25, wd_bin_width=1.0)
+            >>>
+            >>> # Gross energy and sector losses only, without PyWake
+            >>> site = site.run_simulation(simulation_method='power_curve')
+            >>>
+            >>> # Ten years of hourly data, one year per chunk on 4 cores
+            >>> site = site.run_simulation(chunk_hours=8760, n_workers=4)
+            >>>
+            >>> # Stopped turbines produce no wake (wake-sector interaction)
+            >>> site = site.run_simulation(sector_aware_wakes=True, chunk_hours=8760)
         """
         if validate:
             self.validate_configuration()
 
+        if simulation_method not in self.SIMULATION_METHODS:
+            raise ValueError(
+                f"Unknown simulation_method '{simulation_method}'. "
+                f"Available: {list(self.SIMULATION_METHODS)}"
+            )
+
+        method_options = {}
+        if simulation_method == 'binned':
+            method_options = {'ws_bin_width': ws_bin_width, 'wd_bin_width': wd_bin_width}
+
+        chunking = None
+        if chunk_hours is not None or n_workers > 1:
+            if simulation_method != 'timeseries':
+                raise ValueError(
+                    "chunk_hours and n_workers require simulation_method='timeseries'"
+                )
+            chunking = {
+                'chunk_hours': chunk_hours,
+                'n_workers': n_workers,
+                'keep_hourly_power': keep_hourly_power
+            }
+
+        sector_aware = sector_aware_wakes and self.sector_management is not None
+        if sector_aware and simulation_method != 'timeseries':
+            raise ValueError("sector_aware_wakes requires simulation_method='timeseries'")
+
+        # Compact results: extra PyWake variables are extracted from the wake run
+        result_variables = ()
+        if self._compact_results is not None:
+            result_variables = tuple(
+                name for name in self._compact_results['variables'] if name != 'Power'
+            )
+            if chunking is not None:
+                if result_variables:
+                    raise ValueError(
+                        f"Chunked runs only keep 'Power', got {list(result_variables)}"
+                    )
+                chunking['keep_hourly_power'] = True
+
         # Convert string to WakeModel enum if needed
         if isinstance(wake_model, str):
             wake_model = WakeModel[wake_model.upper().replace(' ', '_')]
 
-        # Compute wake losses if requested
-        if compute_losses:
-            aep_ideal, wake_loss_pct = self._compute_wake_losses(
-                wake_model,
-                wind_direction_bins,
-                simulation_method
+        if simulation_method == 'power_curve':
+            if result_variables:
+                raise ValueError(
+                    f"simulation_method='power_curve' only keeps 'Power', "
+                    f"got {list(result_variables)}"
+                )
+            # No wakes: the planned no-wake and wake runs collapse into one
+            wake_model = None
+        elif (
+            self.stability_model is not None
+            and simulation_method == 'timeseries'
+            and wake_model is not None
+            and wake_model not in self.TI_DEPENDENT_WAKE_MODELS
+        ):
+            warnings.warn(
+                f"Wake model '{wake_model.value}' ignores turbulence intensity, so the "
+                f"stability model does not change wake losses. Use one of "
+                f"{[model.value for model in self.TI_DEPENDENT_WAKE_MODELS]} instead.",
+                UserWarning,
+                stacklevel=2
             )
-        else:
-            aep_ideal = None
-            wake_loss_pct = 0.0
 
-        # Compute sector losses if sector management enabled
-        if compute_losses and self.sector_management:
-            sector_loss_pct = self._compute_sector_losses(
-                wake_model,
-                wind_direction_bins,
-                simulation_method
+        # Plan the PyWake runs: every loss figure is derived from the same two
+        # distinct simulations (no-wake baseline and wake model), each run once
+        if sector_aware:
+            # Wake run with the operating mask already includes sector curtailment
+            sim_no_wake = self._run_pywake_simulation(
+                None, wind_direction_bins, simulation_method, chunking=chunking
+            )
+            sim_res = self._run_pywake_simulation(
+                wake_model, wind_direction_bins, simulation_method,
+                chunking=chunking, sector_aware=True, variables=result_variables
             )
         else:
-            sector_loss_pct = 0.0
-
-        # Run final simulation (with wakes)
-        sim_res = self._run_pywake_simulation(wake_model, wind_direction_bins, simulation_method)
+            simulations = self._run_planned_simulations(
+                [None, wake_model],
+                wind_direction_bins,
+                simulation_method,
+                chunking=chunking,
+                wake_variables=result_variables,
+                **method_options
+            )
+            sim_no_wake = simulations[None]
+            sim_res = simulations[wake_model]
 
         # ========================================================================
-        # WAKE LOSS CALCULATION: Two-Simulation Approach
+        # LOSS DECOMPOSITION: Two PyWake Runs, Two Modes
         # ========================================================================
-        # NOTE: This approach treats wake losses and sector losses as INDEPENDENT,
-        # which introduces a small approximation error (~0.5-1% farm-level).
-        #
-        # Current Implementation (2 simulations):
-        #   1. Ideal: No wake, no sector management
-        #   2. Realistic: With wake, no sector management
-        #   → Wake loss = Ideal - Realistic
-        #   → Sector loss applied as post-processing (see _apply_sector_management_to_results)
-        #
-        # Known Limitation:
-        #   When a turbine is stopped (sector management), it doesn't create wakes
-        #   for downstream turbines. This reduces wake losses compared to assuming
-        #   all turbines always run. Current approach OVERESTIMATES total losses
-        #   by not accounting for this interaction effect.
-        #
-        # Example:
-        #   - Turbine 3 stopped in wind directions 120-240° (sector management)
-        #   - Turbine 5 (downwind) produces MORE when T3 is stopped (no wake)
-        #   - Current code calculates T5 wake loss assuming T3 always running
-        #   - Result: Wake losses overestimated by ~(sector_loss × wake_fraction)
+        # Both modes use the same two runs, shared by all loss figures:
+        #   1. Ideal: No wake (all turbines operating)
+        #   2. Actual: With wake
         #
-        # Ideal Implementation (future work):
-        #   Would require 3-4 PyWake simulations to properly capture interaction:
-        #   1. No wake, NO sector     → Ideal baseline
-        #   2. No wake, WITH sector   → Pure sector effect
-        #   3. With wake, NO sector   → Pure wake effect
-        #   4. With wake, WITH sector → Combined effect (current reality)
-        #   → This would allow separating: wake + sector + interaction
+        # Post-processing mode (default, sector_aware_wakes=False):
+        #   PyWake runs every turbine in every hour; sector management is
+        #   applied afterwards (see _apply_sector_management_to_results).
+        #   → Wake loss   = Ideal - Actual
+        #   → Sector loss = wake-run energy in prohibited hours
         #
-        # Why Not Implemented:
-        #   PyWake doesn't natively support sector management (assumes continuous
-        #   operation). Sector management is applied as post-processing, so we
-        #   cannot run PyWake "with sector management built-in" to capture the
-        #   reduced wake effects when turbines are stopped.
+        #   Limitation: a stopped turbine still casts its wake on the
+        #   turbines downstream, so wake losses are OVERESTIMATED by the
+        #   wake/sector interaction, roughly sector_loss × wake_fraction.
+        #   Example: T3 stopped for 120-240°, T5 downwind of it produces
+        #   more than computed. With ~6% sector and ~10% wake loss the
+        #   error is about 0.5-1% of farm production.
         #
-        # Error Magnitude:
-        #   Sector loss = ~6% farm-level
-        #   Wake loss = ~10% farm-level
-        #   Interaction effect ≈ 0.6% (second-order)
-        #   → Total error estimate: 0.5-1% of farm production
-        #
-        # TODO: Future enhancement - Implement proper wake-sector interaction
-        #       calculation if PyWake adds sector management support, or develop
-        #       custom post-processing to estimate interaction correction factor.
+        # Sector-aware mode (sector_aware_wakes=True, 'timeseries' only):
+        #   The wake run gets the per-timestep operating mask through
+        #   PyWake's 'operating' input, so stopped turbines cast no wake and
+        #   the interaction is part of the simulated production. Losses are
+        #   decomposed sector-first:
+        #   → Sector loss = no-wake energy in prohibited hours
+        #   → Wake loss   = Ideal - Sector loss - Actual
+        #   Prefer this mode when the interaction matters; the default keeps
+        #   results comparable with earlier reports.
         # ========================================================================
 
-        # Run NO-WAKE simulation to get ideal production per turbine
-        sim_no_wake = self._run_pywake_simulation(None, wind_direction_bins, simulation_method)
-        ideal_per_turbine = self._get_aep_per_turbine(sim_no_wake)  # Without wake, without sector
-
-        # Extract results WITH wake and apply sector management
-        aep_per_turbine, sector_loss_per_turbine = self._apply_sector_management_to_results(
-            sim_res,
-            wind_direction_bins,
-            return_losses=True
-        )  # GWh per turbine (with sector curtailment if applicable)
+        if sector_aware:
+            losses = self._decompose_sector_aware_losses(
+                sim_no_wake, sim_res, wind_direction_bins
+            )
+        else:
+            losses = self._decompose_losses(sim_no_wake, sim_res, wind_direction_bins)
+        ideal_per_turbine = losses['ideal_per_turbine']  # Without wake, without sector
+        aep_per_turbine = losses['aep_per_turbine']  # With wake and sector curtailment
+        sector_loss_per_turbine = losses['sector_loss_per_turbine']
+        wake_loss_per_turbine = losses['wake_loss_per_turbine']
         aep_gross = aep_per_turbine.sum()
 
-        # Calculate per-turbine wake losses
-        # Wake loss = (ideal - production_with_wake_and_sector) - sector_loss
-        # Because sector management was applied to BOTH ideal and actual
-        production_with_wake_no_sector = self._get_aep_per_turbine(sim_res)
-        wake_loss_per_turbine = ideal_per_turbine - production_with_wake_no_sector
+        if compute_losses:
+            aep_ideal = float(ideal_per_turbine.sum())
+            wake_loss_pct = losses['wake_loss_percent']
+            sector_loss_pct = losses['sector_loss_percent'] if self.sector_management else 0.0
+        else:
+            aep_ideal = None
+            wake_loss_pct = 0.0
+            sector_loss_pct = 0.0
 
         # Create result dataclass
         self._simulation_result = WindSimulationResult(
             aep_gwh=aep_gross,  # This includes wake + sector effects
             capacity_factor=self._calculate_capacity_factor(aep_gross),
             wake_loss_percent=wake_loss_pct,
-            turbine_production_gwh=aep_per_turbine.tolist(),
+            turbine_production_gwh=self._per_turbine_values(aep_per_turbine),
             wake_model=wake_model,
             sector_loss_percent=sector_loss_pct,
             metadata={
                 'n_turbines': self.layout.n_turbines,
                 'total_capacity_mw': self.turbine.rated_power * self.layout.n_turbines / 1000,
                 'wind_direction_bins': wind_direction_bins,
-                'simulation_type': 'pywake',
+                'simulation_type': 'power_curve' if simulation_method == 'power_curve' else 'pywake',
                 'aep_ideal': aep_ideal,  # Baseline (no wake, no sector)
                 'has_sector_management': self.sector_management is not None,
-                'pywake_sim_result': sim_res,  # Store PyWake simulation result object
+                'sector_aware_wakes': sector_aware,
+                'air_density_normalized': self.simulation_wind_data is not self.wind_data,
+                'stability_ti': self.stability_model is not None and simulation_method == 'timeseries',
+                'pywake_sim_result': sim_res.pywake_result,  # None when served from cache
                 # Per-turbine loss arrays (GWh/yr per turbine)
-                'ideal_per_turbine_gwh': ideal_per_turbine.tolist(),
-                'wake_loss_per_turbine_gwh': wake_loss_per_turbine.tolist(),
-                'sector_loss_per_turbine_gwh': sector_loss_per_turbine.tolist()
-            }
+                'ideal_per_turbine_gwh': self._per_turbine_values(ideal_per_turbine),
+                'wake_loss_per_turbine_gwh': self._per_turbine_values(wake_loss_per_turbine),
+                'sector_loss_per_turbine_gwh': self._per_turbine_values(sector_loss_per_turbine)
+            },
+            hourly_energy=self._hourly_farm_energy(sim_no_wake, sim_res, sector_aware)
         )
+        # Wake-run power for the hourly loss methods (None for reduced runs);
+        # compact results read result.arrays['Power'] on demand instead
+        hourly = self._simulation_result.hourly_energy is not None
+        keep_power = hourly and self._compact_results is None
+        self._hourly_power = (sim_res.power_w if keep_power else None, sector_aware) if hourly else None
+        self._hysteresis = None
+
+        if simulation_method == 'binned':
+            self._simulation_result.metadata['binning'] = self._binning_summary(
+                ws_bin_width,
+                wd_bin_width
+            )
+
+        if chunking is not None:
+            n_hours = len(self.wind_data.timeseries)
+            effective_chunk = chunk_hours or DEFAULT_CHUNK_HOURS
+            self._simulation_result.metadata['chunking'] = {
+                'chunk_hours': effective_chunk,
+                'n_chunks': int(np.ceil(n_hours / effective_chunk)),
+                'n_workers': n_workers
+            }
+            if keep_hourly_power and self._compact_results is None:
+                self._simulation_result.metadata['hourly_power_w'] = sim_res.power_w
+
+        if self._compact_results is not None:
+            self._simulation_result.metadata['pywake_sim_result'] = None
+            self._simulation_result.metadata['result_variables'] = list(
+                self._compact_results['variables']
+            )
+            self._simulation_result.arrays.update(self._compact_arrays(sim_res))
 
         return self
 
+    def _hourly_farm_energy(
+        self,
+        sim_no_wake: SimulationArrays,
+        sim_res: SimulationArrays,
+        sector_aware: bool
+    ) -> Optional[pd.DataFrame]:
+        """
+        Hourly farm energy and losses on the wind data's time index.
+
+        Uses the same decomposition as the per-turbine figures, so the
+        annualized column sums reproduce them.
+
+        Args:
+            sim_no_wake: No-wake baseline run
+            sim_res: Wake run (with operating mask if sector_aware)
+            sector_aware: Whether sim_res already includes sector curtailment
+
+        Returns:
+            DataFrame with ENERGY_COLUMNS in MWh, or None without hourly
+            power (Weibull and reduced chunked runs)
+        """
+        if not (sim_no_wake.is_timeseries and sim_res.is_timeseries):
+            return None
+        if sim_no_wake.power_w is None or sim_res.power_w is None:
+            return None
+
+        # Hourly power (W) × 1 h → MWh
+        ideal = sim_no_wake.power_w.sum(axis=0) / 1e6
+        wake_power = sim_res.power_w.sum(axis=0) / 1e6
+
+        sector = np.zeros_like(ideal)
+        if self.sector_management:
+            from .sector_management import SectorEngine
+
+            wd = self.wind_data.timeseries['wd'].values
+            stopped = ~SectorEngine.from_config(self.sector_management).operating_mask(
+                wd, self.layout.n_turbines
+            ).T
+            source = sim_no_wake.power_w if sector_aware else sim_res.power_w
+            sector = np.where(stopped, source, 0.0).sum(axis=0) / 1e6
+
+        if sector_aware:
+            net = wake_power
+            wake_loss = ideal - sector - net
+        else:
+            net = wake_power - sector
+            wake_loss = ideal - wake_power
+
+        return pd.DataFrame({
+            'ideal_mwh': ideal,
+            'wake_loss_mwh': wake_loss,
+            'sector_loss_mwh': sector,
+            'other_loss_mwh': np.zeros_like(ideal),
+            'net_mwh': net
+        }, index=self.wind_data.timeseries.index)
+
+    def energy_breakdown(self, by: str = 'year') -> pd.DataFrame:
+        """
+        Farm energy and losses per year, month, month of year or hour of day.
+
+        All periods come from the single run_simulation() time series (and
+        include other losses once apply_losses() has run).
+
+        Args:
+            by: 'year', 'month', 'month_of_year' or 'hour'
+
+        Returns:
+            DataFrame per period, see production_breakdown.energy_breakdown
+
+        Example:
+            >>> site.run_simulation().apply_losses()
+            >>> yearly = site.energy_breakdown('year')
+            >>> profile = site.energy_breakdown('hour')
+        """
+        return energy_breakdown(self._require_hourly_energy(), by=by)
+
+    def exceedance_levels(
+        self,
+        levels: Sequence[float] = (50, 90),
+        method: str = 'normal',
+        min_coverage: float = 0.9
+    ) -> Dict[str, float]:
+        """
+        P50/P90 net AEP from the inter-annual variability of the record.
+
+        Calendar years with less than min_coverage of 8760 hours are left
+        out; the others contribute their annualized net energy.
+
+        Args:
+            levels: Exceedance probabilities in percent
+            method: 'normal' or 'empirical' (see exceedance_levels)
+            min_coverage: Minimum fraction of a year with data
+
+        Returns:
+            Dict like {'P50': ..., 'P90': ...} in GWh/year
+
+        Example:
+            >>> site.run_simulation().apply_losses().exceedance_levels((50, 90))
+        """
+        yearly = self.energy_breakdown('year')
+        complete = yearly[yearly['hours'] >= min_coverage * 8760]
+        if len(complete) < 2:
+            raise ValueError(
+                f"P-values need at least two years with {min_coverage:.0%} coverage, "
+                f"got {len(complete)}"
+            )
+
+        return exceedance_levels(complete['annualized_net_gwh'].values, levels, method)
+
+    def _require_hourly_energy(self) -> pd.DataFrame:
+        """Hourly farm energy of the current result, or a helpful error."""
+        if self._simulation_result is None:
+            raise ValueError("No simulation results available. Run run_simulation() first.")
+
+        hourly = self._simulation_result.hourly_energy
+        if hourly is None:
+            raise ValueError(
+                "Temporal breakdown needs hourly power: use simulation_method="
+                "'timeseries' or 'binned' (with keep_hourly_power=True for chunked runs)"
+            )
+        return hourly
+
+    def _compact_arrays(self, sim_result: SimulationArrays) -> Dict[str, np.ndarray]:
+        """
+        Requested result variables as float32 arrays for a compact result.
+
+        Args:
+            sim_result: SimulationArrays of the wake run
+
+        Returns:
+            Dict of variable name to float32 array, memory-mapped when a
+            memmap_dir is configured (see enable_compact_results)
+        """
+        import uuid
+
+        memmap_dir = self._compact_results['memmap_dir']
+        run_id = uuid.uuid4().hex[:12]
+        arrays = {}
+
+        for name in self._compact_results['variables']:
+            values = sim_result.power_w if name == 'Power' else sim_result.variables[name]
+            values = np.asarray(values, dtype=np.float32)
+
+            if memmap_dir is not None:
+                memmap_dir.mkdir(parents=True, exist_ok=True)
+                path = memmap_dir / f"{name}_{run_id}.npy"
+                np.save(path, values)
+                values = np.load(path, mmap_mode='r')
+
+            arrays[name] = values
+
+        return arrays
+
+    def _per_turbine_values(self, values: np.ndarray) -> Union[List[float], np.ndarray]:
+        """
+        Per-turbine GWh figures as stored in a result.
+
+        Args:
+            values: Array of shape (n_turbines,)
+
+        Returns:
+            float32 array for compact results (see enable_compact_results),
+            else a list of floats
+        """
+        if self._compact_results is not None:
+            return np.asarray(values, dtype=np.float32)
+        return np.asarray(values).tolist()
+
+    def build_power_table(
+        self,
+        wake_model: Optional[Union[str, WakeModel]] = WakeModel.NOJ,
+        ws_step: float = 0.5,
+        wd_step: float = 1.0,
+        ws_max: float = 30.0,
+        table_dir: Optional[Union[str, Path]] = None
+    ) -> WakePowerTable:
+        """
+        Precompute the wake-aware power table P_i(ws, wd) of this farm.
+
+        Every (ws, wd) grid point is simulated once as a PyWake time-series
+        flow case. The table depends only on the turbine, layout and wake
+        model, so it can then evaluate any wind timeseries by lookup (see
+        WakePowerTable.power). The power curve's cut-in and cut-out speeds
+        are added to the wind speed grid (see cut_in_out_nodes). With
+        table_dir the table is stored as ``power_table_<key>.npz`` and
+        reused when the same inputs are requested again.
+
+        Args:
+            wake_model: Wake model (None for a no-wake table)
+            ws_step: Wind speed grid spacing (m/s)
+            wd_step: Wind direction grid spacing (degrees, must divide 360)
+            ws_max: Largest wind speed on the grid (m/s), at least the
+                   turbine's cut-out wind speed
+            table_dir: Directory for persisted tables (None to skip)
+
+        Returns:
+            WakePowerTable for this turbine, layout and wake model
+
+        Example:
+            >>> table = site.build_power_table('NOJ', table_dir='results/tables')
+            >>> aep = table.aep_per_turbine(new_ws, new_wd)
+        """
+        if self.turbine is None or self.layout is None:
+            raise ValueError("Turbine and layout must be set before building a power table")
+        if ws_step <= 0 or ws_max <= ws_step:
+            raise ValueError("ws_step must be positive and smaller than ws_max")
+        cut_out_ws = self.turbine.cut_out_wind_speed
+        if ws_max < cut_out_ws:
+            raise ValueError(
+                f"ws_max ({ws_max} m/s) must not be below the turbine's cut-out "
+                f"wind speed ({cut_out_ws} m/s)"
+            )
+
+        n_wd = int(round(360.0 / wd_step))
+        if wd_step <= 0 or not np.isclose(n_wd * wd_step, 360.0):
+            raise ValueError(f"wd_step must divide 360°, got {wd_step}")
+
+        if isinstance(wake_model, str):
+            wake_model = WakeModel[wake_model.upper().replace(' ', '_')]
+
+        ws_grid = np.union1d(
+            np.arange(int(round(ws_max / ws_step)) + 1) * ws_step,
+            cut_in_out_nodes(
+                self.turbine.spec.power_curve['ws'].values,
+                self.turbine.spec.power_curve['power'].values
+            )
+        )
+        wd_grid = np.arange(n_wd) * wd_step
+
+        x, y = self.layout.to_pywake_format()
+        key = compute_simulation_key(
+            ws=ws_grid,
+            wd=wd_grid,
+            turbine_spec=self.turbine.spec,
+            x=x,
+            y=y,
+            wake_model=wake_model.value if wake_model is not None else None,
+            simulation_method='power_table'
+        )
+
+        path = None
+        if table_dir is not None:
+            path = Path(table_dir) / f"power_table_{key[:16]}.npz"
+            if path.exists():
+                return WakePowerTable.load(path)
+
+        # Flow cases in (wd, ws) order so the power reshapes to the grid
+        wd_cases, ws_cases = np.meshgrid(wd_grid, ws_grid, indexing='ij')
+        sim_result = self._execute_pywake_simulation(
+            wake_model,
+            12,
+            'timeseries',
+            ws=ws_cases.ravel(),
+            wd=wd_cases.ravel(),
+            P=np.ones(ws_cases.size)
+        )
+        power = sim_result.Power.transpose('wt', 'time').values
+
+        table = WakePowerTable(
+            ws=ws_grid,
+            wd=wd_grid,
+            power_w=power.reshape(self.layout.n_turbines, n_wd, len(ws_grid)),
+            metadata={
+                'turbine': self.turbine.name,
+                'wake_model': wake_model.value if wake_model is not None else None,
+                'n_turbines': self.layout.n_turbines,
+                'key': key
+            }
+        )
+
+        if path is not None:
+            table.save(path)
+
+        return table
+
+    def validate_power_table(self, table: WakePowerTable) -> pd.DataFrame:
+        """
+        Compare power-table lookup with a direct time-series simulation.
+
+        Both use this site's wind timeseries and the table's wake model;
+        the direct run is served from the result cache when enabled.
+        Sector management is not applied to either side. Like the table,
+        the direct run uses the IEC NTM turbulence intensity, also when a
+        stability model is set.
+
+        Args:
+            table: Table from build_power_table()
+
+        Returns:
+            DataFrame per turbine (plus a 'TOTAL' row) with direct and lookup
+            AEP (GWh/year), AEP error (%) and hourly RMSE (kW)
+
+        Example:
+            >>> report = site.validate_power_table(table)
+            >>> print(report.loc['TOTAL', 'aep_error_percent'])
+        """
+        wake_model = table.metadata.get('wake_model')
+        if wake_model is not None:
+            wake_model = WakeModel(wake_model)
+
+        timeseries = self.simulation_wind_data.timeseries
+        direct_power = self._run_ntm_timeseries(wake_model).power_w
+        lookup_power = table.power(
+            timeseries['ws'].values,
+            timeseries['wd'].values
+        )
+
+        n_hours = direct_power.shape[1]
+        direct_aep = direct_power.sum(axis=1) * (8760 / n_hours) * 1e-9
+        lookup_aep = lookup_power.sum(axis=1) * (8760 / n_hours) * 1e-9
+        rmse_kw = np.sqrt(np.mean((lookup_power - direct_power) ** 2, axis=1)) / 1000
+
+        report = pd.DataFrame({
+            'direct_aep_gwh': np.append(direct_aep, direct_aep.sum()),
+            'lookup_aep_gwh': np.append(lookup_aep, lookup_aep.sum()),
+            'hourly_rmse_kw': np.append(rmse_kw, np.sqrt(np.mean(rmse_kw ** 2)))
+        }, index=[f'T{i + 1}' for i in range(len(direct_aep))] + ['TOTAL'])
+
+        direct_aep_gwh = report['direct_aep_gwh'].replace(0.0, np.nan)
+        report['aep_error_percent'] = (
+            (report['lookup_aep_gwh'] - report['direct_aep_gwh']) / direct_aep_gwh * 100
+        ).fillna(0.0)
+
+        return report
+
+    def evaluate_binning_error(
+        self,
+        resolutions: Sequence[Tuple[float, float]] = ((0.1, 1.0), (0.25, 1.0), (0.5, 2.0), (1.0, 5.0)),
+        wake_model: Union[str, WakeModel] = WakeModel.NOJ
+    ) -> pd.DataFrame:
+        """
+        Compare binned simulations against the full timeseries simulation.
+
+        Runs the full timeseries once (served from cache if enabled) and a
+        binned simulation per resolution, reporting the farm AEP error so a
+        resolution can be chosen sensibly. Binned flow cases use the IEC NTM
+        turbulence intensity, so the reference does too when a stability
+        model is set; the error is then due to binning alone.
+
+        Args:
+            resolutions: List of (ws_bin_width, wd_bin_width) pairs
+            wake_model: Wake model used for all runs
+
+        Returns:
+            DataFrame with one row per resolution: n_bins, compression_ratio,
+            aep_gwh, aep_error_percent and gross_aep_error_percent
+
+        Example:
+            >>> errors = site.evaluate_binning_error([(0.25, 1.0), (0.5, 2.0)])
+            >>> print(errors[['ws_bin_width', 'wd_bin_width', 'aep_error_percent']])
+        """
+        self.validate_configuration()
+
+        if isinstance(wake_model, str):
+            wake_model = WakeModel[wake_model.upper().replace(' ', '_')]
+
+        reference = self._run_ntm_timeseries(wake_model)
+        aep_reference = reference.aep_per_turbine().sum()
+
+        rows = []
+        for ws_bin_width, wd_bin_width in resolutions:
+            binned = self._run_pywake_simulation(
+                wake_model,
+                12,
+                'binned',
+                ws_bin_width=ws_bin_width,
+                wd_bin_width=wd_bin_width
+            )
+            aep_binned = binned.aep_per_turbine().sum()
+            summary = self._binning_summary(ws_bin_width, wd_bin_width)
+
+            rows.append({
+                **summary,
+                'aep_gwh': aep_binned,
+                'aep_reference_gwh': aep_reference,
+                'aep_error_percent': (aep_binned - aep_reference) / aep_reference * 100
+                if aep_reference else 0.0
+            })
+
+        return pd.DataFrame(rows)
+
+    def _run_ntm_timeseries(self, wake_model: Optional[WakeModel]) -> SimulationArrays:
+        """
+        Time-series run with the IEC NTM turbulence intensity.
+
+        Binned runs and power tables simulate their flow cases with the NTM,
+        so their time-series references must not pick up the stability TI.
+
+        Args:
+            wake_model: Wake model (None for no-wake baseline)
+
+        Returns:
+            SimulationArrays of the full wind record
+        """
+        if self.stability_model is None:
+            return self._run_pywake_simulation(wake_model, 12, 'timeseries')
+
+        ws = self.simulation_wind_data.timeseries['ws'].values
+        return SimulationArrays.from_pywake(self._execute_pywake_simulation(
+            wake_model,
+            12,
+            'timeseries',
+            ti=self._ntm_turbulence_intensity(ws)
+        ))
+
+    def _binning_summary(self, ws_bin_width: float, wd_bin_width: float) -> Dict:
+        """
+        Summarize the compression of a binned simulation.
+
+        Args:
+            ws_bin_width: Wind speed resolution (m/s)
+            wd_bin_width: Wind direction resolution (degrees)
+
+        Returns:
+            Dictionary with bin counts and the power-curve AEP error estimate
+        """
+        ws = self.simulation_wind_data.timeseries['ws'].values
+        binned = bin_wind_timeseries(
+            ws,
+            self.simulation_wind_data.timeseries['wd'].values,
+            ws_resolution=ws_bin_width,
+            wd_resolution=wd_bin_width
+        )
+
+        return {
+            'ws_bin_width': ws_bin_width,
+            'wd_bin_width': wd_bin_width,
+            'n_hours': binned.n_hours,
+            'n_bins': binned.n_bins,
+            'compression_ratio': binned.compression_ratio,
+            'gross_aep_error_percent': estimate_binning_aep_error(
+                ws,
+                binned,
+                self.turbine.power_at_wind_speed
+            )
+        }
+
     def apply_losses(
         self,
         loss_config_file: Optional[str] = None,
@@ -437,14 +1201,353 @@ class WindSite:
             ...     availability_turbines=0.02  # Override CSV value
             ... ).calculate_production()
         """
-        import pandas as pd
-        from pathlib import Path
+        if self._simulation_result is None:
+            raise ValueError(
+                "No simulation results available. Run run_simulation() first."
+            )
+
+        # Get AEP from simulation (already includes wake + sector)
+        aep_gross = self._simulation_result.aep_gwh
+
+        # Create losses manager (only non-PyWake losses)
+        self._losses, loss_config_file = self._configured_losses(loss_config_file, overrides)
+
+        # Calculate net AEP (only applying non-PyWake losses)
+        aep_net = self._losses.calculate_net_aep(aep_gross)
+
+        # Calculate per-turbine other losses (applied uniformly as farm-level percentage)
+        # NOTE: calculate_total_loss_factor() returns the REMAINING production factor (e.g., 0.912)
+        # NOT the loss factor (e.g., 0.088), so we need to swap the assignments
+        remaining_factor = self._losses.calculate_total_loss_factor()  # e.g., 0.912 for 8.8% losses
+        turbine_prod_before_other = np.array(self._simulation_result.turbine_production_gwh)
+        turbine_prod_net = turbine_prod_before_other * remaining_factor  # Net = 91.2% of gross
+        other_loss_per_turbine = turbine_prod_before_other * (1 - remaining_factor)  # Loss = 8.8% of gross
+
+        # Build complete loss breakdown (wake + sector + others)
+        complete_breakdown = self._build_complete_loss_breakdown()
+
+        # Calculate total loss factor (ideal → net)
+        total_loss_factor = self._calculate_total_loss_factor(aep_net)
+
+        # Update result with net AEP and losses
+        self._simulation_result = WindSimulationResult(
+            aep_gwh=aep_net,  # Net AEP
+            capacity_factor=self._calculate_capacity_factor(aep_net),
+            wake_loss_percent=self._simulation_result.wake_loss_percent,
+            turbine_production_gwh=self._per_turbine_values(turbine_prod_net),  # Net production per turbine
+            wake_model=self._simulation_result.wake_model,
+            sector_loss_percent=self._simulation_result.sector_loss_percent,
+            gross_aep_gwh=aep_gross,
+            loss_breakdown=complete_breakdown,
+            total_loss_factor=total_loss_factor,
+            metadata={
+                **self._simulation_result.metadata,
+                'losses_applied': True,
+                'loss_config_file': str(loss_config_file),
+                'other_loss_per_turbine_gwh': self._per_turbine_values(other_loss_per_turbine)  # Add per-turbine other losses
+            },
+            arrays=self._simulation_result.arrays,
+            hourly_energy=self._hourly_energy_after_losses(remaining_factor)
+        )
+
+        return self
+
+    def apply_operational_losses(
+        self,
+        loss_config_file: Optional[str] = None,
+        transforms: Optional[Dict[str, LossTransform]] = None,
+        seed: Optional[int] = 0,
+        chunk_hours: int = DEFAULT_CHUNK_HOURS,
+        **overrides
+    ) -> 'WindSite':
+        """
+        Apply non-PyWake losses hour by hour instead of as one factor.
+
+        Same loss categories and configuration as apply_losses(), but each
+        category is applied as a (turbine × time) transform of the hourly
+        net power (see loss_engine): stochastic outages for availability,
+        a load-dependent electrical loss curve and a degradation ramp over
+        the operating years by default. Shaped categories are calibrated to
+        their nominal value, so the breakdown reconciles with apply_losses();
+        outages realize their nominal value in expectation. After
+        simulate_hysteresis(), its stopped hours are applied as they are.
+
+        The hourly net power per turbine is stored as float32 in
+        result.arrays['NetPower'] and the farm totals in hourly_energy;
+        metadata['operational_losses'] only holds the per-category summary
+        and loss per turbine (GWh/year) as records/lists, so the result
+        stays JSON-exportable.
+
+        Args:
+            loss_config_file: Path to losses CSV file (see apply_losses)
+            transforms: LossTransform per category name, overriding the
+                       defaults (loss_engine.default_transforms)
+            seed: Seed of the stochastic outages
+            chunk_hours: Hours processed per chunk
+            **overrides: Manual overrides for specific losses
 
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> result = site.run_simulation().apply_operational_losses(seed=7).calculate_production()
+            >>> hourly_net_mwh = result.hourly_energy['net_mwh']
+            >>> net_power_w = result.arrays['NetPower']
+            >>> pd.DataFrame(result.metadata['operational_losses']['summary'])
+        """
+        if self._simulation_result is None:
+            raise ValueError(
+                "No simulation results available. Run run_simulation() first."
+            )
+        if self._simulation_result.metadata.get('losses_applied'):
+            raise ValueError("Losses already applied. Run run_simulation() again first.")
+        power_w = self._hourly_net_power()
+
+        self._losses, loss_config_file = self._configured_losses(loss_config_file, overrides)
+
+        # Computed hysteresis: the simulated stopped hours themselves
+        hysteresis = self._losses.get_categories().get(LossType.HIGH_HYSTERESIS.value)
+        if self._hysteresis is not None and hysteresis is not None and hysteresis.is_computed:
+            transforms = {
+                LossType.HIGH_HYSTERESIS.value: StoppedMaskLoss(self._hysteresis.stopped),
+                **(transforms or {})
+            }
+
+        engine = OperationalLossEngine.from_losses(
+            self._losses, transforms=transforms, seed=seed, chunk_hours=chunk_hours
+        )
+        result = engine.apply(power_w, self.wind_data.timeseries.index, self.turbine.rated_power)
+
+        # Realized per-turbine ratios keep the simulation's annualization
+        aep_gross = self._simulation_result.aep_gwh
+        turbine_prod_before_other = np.array(self._simulation_result.turbine_production_gwh)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(
+                result.gross_per_turbine_gwh > 0,
+                result.net_per_turbine_gwh / result.gross_per_turbine_gwh,
+                1.0
+            )
+        turbine_prod_net = turbine_prod_before_other * ratio
+        aep_net = float(turbine_prod_net.sum())
+
+        complete_breakdown = self._build_complete_loss_breakdown()
+        for name, realized in result.summary['realized_percent'].items():
+            complete_breakdown[name]['realized_percentage'] = float(realized)
+
+        hourly = self._simulation_result.hourly_energy.copy()
+        hourly['other_loss_mwh'] = result.hourly_loss_mwh.sum(axis=1).values
+        hourly['net_mwh'] = result.net_power_w.sum(axis=0) / 1e6
+
+        self._simulation_result = WindSimulationResult(
+            aep_gwh=aep_net,
+            capacity_factor=self._calculate_capacity_factor(aep_net),
+            wake_loss_percent=self._simulation_result.wake_loss_percent,
+            turbine_production_gwh=self._per_turbine_values(turbine_prod_net),
+            wake_model=self._simulation_result.wake_model,
+            sector_loss_percent=self._simulation_result.sector_loss_percent,
+            gross_aep_gwh=aep_gross,
+            loss_breakdown=complete_breakdown,
+            total_loss_factor=self._calculate_total_loss_factor(aep_net),
+            metadata={
+                **self._simulation_result.metadata,
+                'losses_applied': True,
+                'loss_config_file': str(loss_config_file),
+                'other_loss_per_turbine_gwh': self._per_turbine_values(
+                    turbine_prod_before_other - turbine_prod_net
+                ),
+                'operational_losses': {
+                    'summary': result.summary.reset_index().to_dict('records'),
+                    'turbine_loss_gwh': result.turbine_loss_gwh.T.to_dict('list')
+                }
+            },
+            arrays={
+                **self._simulation_result.arrays,
+                'NetPower': result.net_power_w.astype(np.float32)
+            },
+            hourly_energy=hourly
+        )
+
+        return self
+
+    def simulate_hysteresis(
+        self,
+        cut_out_ws: Optional[float] = None,
+        restart_ws: Optional[float] = None
+    ) -> HysteresisResult:
+        """
+        High-wind hysteresis loss from the hourly wind speed sequence.
+
+        Runs the cut-out/restart state machine (see
+        losses.simulate_high_wind_hysteresis) over the effective wind speed
+        of every turbine: the wake run's 'WS_eff' when kept (compact results
+        or a fresh PyWake result), else the free-stream wind speed, both as
+        physical (not density-normalized) wind speeds. The
+        result replaces the high_hysteresis_losses value of losses.csv in
+        subsequent apply_losses() / apply_operational_losses() calls, as a
+        computed loss category, unless that loss is overridden explicitly.
+
+        Args:
+            cut_out_ws: Cut-out wind speed (default: turbine's cut_out_wind_speed)
+            restart_ws: Restart wind speed (default: cut-out - 3 m/s, or
+                       turbine metadata 'restart_ws')
+
+        Returns:
+            HysteresisResult with per-turbine losses and stop episodes
+
+        Example:
+            >>> site.run_simulation()
+            >>> hysteresis = site.simulate_hysteresis(restart_ws=22.0)
+            >>> site.apply_losses().calculate_production().loss_breakdown['high_hysteresis_losses']
+        """
+        power_w = self._hourly_net_power()
+
+        if cut_out_ws is None:
+            cut_out_ws = self.turbine.cut_out_wind_speed
+        if restart_ws is None:
+            restart_ws = self.turbine.spec.metadata.get('restart_ws')
+
+        index = self.wind_data.timeseries.index
+        hours_per_sample = (
+            float(np.median(np.diff(index.asi8))) / 3.6e12 if len(index) > 1 else 1.0
+        )
+
+        self._hysteresis = simulate_high_wind_hysteresis(
+            self._effective_wind_speed(),
+            power_w,
+            cut_out_ws=cut_out_ws,
+            restart_ws=restart_ws,
+            hours_per_sample=hours_per_sample
+        )
+        return self._hysteresis
+
+    def simulate_availability(
+        self,
+        n_realizations: int = 1000,
+        availability: Optional[float] = None,
+        mttr_hours: float = 72.0,
+        seed: Optional[int] = 0
+    ) -> AvailabilityResult:
+        """
+        Annual energy distribution under random turbine failures (Monte Carlo).
+
+        Replaces the fixed availability_turbines fraction by random failure
+        and repair events per turbine (see availability module), applied to
+        the hourly power after wake and sector losses. Other losses are not
+        included.
+
+        Args:
+            n_realizations: Number of Monte Carlo realizations
+            availability: Mean time-based availability (default: 1 minus the
+                         availability_turbines loss of apply_losses(), or the
+                         WindPRO default)
+            mttr_hours: Mean time to repair
+            seed: Seed of the random generator
+
+        Returns:
+            AvailabilityResult with the energy per realization and year
+
+        Example:
+            >>> outages = site.run_simulation().simulate_availability(5000, mttr_hours=96)
+            >>> outages.exceedance_levels((50, 90), by='year')
+        """
+        power_w = self._hourly_net_power()
+
+        if availability is None:
+            name = LossType.AVAILABILITY_TURBINES.value
+            categories = self._losses.get_categories() if self._losses is not None else {}
+            loss = categories[name].value if name in categories else WindFarmLosses.DEFAULTS[
+                LossType.AVAILABILITY_TURBINES
+            ]
+            availability = 1 - loss
+
+        return simulate_availability(
+            power_w,
+            self.wind_data.timeseries.index,
+            OutageModel.from_availability(availability, mttr_hours=mttr_hours),
+            n_realizations=n_realizations,
+            seed=seed
+        )
+
+    def _hourly_net_power(self) -> np.ndarray:
+        """
+        Hourly power per turbine after wake and sector losses.
+
+        Compact results are read from result.arrays['Power'] (float32,
+        possibly memory-mapped) rather than held by the site.
+
+        Returns:
+            Power in W, shape (n_turbines, n_hours)
+        """
         if self._simulation_result is None:
             raise ValueError(
                 "No simulation results available. Run run_simulation() first."
             )
+        if self._hourly_power is None:
+            raise ValueError(
+                "Hourly losses need hourly power: use simulation_method="
+                "'timeseries' or 'binned' (with keep_hourly_power=True for chunked runs)"
+            )
+
+        power_w, sector_aware = self._hourly_power
+        if power_w is None:
+            power_w = self._simulation_result.arrays.get('Power')
+            if power_w is None:
+                raise ValueError(
+                    "Hourly losses on compact results need 'Power' in "
+                    "enable_compact_results(variables)"
+                )
+        if self.sector_management and not sector_aware:
+            from .sector_management import SectorEngine
+
+            wd = self.wind_data.timeseries['wd'].values
+            operating = SectorEngine.from_config(self.sector_management).operating_mask(
+                wd, self.layout.n_turbines
+            ).T
+            power_w = np.where(operating, power_w, 0.0)
+        return power_w
+
+    def _effective_wind_speed(self) -> np.ndarray:
+        """
+        Hourly wind speed per turbine for the hysteresis state machine.
+
+        Cut-out and restart act on the physical wind speed, so 'WS_eff' of
+        a density-normalized run (see simulation_wind_data) is scaled back
+        with the hourly ratio of physical to simulated free-stream speed.
+
+        Returns:
+            'WS_eff' of the wake run if kept with hourly resolution, else the
+            free-stream wind speed (broadcast over turbines)
+        """
+        shape = (self.layout.n_turbines, len(self.wind_data.timeseries))
+        ws = self.wind_data.timeseries['ws'].to_numpy(dtype=float)
+
+        ws_eff = self._simulation_result.arrays.get('WS_eff')
+        pywake_result = self._simulation_result.metadata.get('pywake_sim_result')
+        if ws_eff is None and pywake_result is not None and 'WS_eff' in pywake_result:
+            ws_eff = pywake_result['WS_eff'].values
+        if ws_eff is not None and np.shape(ws_eff) == shape:
+            simulated_ws = self.simulation_wind_data.timeseries['ws'].to_numpy(dtype=float)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                ratio = np.where(simulated_ws > 0, ws / simulated_ws, 1.0)
+            return np.asarray(ws_eff, dtype=float) * ratio
+
+        return np.broadcast_to(ws, shape)
+
+    def _configured_losses(
+        self,
+        loss_config_file: Optional[str],
+        overrides: Dict[str, float]
+    ) -> Tuple[WindFarmLosses, Path]:
+        """
+        Non-PyWake loss categories from defaults, CSV file and overrides.
+
+        Args:
+            loss_config_file: Path to losses CSV file (None for the default)
+            overrides: Manual overrides for specific losses
 
+        Returns:
+            Tuple of (WindFarmLosses, CSV path used)
+        """
         # Determine CSV path
         if loss_config_file is None:
             # Default to Inputdata/losses.csv
@@ -470,12 +1573,8 @@ class WindSite:
         # Override with manual parameters
         final_values.update(overrides)
 
-        # Get AEP from simulation (already includes wake + sector)
-        aep_gross = self._simulation_result.aep_gwh
-
-        # Create losses manager (only non-PyWake losses)
-        self._losses = WindFarmLosses()
-        self._losses.add_default_losses(
+        losses = WindFarmLosses()
+        losses.add_default_losses(
             availability_turbines=final_values.get('availability_turbines'),
             availability_grid=final_values.get('availability_grid'),
             electrical_losses=final_values.get('electrical_losses'),
@@ -484,43 +1583,22 @@ class WindSite:
             other_losses=final_values.get('other_losses')
         )
 
-        # Calculate net AEP (only applying non-PyWake losses)
-        aep_net = self._losses.calculate_net_aep(aep_gross)
-
-        # Calculate per-turbine other losses (applied uniformly as farm-level percentage)
-        # NOTE: calculate_total_loss_factor() returns the REMAINING production factor (e.g., 0.912)
-        # NOT the loss factor (e.g., 0.088), so we need to swap the assignments
-        remaining_factor = self._losses.calculate_total_loss_factor()  # e.g., 0.912 for 8.8% losses
-        turbine_prod_before_other = np.array(self._simulation_result.turbine_production_gwh)
-        turbine_prod_net = turbine_prod_before_other * remaining_factor  # Net = 91.2% of gross
-        other_loss_per_turbine = turbine_prod_before_other * (1 - remaining_factor)  # Loss = 8.8% of gross
-
-        # Build complete loss breakdown (wake + sector + others)
-        complete_breakdown = self._build_complete_loss_breakdown()
-
-        # Calculate total loss factor (ideal → net)
-        total_loss_factor = self._calculate_total_loss_factor(aep_net)
+        # Simulated hysteresis replaces the configured value unless overridden
+        if self._hysteresis is not None and 'high_hysteresis_losses' not in overrides:
+            losses.add_category(self._hysteresis.to_loss_category())
+        return losses, loss_config_file
 
-        # Update result with net AEP and losses
-        self._simulation_result = WindSimulationResult(
-            aep_gwh=aep_net,  # Net AEP
-            capacity_factor=self._calculate_capacity_factor(aep_net),
-            wake_loss_percent=self._simulation_result.wake_loss_percent,
-            turbine_production_gwh=turbine_prod_net.tolist(),  # Net production per turbine
-            wake_model=self._simulation_result.wake_model,
-            sector_loss_percent=self._simulation_result.sector_loss_percent,
-            gross_aep_gwh=aep_gross,
-            loss_breakdown=complete_breakdown,
-            total_loss_factor=total_loss_factor,
-            metadata={
-                **self._simulation_result.metadata,
-                'losses_applied': True,
-                'loss_config_file': str(loss_config_file),
-                'other_loss_per_turbine_gwh': other_loss_per_turbine.tolist()  # Add per-turbine other losses
-            }
-        )
+    def _hourly_energy_after_losses(self, remaining_factor: float) -> Optional[pd.DataFrame]:
+        """Hourly energy with the uniform non-PyWake losses applied."""
+        hourly = self._simulation_result.hourly_energy
+        if hourly is None:
+            return None
 
-        return self
+        # Same as the per-turbine figures: other losses scale current production
+        hourly = hourly.copy()
+        hourly['other_loss_mwh'] = hourly['net_mwh'] * (1 - remaining_factor)
+        hourly['net_mwh'] = hourly['net_mwh'] * remaining_factor
+        return hourly
 
     def calculate_production(
         self,
@@ -559,25 +1637,25 @@ class WindSite:
         Returns:
             DataFrame with direction bins and frequencies
         """
-        df = self.wind_data.timeseries.copy()
-
-        # Create direction bins
-        bin_width = 360 / n_direction_bins
-        df['wd_bin'] = (df['wd'] / bin_width).astype(int) % n_direction_bins
-
-        # Calculate frequency per bin
-        freq_table = df.groupby('wd_bin').size() / len(df)
-
-        # Estimate Weibull parameters per bin
-        weibull_params = df.groupby('wd_bin')['ws'].apply(
-            self._estimate_weibull_from_series
+        # Sector frequencies from the memoized ws × wd histogram
+        wind_data = self.simulation_wind_data
+        histogram = wind_data.histogram(n_sectors=n_direction_bins)
+
+        # Weibull parameters of all bins in one batched fit
+        ws = wind_data.timeseries['ws'].to_numpy(dtype=float)
+        wd = wind_data.timeseries['wd'].to_numpy(dtype=float)
+        valid = np.isfinite(wd)
+        weibull_A, weibull_k = fit_weibull(
+            ws[valid],
+            histogram.sector_index(wd[valid]),
+            n_groups=n_direction_bins
         )
 
         result = pd.DataFrame({
             'direction_bin': range(n_direction_bins),
-            'frequency': [freq_table.get(i, 0) for i in range(n_direction_bins)],
-            'weibull_A': [weibull_params.get(i, (8.0, 2.0))[0] for i in range(n_direction_bins)],
-            'weibull_k': [weibull_params.get(i, (8.0, 2.0))[1] for i in range(n_direction_bins)]
+            'frequency': histogram.sector_frequency,
+            'weibull_A': np.nan_to_num(weibull_A, nan=8.0),
+            'weibull_k': np.nan_to_num(weibull_k, nan=2.0)
         })
 
         return result
@@ -593,19 +1671,13 @@ class WindSite:
         Returns:
             Tuple of (A, k) parameters
         """
-        from scipy import stats
+        # Maximum likelihood with location 0; zeros and NaN are excluded
+        A, k = fit_weibull(np.asarray(ws_series, dtype=float), n_groups=1)
 
-        # Remove zeros and NaN
-        ws_clean = ws_series[ws_series > 0].dropna()
-
-        if len(ws_clean) < 10:
+        if np.isnan(A[0]):
             return (8.0, 2.0)  # Default values
 
-        # Fit Weibull distribution
-        # scipy uses (c=k, scale=A) parameterization
-        k, loc, A = stats.weibull_min.fit(ws_clean, floc=0)
-
-        return (A, k)
+        return (float(A[0]), float(k[0]))
 
     def _estimate_weibull_parameters(self) -> Dict:
         """
@@ -639,12 +1711,25 @@ class WindSite:
 
         return capacity_factor
 
-    def _create_timeseries_site(self):
+    def _create_timeseries_site(
+        self,
+        ws: Optional[np.ndarray] = None,
+        wd: Optional[np.ndarray] = None,
+        P: Optional[np.ndarray] = None,
+        ti: Optional[np.ndarray] = None
+    ):
         """
         Create XRSite from wind data time series.
 
         Based on legacy create_site_from_vortex implementation.
-        Uses IEC 61400-1 NTM formula for turbulence intensity.
+        Uses IEC 61400-1 NTM formula for turbulence intensity unless a
+        turbulence intensity per flow case is given.
+
+        Args:
+            ws: Wind speeds per flow case (default: wind data timeseries)
+            wd: Wind directions per flow case (default: wind data timeseries)
+            P: Probability weights per flow case (default: uniform)
+            ti: Turbulence intensity per flow case (default: IEC NTM)
 
         Returns:
             XRSite configured for time series simulation
@@ -653,16 +1738,18 @@ class WindSite:
         from py_wake.site.xrsite import XRSite
 
         # Extract wind data
-        ws = self.wind_data.timeseries['ws'].values
-        wd = self.wind_data.timeseries['wd'].values
+        if ws is None:
+            ws = self.simulation_wind_data.timeseries['ws'].values
+        if wd is None:
+            wd = self.simulation_wind_data.timeseries['wd'].values
         n_timesteps = len(ws)
 
-        # Turbulence intensity using IEC 61400-1 NTM formula
-        # TI = I_ref * (0.75 + 5.6/V_hub), I_ref = 0.12
-        ti = np.array([0.12 * (0.75 + 5.6 / max(v, 1.0)) for v in ws])
+        if ti is None:
+            ti = self._ntm_turbulence_intensity(ws)
 
         # Probability weights (uniform for time series)
-        P = np.ones(n_timesteps)
+        if P is None:
+            P = np.ones(n_timesteps)
 
         # Create xarray Dataset
         ds = xr.Dataset(
@@ -677,120 +1764,443 @@ class WindSite:
 
         return XRSite(ds, interp_method='nearest')
 
+    @staticmethod
+    def _ntm_turbulence_intensity(ws: np.ndarray) -> np.ndarray:
+        """IEC 61400-1 NTM turbulence intensity, TI = I_ref × (0.75 + 5.6 / V_hub), I_ref = 0.12."""
+        return 0.12 * (0.75 + 5.6 / np.maximum(ws, 1.0))
+
+    def _turbulence_intensity(self, ws: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Hourly stability-dependent turbulence intensity, if enabled.
+
+        Args:
+            ws: Simulated wind speed per hour (full record)
+
+        Returns:
+            Turbulence intensity per hour, or None for the IEC NTM
+        """
+        if self.stability_model is None:
+            return None
+        classes = stability_classes(self.wind_data, self.stability_model)
+        return self.stability_model.turbulence_intensity(ws, classes)
+
     def _run_pywake_simulation(
         self,
         wake_model: Optional[WakeModel],
         wind_direction_bins: int,
-        simulation_method: str = 'timeseries'
-    ):
+        simulation_method: str = 'timeseries',
+        chunking: Optional[Dict] = None,
+        sector_aware: bool = False,
+        variables: Sequence[str] = (),
+        **method_options
+    ) -> SimulationArrays:
         """
         Run single PyWake simulation with specified wake model.
 
+        If a cache is enabled (see enable_cache), results are looked up by
+        content hash first and stored after a fresh run.
+
+        Args:
+            wake_model: Wake model (None for no-wake baseline)
+            wind_direction_bins: Number of direction bins
+            simulation_method: 'timeseries', 'binned', 'weibull' or 'power_curve'
+            chunking: Options for run_chunked_timeseries (chunk_hours,
+                     n_workers, keep_hourly_power), None for a single run
+            sector_aware: Switch turbines off in prohibited sectors inside
+                         PyWake ('timeseries' only)
+            variables: Additional PyWake result variables to extract
+                      (e.g. 'WS_eff'; not available for chunked runs)
+            **method_options: Method-specific options
+                             (ws_bin_width, wd_bin_width for 'binned')
+
+        Returns:
+            SimulationArrays with per-turbine power and AEP
+        """
+        if simulation_method == 'power_curve':
+            # One power-curve lookup per hour; cheaper than a cache lookup
+            return power_curve_arrays(
+                self.turbine,
+                self.simulation_wind_data.timeseries['ws'].values,
+                self.layout.n_turbines
+            )
+
+        if chunking is not None and not chunking.get('keep_hourly_power', False):
+            # Reduced results embed the sector-loss energy, so they depend on
+            # the sector configuration; full hourly results are chunk-invariant
+            method_options['reduced_sectors'] = self._sector_management_key()
+        if sector_aware:
+            method_options['operating_sectors'] = self._sector_management_key()
+        if variables:
+            method_options['variables'] = tuple(variables)
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._simulation_cache_key(
+                wake_model,
+                wind_direction_bins,
+                simulation_method,
+                **method_options
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if simulation_method == 'binned':
+            arrays = self._run_binned_simulation(wake_model, **method_options)
+        elif chunking is not None:
+            arrays = run_chunked_timeseries(
+                self, wake_model, sector_aware=sector_aware, **chunking
+            )
+        else:
+            operating = None
+            if sector_aware:
+                operating = self._operating_mask(self.wind_data.timeseries['wd'].values)
+            sim_result = self._execute_pywake_simulation(
+                wake_model,
+                wind_direction_bins,
+                simulation_method,
+                operating=operating
+            )
+            arrays = SimulationArrays.from_pywake(sim_result, variables)
+
+        if cache_key is not None:
+            self._cache.put(cache_key, arrays)
+
+        return arrays
+
+    def _simulation_cache_key(
+        self,
+        wake_model: Optional[WakeModel],
+        wind_direction_bins: int,
+        simulation_method: str,
+        **method_options
+    ) -> str:
+        """
+        Compute the cache key for a PyWake simulation of this site.
+
+        Args:
+            wake_model: Wake model (None for no-wake baseline)
+            wind_direction_bins: Number of direction bins
+            simulation_method: 'timeseries', 'binned' or 'weibull'
+            **method_options: Method-specific options included in the key
+
+        Returns:
+            Content hash string
+        """
+        x, y = self.layout.to_pywake_format()
+        options = dict(method_options)
+        if simulation_method == 'weibull':
+            options['wind_direction_bins'] = wind_direction_bins
+        if self.stability_model is not None and simulation_method == 'timeseries':
+            classes = stability_classes(self.wind_data, self.stability_model)
+            options['stability'] = (
+                repr(self.stability_model), hashlib.sha256(classes.tobytes()).hexdigest()
+            )
+
+        return compute_simulation_key(
+            ws=self.simulation_wind_data.timeseries['ws'].values,
+            wd=self.simulation_wind_data.timeseries['wd'].values,
+            turbine_spec=self.turbine.spec,
+            x=x,
+            y=y,
+            wake_model=wake_model.value if wake_model is not None else None,
+            simulation_method=simulation_method,
+            **options
+        )
+
+    def _sector_management_key(self) -> Optional[str]:
+        """
+        Canonical string form of the sector configuration for cache keys.
+
+        Returns:
+            Sorted sector ranges per turbine, or None without sector management
+        """
+        if not self.sector_management:
+            return None
+
+        return repr(sorted(
+            (turbine_id, [tuple(sector) for sector in sectors])
+            for turbine_id, sectors in self.sector_management.turbine_sectors.items()
+        ))
+
+    def _operating_mask(self, wind_directions: np.ndarray) -> np.ndarray:
+        """
+        PyWake 'operating' input from the sector management configuration.
+
+        Args:
+            wind_directions: Wind direction per timestep (degrees)
+
+        Returns:
+            Integer array of shape (n_turbines, n_timesteps), 1 = running
+        """
+        from .sector_management import SectorEngine
+
+        engine = SectorEngine.from_config(self.sector_management)
+        return engine.operating_mask(wind_directions, self.layout.n_turbines).T.astype(int)
+
+    def _run_binned_simulation(
+        self,
+        wake_model: Optional[WakeModel],
+        ws_bin_width: float = 0.25,
+        wd_bin_width: float = 1.0,
+        variables: Sequence[str] = ()
+    ) -> SimulationArrays:
+        """
+        Simulate unique (ws, wd) bins and scatter the results back to hours.
+
+        Occurrence counts are set as the XRSite P weights. PyWake normalizes
+        time-mode probabilities itself, so the hourly AEP is rebuilt from the
+        scattered power with the same annualization as a timeseries run
+        (Power × 8760 h / n_hours). Hours without valid wind data get NaN
+        power and add no energy.
+
+        Args:
+            wake_model: Wake model (None for no-wake baseline)
+            ws_bin_width: Wind speed resolution (m/s)
+            wd_bin_width: Wind direction resolution (degrees)
+            variables: Additional PyWake result variables to scatter back
+
+        Returns:
+            SimulationArrays on the hourly timeline, dims ('wt', 'time')
+        """
+        binned = bin_wind_timeseries(
+            self.simulation_wind_data.timeseries['ws'].values,
+            self.simulation_wind_data.timeseries['wd'].values,
+            ws_resolution=ws_bin_width,
+            wd_resolution=wd_bin_width
+        )
+
+        sim_result = self._execute_pywake_simulation(
+            wake_model,
+            12,
+            'timeseries',
+            ws=binned.ws,
+            wd=binned.wd,
+            P=binned.counts.astype(float)
+        )
+
+        # Per-bin power (W) → hourly power on the original timeline
+        power_w = binned.scatter(sim_result.Power.transpose('wt', 'time').values)
+        aep_gwh = np.nan_to_num(power_w) * (8760 / binned.n_hours) * 1e-9
+
+        per_bin = SimulationArrays.from_pywake(sim_result, variables)
+
+        return SimulationArrays(
+            aep_gwh=aep_gwh,
+            power_w=power_w,
+            dims=('wt', 'time'),
+            variables={
+                name: binned.scatter(values) for name, values in per_bin.variables.items()
+            },
+            pywake_result=sim_result
+        )
+
+    def _execute_pywake_simulation(
+        self,
+        wake_model: Optional[WakeModel],
+        wind_direction_bins: int,
+        simulation_method: str = 'timeseries',
+        ws: Optional[np.ndarray] = None,
+        wd: Optional[np.ndarray] = None,
+        P: Optional[np.ndarray] = None,
+        operating: Optional[np.ndarray] = None,
+        ti: Optional[np.ndarray] = None
+    ):
+        """
+        Execute a PyWake simulation (no caching).
+
         Args:
             wake_model: Wake model (None for no-wake baseline)
             wind_direction_bins: Number of direction bins
             simulation_method: 'timeseries' or 'weibull'
+            ws: Flow-case wind speeds for 'timeseries' (default: wind data)
+            wd: Flow-case wind directions for 'timeseries' (default: wind data)
+            P: Flow-case probability weights for 'timeseries' (default: uniform)
+            operating: Per-timestep operating state (n_turbines, n_timesteps)
+                      for 'timeseries'; stopped turbines cast no wake
+            ti: Flow-case turbulence intensity for 'timeseries' (default:
+                stability model for the full record, else IEC NTM)
 
         Returns:
             PyWake simulation result object
         """
         try:
-            from py_wake.wind_farm_models import PropagateDownwind
             from py_wake.site import UniformWeibullSite
-            from py_wake.deficit_models import NOJDeficit, BastankhahGaussianDeficit, NoWakeDeficit
         except ImportError:
             raise ImportError(
                 "pywake is required for simulations. "
                 "Install with: conda install -c conda-forge py_wake"
             )
 
-        # Get pywake turbine
-        pywake_turbine = self.turbine.to_pywake()
-
         # Get layout coordinates
         x, y = self.layout.to_pywake_format()
 
-        # Select wake model
-        if wake_model is None:
-            deficit_model = NoWakeDeficit()
-        else:
-            wake_deficit_models = {
-                WakeModel.NOJ: NOJDeficit(),
-                WakeModel.BASTANKHAH_GAUSSIAN: BastankhahGaussianDeficit()
-            }
-            deficit_model = wake_deficit_models.get(wake_model, NOJDeficit())
-
         # Create site based on simulation method
         if simulation_method == 'timeseries':
-            # Time series simulation
-            pywake_site = self._create_timeseries_site()
-
-            # Create wind farm model using PropagateDownwind
-            wfm = PropagateDownwind(
-                pywake_site,
-                pywake_turbine,
-                wake_deficitModel=deficit_model
-            )
+            # Time series simulation; only the full wind record is pooled,
+            # chunks and binned flow cases build their own site
+            pooled = ws is None and wd is None and P is None and ti is None
+            if ws is None:
+                ws = self.simulation_wind_data.timeseries['ws'].values
+            if wd is None:
+                wd = self.simulation_wind_data.timeseries['wd'].values
+
+            if pooled:
+                wfm = self._pooled_wind_farm_model(
+                    ('timeseries',),
+                    lambda: self._create_timeseries_site(ws, wd, ti=self._turbulence_intensity(ws)),
+                    wake_model,
+                    operating is not None
+                )
+            else:
+                wfm = self._create_wind_farm_model(
+                    self._create_timeseries_site(ws, wd, P, ti=ti),
+                    wake_model,
+                    operating is not None
+                )
 
             # Run simulation with time series
-            times = np.arange(len(self.wind_data.timeseries))
-            ws = self.wind_data.timeseries['ws'].values
-            wd = self.wind_data.timeseries['wd'].values
+            times = np.arange(len(ws))
+
+            if operating is not None:
+                return wfm(x, y, wd=wd, ws=ws, time=times, operating=operating)
 
             return wfm(x, y, wd=wd, ws=ws, time=times)
 
         else:
             # Weibull distribution simulation (original method)
-            # Create wind frequency table
-            wind_freq = self._create_wind_frequency_table(
-                n_direction_bins=wind_direction_bins
-            )
+            def create_weibull_site():
+                # Create wind frequency table
+                wind_freq = self._create_wind_frequency_table(
+                    n_direction_bins=wind_direction_bins
+                )
 
-            # Create pywake site (using Weibull distribution)
-            pywake_site = UniformWeibullSite(
-                p_wd=wind_freq['frequency'].values,
-                a=wind_freq['weibull_A'].values,
-                k=wind_freq['weibull_k'].values,
-                ti=0.1  # Turbulence intensity (could be parameter)
-            )
+                # Create pywake site (using Weibull distribution)
+                return UniformWeibullSite(
+                    p_wd=wind_freq['frequency'].values,
+                    a=wind_freq['weibull_A'].values,
+                    k=wind_freq['weibull_k'].values,
+                    ti=0.1  # Turbulence intensity (could be parameter)
+                )
 
-            # Create wind farm model using PropagateDownwind
-            wfm = PropagateDownwind(
-                pywake_site,
-                pywake_turbine,
-                wake_deficitModel=deficit_model
+            wfm = self._pooled_wind_farm_model(
+                ('weibull', wind_direction_bins),
+                create_weibull_site,
+                wake_model,
+                operating is not None
             )
 
             return wfm(x, y)
 
-    def _get_aep_per_turbine(self, sim_result) -> np.ndarray:
+    def _pooled_wind_farm_model(
+        self,
+        site_key: tuple,
+        create_site,
+        wake_model: Optional[WakeModel],
+        operating_switch: bool
+    ):
         """
-        Extract annual energy per turbine from PyWake simulation result.
-        PyWake's .aep() returns annualized power values, so .mean(dim='time') gives GWh/year.
+        Wind farm model from the model pool, built on first use.
+
+        The PyWake site is pooled per wind dataset and the wind farm model
+        per (site, turbine variant, wake model), so repeated runs (e.g. the
+        loss decomposition's no-wake, wake and sector-managed simulations)
+        share one XRSite and one PropagateDownwind. The pool is reset when
+        the wind data, turbine or layout changes.
 
         Args:
-            sim_result: PyWake simulation result object
+            site_key: Pool key of the PyWake site
+            create_site: Callable building the site on a pool miss
+            wake_model: Wake model (None for no-wake)
+            operating_switch: Whether the turbine takes an 'operating' input
 
         Returns:
-            Array of annual energy per turbine (GWh/year), shape (n_turbines,)
+            PyWake PropagateDownwind wind farm model
+        """
+        wfm_key = ('wfm', site_key, wake_model, operating_switch)
+        wfm = self._model_pool.get(wfm_key)
+        if wfm is None:
+            pywake_site = self._model_pool.get(('site', site_key))
+            if pywake_site is None:
+                pywake_site = create_site()
+                self._model_pool[('site', site_key)] = pywake_site
+            wfm = self._create_wind_farm_model(pywake_site, wake_model, operating_switch)
+            self._model_pool[wfm_key] = wfm
+        return wfm
+
+    def _create_wind_farm_model(
+        self,
+        pywake_site,
+        wake_model: Optional[WakeModel],
+        operating_switch: bool
+    ):
         """
-        aep_raw = sim_result.aep()  # xarray DataArray
+        Create a PropagateDownwind model for the site's turbine.
 
+        Args:
+            pywake_site: PyWake site
+            wake_model: Wake model (None for no-wake)
+            operating_switch: Whether the turbine takes an 'operating' input
 
-        # For timeseries: shape is (n_turbines, n_timesteps), sum over time
-        # PyWake's .aep() returns energy per timestep,  so sum gives total (but internally annualized)
-        # For Weibull: shape is already (n_turbines,)
-        if len(aep_raw.shape) == 2:
-            # Timeseries simulation - SUM over time dimension
-            # NOTE: PyWake internally annualizes results, so sum returns GWh/year not total GWh
-            return aep_raw.sum(dim='time').values  # Shape: (n_turbines,), GWh/year
+        Returns:
+            PyWake PropagateDownwind wind farm model
+        """
+        from py_wake.wind_farm_models import PropagateDownwind
+        from py_wake.deficit_models import (
+            NOJDeficit, BastankhahGaussianDeficit, NiayifarGaussianDeficit, NoWakeDeficit
+        )
+        from py_wake.turbulence_models import CrespoHernandez
+
+        # Get pywake turbine
+        if operating_switch:
+            pywake_turbine = self.turbine.to_pywake_with_operating_switch()
+        else:
+            pywake_turbine = self.turbine.to_pywake()
+
+        # Select wake model
+        if wake_model is None:
+            deficit_model = NoWakeDeficit()
         else:
-            # Weibull simulation - already aggregated
-            return aep_raw.values  # Shape: (n_turbines,), GWh/year
+            wake_deficit_models = {
+                WakeModel.NOJ: NOJDeficit,
+                WakeModel.BASTANKHAH_GAUSSIAN: BastankhahGaussianDeficit,
+                WakeModel.NIAYIFAR_GAUSSIAN: NiayifarGaussianDeficit
+            }
+            deficit_model = wake_deficit_models.get(wake_model, NOJDeficit)()
+
+        # TI-dependent deficits expand with the effective (added wake) TI
+        turbulence_model = None
+        if wake_model in self.TI_DEPENDENT_WAKE_MODELS:
+            turbulence_model = CrespoHernandez()
+
+        # Create wind farm model using PropagateDownwind
+        return PropagateDownwind(
+            pywake_site,
+            pywake_turbine,
+            wake_deficitModel=deficit_model,
+            turbulenceModel=turbulence_model
+        )
+
+    def _get_aep_per_turbine(self, sim_result: SimulationArrays) -> np.ndarray:
+        """
+        Extract annual energy per turbine from PyWake simulation result.
+        PyWake's .aep() returns annualized values per flow case, so the sum
+        over time (or over wd/ws bins for Weibull) gives GWh/year.
+
+        Args:
+            sim_result: SimulationArrays from _run_pywake_simulation
+
+        Returns:
+            Array of annual energy per turbine (GWh/year), shape (n_turbines,)
+        """
+        # For timeseries: shape is (n_turbines, n_timesteps), sum over time
+        # NOTE: PyWake internally annualizes results, so sum returns GWh/year not total GWh
+        # For Weibull: shape is (n_turbines, n_wd, n_ws), sum over wd and ws
+        return sim_result.aep_per_turbine()
 
     def _apply_sector_management_to_results(
         self,
-        sim_result,
+        sim_result: SimulationArrays,
         wind_direction_bins: int,
         return_losses: bool = False
     ):
@@ -802,7 +2212,7 @@ class WindSite:
         variations by direction.
 
         Args:
-            sim_result: PyWake simulation result object
+            sim_result: SimulationArrays from _run_pywake_simulation
             wind_direction_bins: Number of direction bins used in simulation
             return_losses: Whether to return sector losses per turbine
 
@@ -829,7 +2239,8 @@ class WindSite:
             See detailed explanation in run_simulation() method (line ~302) and
             loss_calculation_methodology.md documentation.
 
-            TODO: Future enhancement to capture wake-sector interaction effects.
+            Use run_simulation(sector_aware_wakes=True) to capture the
+            wake-sector interaction inside PyWake.
         """
         # Get base AEP per turbine from PyWake using helper method
         aep_per_turbine = self._get_aep_per_turbine(sim_result)
@@ -844,54 +2255,35 @@ class WindSite:
             else:
                 return aep_per_turbine
 
-        # Check if we have timeseries data to calculate energy-based losses
-        aep_raw = sim_result.aep()
+        # Chunked runs reduce the prohibited-sector energy while accumulating
+        if sim_result.sector_loss_gwh is not None:
+            sector_loss_per_turbine = np.array(sim_result.sector_loss_gwh, dtype=float)
+            aep_per_turbine = aep_per_turbine - sector_loss_per_turbine
 
-        if len(aep_raw.shape) == 2:
+        # Check if we have timeseries data to calculate energy-based losses
+        elif sim_result.is_timeseries:
             # TIMESERIES: Calculate energy-based sector losses from hourly data
-            from .sector_management import is_direction_in_sectors
+            from .sector_management import SectorEngine
 
             # Get hourly power production per turbine from PyWake
             # PyWake returns power in Watts (W) for each timestep
-            power_timeseries = sim_result.Power.values  # Shape: (n_turbines, n_timesteps)
+            power_timeseries = sim_result.power_w  # Shape: (n_turbines, n_timesteps)
             wind_directions = self.wind_data.timeseries['wd'].values
 
-            # Verify shapes match
-            if len(wind_directions) != power_timeseries.shape[1]:
-                raise ValueError(
-                    f"Wind direction length ({len(wind_directions)}) doesn't match "
-                    f"power timeseries length ({power_timeseries.shape[1]})"
-                )
-
-            # For each restricted turbine, calculate energy lost in prohibited sectors
-            for turbine_id, sectors in self.sector_management.turbine_sectors.items():
-                turbine_idx = turbine_id - 1  # Convert to 0-indexed
+            # Energy produced in prohibited sectors per turbine: sum of power (W)
+            # over prohibited hours = Wh (zero for unrestricted turbines)
+            engine = SectorEngine.from_config(self.sector_management)
+            prohibited_energy_wh = engine.prohibited_energy(power_timeseries, wind_directions)
 
-                if turbine_idx < 0 or turbine_idx >= len(aep_per_turbine):
-                    raise ValueError(
-                        f"Turbine ID {turbine_id} out of range for "
-                        f"{len(aep_per_turbine)} turbines"
-                    )
+            # Convert from Wh to GWh and annualize to match aep_per_turbine units
+            # aep_per_turbine is already annual (GWh/year) from PyWake
+            # prohibited_energy_wh is total over simulation period, need to annualize
+            num_hours = len(wind_directions)
+            num_years = num_hours / 8760.0
+            sector_loss_per_turbine = prohibited_energy_wh / 1e9 / num_years
 
-                # Calculate energy produced in prohibited sectors
-                # Sum power (W) over prohibited hours to get energy (Wh)
-                prohibited_energy_wh = 0.0
-                for t, wd in enumerate(wind_directions):
-                    if not is_direction_in_sectors(wd, sectors):
-                        # Wind is in prohibited sector - this energy is lost
-                        # power_timeseries is in W, multiplied by 1 hour = Wh
-                        prohibited_energy_wh += power_timeseries[turbine_idx, t]
-
-                # Convert from Wh to GWh and annualize to match aep_per_turbine units
-                # aep_per_turbine is already annual (GWh/year) from PyWake
-                # prohibited_energy_wh is total over simulation period, need to annualize
-                num_hours = len(wind_directions)
-                num_years = num_hours / 8760.0
-                sector_loss_gwh_total = prohibited_energy_wh / 1e9  # Total over simulation
-                sector_loss_per_turbine[turbine_idx] = sector_loss_gwh_total / num_years  # Annual average
-
-                # Subtract lost energy from turbine production (both now in GWh/year)
-                aep_per_turbine[turbine_idx] -= sector_loss_per_turbine[turbine_idx]
+            # Subtract lost energy from turbine production (both now in GWh/year)
+            aep_per_turbine = aep_per_turbine - sector_loss_per_turbine
 
         else:
             # WEIBULL: Fallback to time-based availability (less accurate)
@@ -922,93 +2314,146 @@ class WindSite:
         else:
             return aep_per_turbine
 
-    def _compute_wake_losses(
+    def _run_planned_simulations(
         self,
-        wake_model: WakeModel,
+        wake_models: List[Optional[WakeModel]],
         wind_direction_bins: int,
-        simulation_method: str = 'timeseries'
-    ) -> tuple[float, float]:
+        simulation_method: str = 'timeseries',
+        chunking: Optional[Dict] = None,
+        wake_variables: Sequence[str] = (),
+        **method_options
+    ) -> Dict[Optional[WakeModel], SimulationArrays]:
         """
-        Compute wake losses by running comparative simulations.
+        Run each distinct PyWake configuration exactly once.
 
-        Runs two simulations:
-        1. Baseline (no wake)
-        2. With wake model
+        All simulations requested within one run_simulation() call share the
+        same site (wind data) and layout, so a configuration is identified by
+        its wake model. Duplicate requests are collapsed before any PyWake call
+        and every consumer receives the shared result.
 
         Args:
-            wake_model: Wake model to use
+            wake_models: Requested wake models (None for no-wake baseline)
             wind_direction_bins: Number of direction bins
-            simulation_method: 'timeseries' or 'weibull'
+            simulation_method: 'timeseries', 'binned' or 'weibull'
+            chunking: Chunked execution options for every run (see run_simulation)
+            wake_variables: Additional PyWake variables to extract from the
+                           wake-model runs (not the no-wake baseline)
+            **method_options: Method-specific options for every run
+
+        Returns:
+            Dict mapping each requested wake model to its SimulationArrays
+        """
+        plan = list(dict.fromkeys(wake_models))
+
+        return {
+            wake_model: self._run_pywake_simulation(
+                wake_model,
+                wind_direction_bins,
+                simulation_method,
+                chunking=chunking,
+                variables=wake_variables if wake_model is not None else (),
+                **method_options
+            )
+            for wake_model in plan
+        }
+
+    def _decompose_losses(
+        self,
+        sim_no_wake,
+        sim_wake,
+        wind_direction_bins: int
+    ) -> Dict:
+        """
+        Derive all loss figures from the no-wake and wake simulations.
+
+        Args:
+            sim_no_wake: SimulationArrays without wakes (ideal baseline)
+            sim_wake: SimulationArrays with the selected wake model
+            wind_direction_bins: Number of direction bins used in simulation
 
         Returns:
-            (aep_ideal, wake_loss_percent)
+            Dictionary with per-turbine arrays (GWh/year) and farm-level
+            wake and sector loss percentages
         """
-        # Run baseline (no wake)
-        sim_baseline = self._run_pywake_simulation(None, wind_direction_bins, simulation_method)
-        aep_ideal = sim_baseline.aep().sum()
+        ideal_per_turbine = self._get_aep_per_turbine(sim_no_wake)
+        wake_per_turbine = self._get_aep_per_turbine(sim_wake)
+        aep_per_turbine, sector_loss_per_turbine = self._apply_sector_management_to_results(
+            sim_wake,
+            wind_direction_bins,
+            return_losses=True
+        )
 
-        # Run with wake
-        sim_wake = self._run_pywake_simulation(wake_model, wind_direction_bins, simulation_method)
-        aep_with_wake = sim_wake.aep().sum()
+        aep_ideal = ideal_per_turbine.sum()
+        aep_with_wake = wake_per_turbine.sum()
+        aep_with_sectors = aep_per_turbine.sum()
 
-        # Calculate wake loss percentage
+        # Wake loss: ideal → with wake (no sector management)
         if aep_ideal == 0:
             wake_loss_pct = 0.0
         else:
             wake_loss_pct = (aep_ideal - aep_with_wake) / aep_ideal * 100
 
-        return aep_ideal, max(0.0, wake_loss_pct)
+        # Sector loss: with wake → with wake and sector curtailment
+        if aep_with_wake == 0:
+            sector_loss_pct = 0.0
+        else:
+            sector_loss_pct = (aep_with_wake - aep_with_sectors) / aep_with_wake * 100
+
+        return {
+            'ideal_per_turbine': ideal_per_turbine,
+            'aep_per_turbine': aep_per_turbine,
+            'wake_loss_per_turbine': ideal_per_turbine - wake_per_turbine,
+            'sector_loss_per_turbine': sector_loss_per_turbine,
+            'wake_loss_percent': max(0.0, float(wake_loss_pct)),
+            'sector_loss_percent': max(0.0, float(sector_loss_pct))
+        }
 
-    def _compute_sector_losses(
+    def _decompose_sector_aware_losses(
         self,
-        wake_model: WakeModel,
-        wind_direction_bins: int,
-        simulation_method: str = 'timeseries'
-    ) -> float:
+        sim_no_wake,
+        sim_actual,
+        wind_direction_bins: int
+    ) -> Dict:
         """
-        Compute sector management losses via comparative simulation.
+        Derive loss figures when the wake run already includes sector stops.
 
-        Runs two simulations:
-        1. WITH sector management (curtailed turbines)
-        2. WITHOUT sector management (all turbines always running)
-
-        The difference represents the energy lost due to sector curtailment.
+        Sector losses are taken first (no-wake energy in prohibited hours);
+        wake losses are the remainder, so they reflect the wakes of the
+        turbines that actually run.
 
         Args:
-            wake_model: Wake model to use in simulations
-            wind_direction_bins: Number of direction bins
-            simulation_method: 'timeseries' or 'weibull'
+            sim_no_wake: SimulationArrays without wakes or sector stops
+            sim_actual: SimulationArrays with wakes and the operating mask
+            wind_direction_bins: Number of direction bins used in simulation
 
         Returns:
-            sector_loss_percent: Loss percentage from sector curtailment (0-100)
+            Dictionary with the same keys as _decompose_losses()
         """
-        if not self.sector_management:
-            return 0.0
-
-        # Run simulation WITH sector management
-        sim_result = self._run_pywake_simulation(wake_model, wind_direction_bins, simulation_method)
-        aep_with_sectors = self._apply_sector_management_to_results(
-            sim_result, wind_direction_bins
-        ).sum()
-
-        # Run simulation WITHOUT sector management (baseline)
-        # Temporarily disable sector management
-        saved_config = self.sector_management
-        self.sector_management = None
-
-        sim_baseline = self._run_pywake_simulation(wake_model, wind_direction_bins, simulation_method)
-        aep_no_sectors = sim_baseline.aep().sum()
-
-        # Restore sector management config
-        self.sector_management = saved_config
+        ideal_per_turbine = self._get_aep_per_turbine(sim_no_wake)
+        _, sector_loss_per_turbine = self._apply_sector_management_to_results(
+            sim_no_wake,
+            wind_direction_bins,
+            return_losses=True
+        )
+        aep_per_turbine = self._get_aep_per_turbine(sim_actual)
+        wake_loss_per_turbine = ideal_per_turbine - sector_loss_per_turbine - aep_per_turbine
 
-        # Calculate sector loss percentage
-        if aep_no_sectors == 0:
-            return 0.0
+        aep_ideal = ideal_per_turbine.sum()
+        aep_after_sectors = aep_ideal - sector_loss_per_turbine.sum()
 
-        sector_loss_pct = (aep_no_sectors - aep_with_sectors) / aep_no_sectors * 100
+        sector_loss_pct = sector_loss_per_turbine.sum() / aep_ideal * 100 if aep_ideal else 0.0
+        wake_loss_pct = (
+            wake_loss_per_turbine.sum() / aep_after_sectors * 100 if aep_after_sectors else 0.0
+        )
 
-        return max(0.0, sector_loss_pct)
+        return {
+            'ideal_per_turbine': ideal_per_turbine,
+            'aep_per_turbine': aep_per_turbine,
+            'wake_loss_per_turbine': wake_loss_per_turbine,
+            'sector_loss_per_turbine': sector_loss_per_turbine,
+            'wake_loss_percent': max(0.0, float(wake_loss_pct)),
+            'sector_loss_percent': max(0.0, float(sector_loss_pct))
+        }
 
     def _build_complete_loss_breakdown(self) -> Dict[str, Dict]:
         """
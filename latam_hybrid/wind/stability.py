@@ -0,0 +1,273 @@
+"""
+Atmospheric stability classes and the turbulence and shear they imply.
+
+Every hour is classified from the inverse Obukhov length RMOL = 1/L
+(Vortex 'RMOL(1/m)'), falling back to the bulk Richardson number
+('RiNumber') where RMOL is missing, with one np.searchsorted over the
+class limits. Per-class factors then give an hourly turbulence intensity
+(IEC 61400-1 NTM scaled by class) for the PyWake site and an hourly shear
+exponent for hub-height extrapolation. Classes are memoized on the
+WindData, so every wake model and turbine configuration run on the same
+dataset reuses them.
+
+Class limits follow the usual Obukhov-length bands (e.g. Gryning et al.,
+2007): |L| > 500 m is neutral, 100-500 m (near-)stable/unstable, and
+|L| < 100 m very stable/unstable.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..core import WindData
+
+
+STABILITY_CLASSES = ('very_unstable', 'unstable', 'neutral', 'stable', 'very_stable')
+
+# Class code of neutral conditions (also used for hours without stability data)
+NEUTRAL = STABILITY_CLASSES.index('neutral')
+
+
+@dataclass(frozen=True)
+class StabilityModel:
+    """
+    Stability classification limits and per-class flow properties.
+
+    Attributes:
+        rmol_limits: Ascending RMOL (1/m) boundaries between the five classes
+        richardson_limits: Ascending Richardson number boundaries, used
+                           where RMOL is missing
+        ti_factor: Turbulence intensity multiplier per class, applied to the
+                   IEC NTM turbulence intensity
+        alpha: Power-law shear exponent per class
+        ti_ref: IEC reference turbulence intensity I_ref
+
+    Example:
+        >>> model = StabilityModel(alpha=(0.06, 0.10, 0.14, 0.22, 0.30))
+        >>> classes = stability_classes(wind_data, model)
+    """
+    rmol_limits: Tuple[float, ...] = (-1 / 100, -1 / 500, 1 / 500, 1 / 100)
+    richardson_limits: Tuple[float, ...] = (-0.1, -0.01, 0.01, 0.1)
+    ti_factor: Tuple[float, ...] = (1.3, 1.15, 1.0, 0.8, 0.65)
+    alpha: Tuple[float, ...] = (0.07, 0.10, 0.143, 0.22, 0.32)
+    ti_ref: float = 0.12
+
+    def __post_init__(self):
+        """Validate class tables."""
+        n = len(STABILITY_CLASSES)
+        for name in ('rmol_limits', 'richardson_limits'):
+            limits = getattr(self, name)
+            if len(limits) != n - 1 or list(limits) != sorted(limits):
+                raise ValueError(f"{name} must be {n - 1} ascending values, got {limits}")
+        for name in ('ti_factor', 'alpha'):
+            if len(getattr(self, name)) != n:
+                raise ValueError(f"{name} needs one value per class ({n}), got {getattr(self, name)}")
+
+    def classify(
+        self,
+        rmol: Optional[np.ndarray] = None,
+        richardson: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Stability class code per hour.
+
+        Args:
+            rmol: Inverse Obukhov length (1/m) per hour
+            richardson: Bulk Richardson number per hour (fallback)
+
+        Returns:
+            int8 codes indexing STABILITY_CLASSES; hours without valid data
+            are neutral
+        """
+        if rmol is None and richardson is None:
+            raise ValueError("rmol or richardson is required")
+        n = len(rmol) if rmol is not None else len(richardson)
+        classes = np.full(n, NEUTRAL, dtype=np.int8)
+
+        for values, limits in ((richardson, self.richardson_limits), (rmol, self.rmol_limits)):
+            if values is None:
+                continue
+            values = np.asarray(values, dtype=float)
+            valid = np.isfinite(values)
+            classes[valid] = np.searchsorted(limits, values[valid], side='right')
+
+        return classes
+
+    def turbulence_intensity(self, ws: np.ndarray, classes: np.ndarray) -> np.ndarray:
+        """
+        Hourly turbulence intensity.
+
+        TI = I_ref × (0.75 + 5.6 / V) × factor[class], V ≥ 1 m/s.
+
+        Args:
+            ws: Wind speed per hour (m/s)
+            classes: Stability class code per hour
+
+        Returns:
+            Turbulence intensity per hour
+        """
+        factor = np.asarray(self.ti_factor)[classes]
+        return self.ti_ref * (0.75 + 5.6 / np.maximum(ws, 1.0)) * factor
+
+    def shear_exponent(self, classes: np.ndarray) -> np.ndarray:
+        """
+        Hourly power-law shear exponent.
+
+        Args:
+            classes: Stability class code per hour
+
+        Returns:
+            Alpha per hour
+        """
+        return np.asarray(self.alpha)[classes]
+
+
+DEFAULT_STABILITY_MODEL = StabilityModel()
+
+
+def has_stability_data(wind_data: WindData) -> bool:
+    """Whether the wind data carry RMOL or Richardson number columns."""
+    columns = wind_data.timeseries.columns
+    return 'rmol' in columns or 'richardson' in columns
+
+
+def stability_classes(
+    wind_data: WindData,
+    model: StabilityModel = DEFAULT_STABILITY_MODEL
+) -> np.ndarray:
+    """
+    Stability class code per hour, computed once per dataset and model.
+
+    Args:
+        wind_data: Wind data with 'rmol' and/or 'richardson' columns
+        model: Classification limits
+
+    Returns:
+        int8 codes indexing STABILITY_CLASSES
+
+    Example:
+        >>> classes = stability_classes(wind_data)
+        >>> np.bincount(classes, minlength=5)
+    """
+    if not has_stability_data(wind_data):
+        raise ValueError(
+            "Wind data have no 'rmol' or 'richardson' column; "
+            "read Vortex files with their atmospheric columns"
+        )
+
+    def classify():
+        timeseries = wind_data.timeseries
+        return model.classify(
+            rmol=timeseries['rmol'].to_numpy(dtype=float) if 'rmol' in timeseries else None,
+            richardson=(
+                timeseries['richardson'].to_numpy(dtype=float) if 'richardson' in timeseries else None
+            )
+        )
+
+    return wind_data.memoized(('stability_classes', model), classify)
+
+
+def stability_turbulence_intensity(
+    wind_data: WindData,
+    model: StabilityModel = DEFAULT_STABILITY_MODEL,
+    ws: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Hourly stability-dependent turbulence intensity.
+
+    Args:
+        wind_data: Wind data with stability columns
+        model: Stability model
+        ws: Wind speeds to evaluate the NTM at (default: wind_data 'ws')
+
+    Returns:
+        Turbulence intensity per hour
+    """
+    if ws is None:
+        ws = wind_data.timeseries['ws'].to_numpy(dtype=float)
+    return model.turbulence_intensity(ws, stability_classes(wind_data, model))
+
+
+def stability_at_height(
+    wind_data: WindData,
+    height: float,
+    model: StabilityModel = DEFAULT_STABILITY_MODEL
+) -> WindData:
+    """
+    Wind speeds shifted to a hub height with an hourly stability shear.
+
+    V_hub = V_ref × (H_hub / H_ref)^alpha_t with alpha_t from the hour's
+    stability class. Only 'ws' is new; further columns are shared.
+
+    Args:
+        wind_data: Wind data with stability columns
+        height: Target height in meters
+        model: Stability model
+
+    Returns:
+        WindData at the target height (wind_data itself if the heights match)
+
+    Example:
+        >>> hub_wind = stability_at_height(wind_data, 164.0)
+    """
+    if np.isclose(height, wind_data.height):
+        return wind_data
+
+    alpha = model.shear_exponent(stability_classes(wind_data, model))
+    factor = (height / wind_data.height) ** alpha
+
+    timeseries = wind_data.timeseries.copy(deep=False)
+    timeseries['ws'] = wind_data.timeseries['ws'].to_numpy(dtype=float) * factor
+
+    return WindData(
+        timeseries=timeseries,
+        height=float(height),
+        timezone_offset=wind_data.timezone_offset,
+        source=f"{wind_data.source} (shear extrapolated to {height:g}m, α=stability)",
+        metadata={
+            **wind_data.metadata,
+            'extrapolated_from': wind_data.height,
+            'alpha': 'stability',
+            'mean_alpha': float(np.mean(alpha)),
+            'target_hub_height': float(height),
+            'correction_factor': float(np.mean(factor))
+        }
+    )
+
+
+def stability_table(
+    wind_data: WindData,
+    model: StabilityModel = DEFAULT_STABILITY_MODEL
+) -> pd.DataFrame:
+    """
+    Frequency and flow properties per stability class.
+
+    Args:
+        wind_data: Wind data with stability columns
+        model: Stability model
+
+    Returns:
+        DataFrame indexed by class name with hours, frequency, mean wind
+        speed, mean turbulence intensity and shear exponent
+    """
+    classes = stability_classes(wind_data, model)
+    ws = wind_data.timeseries['ws'].to_numpy(dtype=float)
+    ti = model.turbulence_intensity(ws, classes)
+    n = len(STABILITY_CLASSES)
+
+    hours = np.bincount(classes, minlength=n)
+    valid = np.isfinite(ws)
+    valid_hours = np.bincount(classes[valid], minlength=n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_ws = np.bincount(classes[valid], weights=ws[valid], minlength=n) / valid_hours
+        mean_ti = np.bincount(classes[valid], weights=ti[valid], minlength=n) / valid_hours
+
+    return pd.DataFrame({
+        'hours': hours,
+        'frequency': hours / max(len(classes), 1),
+        'mean_ws': mean_ws,
+        'mean_ti': mean_ti,
+        'alpha': model.alpha
+    }, index=pd.Index(STABILITY_CLASSES, name='stability_class'))
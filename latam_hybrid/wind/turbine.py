@@ -5,11 +5,16 @@ Wraps turbine specifications and integrates with pywake WindTurbine objects.
 """
 
 from pathlib import Path
-from typing import Optional, Union, Dict
+from typing import TYPE_CHECKING, Optional, Union, Dict
 import pandas as pd
 import numpy as np
 
-from ..core import TurbineSpec, DataValidator
+from ..core import TurbineSpec, DataValidator, STANDARD_AIR_DENSITY
+from .curve_lookup import CurveLookup, DEFAULT_STEP
+
+if TYPE_CHECKING:
+    # PyWake is optional at runtime; it is imported where the models are built
+    from py_wake.wind_turbines import WindTurbine
 
 
 class TurbineModel:
@@ -29,6 +34,9 @@ class TurbineModel:
         """
         self.spec = spec
         self._pywake_turbine = None
+        self._pywake_switch_turbine = None
+        self._power_lookup: Optional[CurveLookup] = None
+        self._ct_lookup: Optional[CurveLookup] = None
 
     @classmethod
     def from_csv(
@@ -235,30 +243,160 @@ class TurbineModel:
         self._pywake_turbine = wt
         return wt
 
-    def power_at_wind_speed(self, wind_speed: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def to_pywake_with_operating_switch(self) -> 'WindTurbine':
+        """
+        Convert to pywake WindTurbine that can be switched off per timestep.
+
+        Adds PyWake's discrete ``operating`` input (1 = running, 0 = stopped).
+        A stopped turbine has zero power and zero thrust, so it casts no wake.
+        Pass ``operating`` with shape (n_turbines, n_timesteps) to the wind
+        farm model call.
+
+        Returns:
+            pywake WindTurbine instance with an 'operating' switch
+
+        Example:
+            >>> wt = turbine_model.to_pywake_with_operating_switch()
+            >>> sim = wfm(x, y, wd=wd, ws=ws, time=times, operating=mask)
+        """
+        if self._pywake_switch_turbine is not None:
+            return self._pywake_switch_turbine
+
+        from py_wake.wind_turbines import WindTurbine
+        from py_wake.wind_turbines.power_ct_functions import (
+            PowerCtFunctionList,
+            PowerCtTabular,
+        )
+
+        running = self.to_pywake()
+        stopped = PowerCtTabular(ws=[0, 100], power=[0, 0], power_unit='w', ct=[0, 0])
+
+        wt = WindTurbine(
+            name=self.spec.name,
+            diameter=self.spec.rotor_diameter,
+            hub_height=self.spec.hub_height,
+            powerCtFunction=PowerCtFunctionList(
+                key='operating',
+                powerCtFunction_lst=[stopped, running.powerCtFunction],
+                default_value=1
+            )
+        )
+
+        self._pywake_switch_turbine = wt
+        return wt
+
+    def power_at_wind_speed(
+        self,
+        wind_speed: Union[float, np.ndarray],
+        air_density: Optional[Union[float, np.ndarray]] = None
+    ) -> Union[float, np.ndarray]:
         """
         Get power output at given wind speed(s).
 
+        The power curve is precompiled into a uniform 0.01 m/s lookup table
+        on first use (see CurveLookup), so large arrays are evaluated with
+        index arithmetic instead of a search per sample.
+
         Args:
             wind_speed: Wind speed(s) in m/s
+            air_density: Air density (kg/m³), scalar or per sample. Power is
+                        read at the IEC 61400-12-1 equivalent wind speed
+                        V × (rho / rho_ref)^(1/3), rho_ref being the power
+                        curve's reference_air_density (None: no correction)
 
         Returns:
-            Power output(s) in kW
+            Power output(s) in kW (zero outside the power curve range)
 
         Example:
             >>> power = turbine.power_at_wind_speed(10.0)  # Single value
             >>> powers = turbine.power_at_wind_speed([8, 10, 12])  # Array
+            >>> powers = turbine.power_at_wind_speed(ws, air_density=rho)
         """
-        # Interpolate from power curve
-        power = np.interp(
-            wind_speed,
-            self.spec.power_curve['ws'].values,
-            self.spec.power_curve['power'].values,
-            left=0.0,
-            right=0.0  # Zero power outside curve range
-        )
+        if self._power_lookup is None:
+            self._power_lookup = CurveLookup.from_curve(
+                self.spec.power_curve['ws'].values,
+                self.spec.power_curve['power'].values,
+                step=DEFAULT_STEP
+            )
 
-        return power
+        if air_density is not None:
+            wind_speed = self.equivalent_wind_speed(wind_speed, air_density)
+
+        return self._power_lookup(wind_speed)
+
+    def ct_at_wind_speed(self, wind_speed: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Get thrust coefficient at given wind speed(s).
+
+        Args:
+            wind_speed: Wind speed(s) in m/s
+
+        Returns:
+            Thrust coefficient(s) (zero outside the CT curve range)
+
+        Raises:
+            ValueError: If the turbine has no CT curve
+        """
+        if self.spec.ct_curve is None:
+            raise ValueError(f"Turbine '{self.name}' has no CT curve")
+
+        if self._ct_lookup is None:
+            self._ct_lookup = CurveLookup.from_curve(
+                self.spec.ct_curve['ws'].values,
+                self.spec.ct_curve['ct'].values,
+                step=DEFAULT_STEP
+            )
+
+        return self._ct_lookup(wind_speed)
+
+    def equivalent_wind_speed(
+        self,
+        wind_speed: Union[float, np.ndarray],
+        air_density: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Wind speed at the power curve's reference density (IEC 61400-12-1).
+
+        Args:
+            wind_speed: Wind speed(s) in m/s at the given air density
+            air_density: Air density (kg/m³), scalar or per sample
+
+        Returns:
+            V × (rho / rho_ref)^(1/3)
+        """
+        ratio = np.asarray(air_density, dtype=float) / self.reference_air_density
+        return np.asarray(wind_speed, dtype=float) * np.cbrt(ratio)
+
+    def power_curve_family(
+        self,
+        air_densities: np.ndarray,
+        wind_speeds: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
+        """
+        Density-corrected power curves for a range of air densities.
+
+        Args:
+            air_densities: Air densities (kg/m³), one curve per value
+            wind_speeds: Wind speed grid (default: the tabulated power curve)
+
+        Returns:
+            DataFrame indexed by wind speed with one power column (kW) per
+            air density
+
+        Example:
+            >>> family = turbine.power_curve_family(np.arange(1.00, 1.26, 0.05))
+        """
+        if wind_speeds is None:
+            wind_speeds = self.spec.power_curve['ws'].values
+        wind_speeds = np.asarray(wind_speeds, dtype=float)
+        air_densities = np.atleast_1d(np.asarray(air_densities, dtype=float))
+
+        power = self.power_at_wind_speed(
+            wind_speeds[:, None], air_density=air_densities[None, :]
+        )
+        family = pd.DataFrame(power, index=pd.Index(wind_speeds, name='ws'),
+                              columns=pd.Index(air_densities, name='air_density'))
+        return family
 
     @property
     def name(self) -> str:
@@ -280,6 +418,19 @@ class TurbineModel:
         """Rated power in kW."""
         return self.spec.rated_power
 
+    @property
+    def reference_air_density(self) -> float:
+        """Air density of the power curve in kg/m³ (metadata 'air_density', default 1.225)."""
+        return float(self.spec.metadata.get('air_density', STANDARD_AIR_DENSITY))
+
+    @property
+    def cut_out_wind_speed(self) -> float:
+        """Cut-out wind speed in m/s (metadata 'cut_out_ws', else the last ws with power)."""
+        if 'cut_out_ws' in self.spec.metadata:
+            return float(self.spec.metadata['cut_out_ws'])
+        curve = self.spec.power_curve
+        return float(curve.loc[curve['power'] > 0, 'ws'].max())
+
     @property
     def swept_area(self) -> float:
         """Rotor swept area in m²."""
@@ -0,0 +1,278 @@
+"""
+Side-by-side comparison of turbine configurations on one site.
+
+The wind data and layout are loaded once by the caller. Each configuration
+only differs in its turbine model, so the per-configuration work is a cheap
+power-law shift of the wind speeds to the turbine's hub height followed by
+the usual WindSite pipeline (run_simulation → apply_losses). Configurations
+are independent and run in a process pool, so the total runtime is bounded
+by the slowest configuration rather than the sum of all of them.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core import WindData, WindSimulationResult, WakeModel, SectorManagementConfig
+from .turbine import TurbineModel
+from .layout import TurbineLayout
+from .shear import ShearProfile
+from .stability import stability_at_height
+
+
+@dataclass
+class TurbineComparisonResult:
+    """
+    Results of compare_turbine_configurations().
+
+    Attributes:
+        summary: Tidy table with one row per configuration (farm AEP, loss
+                 breakdown, capacity factor, shear correction, runtime)
+        per_turbine: Per-turbine loss table per configuration (see
+                     latam_hybrid.output.per_turbine_losses_dataframe)
+        results: Compact WindSimulationResult per configuration
+    """
+    summary: pd.DataFrame
+    per_turbine: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    results: Dict[str, WindSimulationResult] = field(default_factory=dict)
+
+    def to_csv(self, directory: Union[str, Path], prefix: str = '') -> List[Path]:
+        """
+        Write the summary and per-turbine tables as CSV files.
+
+        Args:
+            directory: Output directory (created if missing)
+            prefix: Optional file name prefix
+
+        Returns:
+            Paths of the written files (summary first)
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        summary_path = directory / f"{prefix}turbine_comparison.csv"
+        self.summary.to_csv(summary_path, index=False)
+        paths = [summary_path]
+
+        for label, table in self.per_turbine.items():
+            path = directory / f"{prefix}per_turbine_{_file_label(label)}.csv"
+            table.to_csv(path, index=False)
+            paths.append(path)
+
+        return paths
+
+
+def wind_at_hub_height(
+    wind_data: Union[WindData, ShearProfile],
+    hub_height: float,
+    shear_alpha: Optional[Union[float, str]]
+) -> WindData:
+    """
+    Shift wind speeds to a hub height with the power law.
+
+    V_hub = V_ref × (H_hub / H_ref)^alpha. Directions are unchanged.
+
+    Args:
+        wind_data: Wind data at its measurement height, or a multi-height
+                  ShearProfile
+        hub_height: Target hub height in meters
+        shear_alpha: Power-law shear exponent (may be None if no shift is
+                    needed). For a ShearProfile, a constant or an alpha method
+                    ('profile', 'sector', 'hour', 'timeseries'; default 'sector').
+                    For WindData with RMOL/Richardson columns, 'stability'
+                    uses an hourly alpha per stability class.
+
+    Returns:
+        WindData at hub_height sharing the input's buffers except 'ws'
+        (the input itself if the heights match)
+    """
+    if isinstance(wind_data, ShearProfile):
+        return wind_data.extrapolate(hub_height, alpha='sector' if shear_alpha is None else shear_alpha)
+
+    if shear_alpha is None and not np.isclose(hub_height, wind_data.height):
+        raise ValueError(
+            f"shear_alpha is required to shift wind data from {wind_data.height} m "
+            f"to hub height {hub_height} m"
+        )
+
+    if shear_alpha == 'stability':
+        return stability_at_height(wind_data, hub_height)
+
+    return wind_data.at_height(hub_height, shear_alpha)
+
+
+def compare_turbine_configurations(
+    wind_data: Union[WindData, ShearProfile],
+    layout: TurbineLayout,
+    turbines: Union[Sequence[TurbineModel], Dict[str, TurbineModel]],
+    shear_alpha: Optional[Union[float, str]] = None,
+    sector_management: Optional[SectorManagementConfig] = None,
+    wake_model: Union[str, WakeModel] = WakeModel.NOJ,
+    apply_losses: bool = True,
+    loss_config_file: Optional[Union[str, Path]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    n_workers: Optional[int] = None,
+    **simulation_options
+) -> TurbineComparisonResult:
+    """
+    Simulate several turbine configurations on the same site and layout.
+
+    Args:
+        wind_data: Wind data at its measurement height (loaded once), or a
+                  ShearProfile to extrapolate from measured shear
+        layout: Turbine layout shared by all configurations
+        turbines: Turbine models, either a list (labelled by turbine name) or
+                 a dict of label → TurbineModel. Each model's hub height sets
+                 the height the wind speeds are shifted to.
+        shear_alpha: Power-law shear exponent for the hub-height shift (or
+                    an alpha method for a ShearProfile, see wind_at_hub_height)
+        sector_management: Optional sector management for all configurations
+        wake_model: Wake model name or WakeModel
+        apply_losses: Apply non-PyWake losses (see WindSite.apply_losses)
+        loss_config_file: Loss CSV for apply_losses (None for the default)
+        cache_dir: Directory of a shared on-disk PyWake result cache
+        n_workers: Worker processes (default: one per configuration, capped
+                  at the CPU count; 1 runs in-process)
+        **simulation_options: Further arguments for WindSite.run_simulation
+                             (simulation_method, chunk_hours, ...)
+
+    Returns:
+        TurbineComparisonResult with the summary and per-turbine tables
+
+    Example:
+        >>> comparison = compare_turbine_configurations(
+        ...     wind_data, layout,
+        ...     {'V162 @ 145m': v162_145, 'V162 @ 125m': v162_125},
+        ...     shear_alpha=0.1846,
+        ...     sector_management=SECTOR_MANAGEMENT_CONFIG,
+        ...     wake_model='Bastankhah_Gaussian'
+        ... )
+        >>> print(comparison.summary[['configuration', 'net_aep_gwh']])
+    """
+    if isinstance(turbines, dict):
+        configurations = dict(turbines)
+    else:
+        configurations = {turbine.name: turbine for turbine in turbines}
+        if len(configurations) != len(turbines):
+            raise ValueError("Turbine names must be unique; pass a dict to label them")
+
+    if not configurations:
+        raise ValueError("At least one turbine configuration is required")
+
+    if n_workers is None:
+        n_workers = min(len(configurations), os.cpu_count() or 1)
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+
+    # Fail fast on a missing shear exponent before starting any worker
+    if shear_alpha is None and isinstance(wind_data, WindData):
+        for turbine in configurations.values():
+            wind_at_hub_height(wind_data, turbine.hub_height, shear_alpha)
+
+    tasks = [
+        (
+            label, turbine, wind_data, layout, shear_alpha, sector_management,
+            wake_model, apply_losses, loss_config_file, cache_dir, simulation_options
+        )
+        for label, turbine in configurations.items()
+    ]
+
+    if n_workers == 1:
+        outputs = [_run_configuration(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            outputs = list(executor.map(_run_configuration, tasks))
+
+    return TurbineComparisonResult(
+        summary=pd.DataFrame([row for row, _, _ in outputs]),
+        per_turbine={row['configuration']: table for row, table, _ in outputs},
+        results={row['configuration']: result for row, _, result in outputs}
+    )
+
+
+def _run_configuration(task) -> tuple:
+    """
+    Process-pool worker: simulate one turbine configuration.
+
+    Args:
+        task: Tuple of (label, turbine, wind_data, layout, shear_alpha,
+              sector_management, wake_model, apply_losses, loss_config_file,
+              cache_dir, simulation_options)
+
+    Returns:
+        (summary row dict, per-turbine DataFrame, compact WindSimulationResult)
+    """
+    from ..output.export import per_turbine_losses_dataframe
+    from .site import WindSite
+
+    (label, turbine, wind_data, layout, shear_alpha, sector_management,
+     wake_model, apply_losses, loss_config_file, cache_dir, simulation_options) = task
+
+    start = time.perf_counter()
+    hub_wind = wind_at_hub_height(wind_data, turbine.hub_height, shear_alpha)
+
+    site = WindSite(hub_wind, turbine=turbine, layout=layout).enable_compact_results()
+    if sector_management is not None:
+        site.set_sector_management(sector_management)
+    if cache_dir is not None:
+        site.enable_cache(cache_dir=cache_dir)
+
+    site.run_simulation(wake_model=wake_model, **simulation_options)
+    if apply_losses:
+        site.apply_losses(
+            loss_config_file=str(loss_config_file) if loss_config_file is not None else None
+        )
+    result = site.calculate_production()
+
+    ideal = result.per_turbine('ideal')
+    wake_loss = result.per_turbine('wake_loss').sum()
+    sector_loss = result.per_turbine('sector_loss').sum()
+    other_loss = (
+        result.per_turbine('other_loss').sum()
+        if 'other_loss_per_turbine_gwh' in result.metadata else 0.0
+    )
+    gross = ideal.sum()
+    net = result.aep_gwh  # Full precision; compact per-turbine figures are float32
+    capacity_mw = result.metadata['total_capacity_mw']
+
+    def percent(value: float) -> float:
+        return float(value / gross * 100) if gross > 0 else 0.0
+
+    row = {
+        'configuration': label,
+        'turbine': turbine.name,
+        'rated_power_mw': turbine.rated_power / 1000,
+        'hub_height_m': turbine.hub_height,
+        'rotor_diameter_m': turbine.rotor_diameter,
+        'wind_data_height_m': (
+            wind_data.height if isinstance(wind_data, WindData)
+            else hub_wind.metadata.get('extrapolated_from', hub_wind.height)
+        ),
+        'shear_factor': hub_wind.metadata.get('correction_factor', 1.0),
+        'mean_ws': float(hub_wind.timeseries['ws'].mean()),
+        'gross_aep_gwh': float(gross),
+        'wake_loss_gwh': float(wake_loss),
+        'wake_loss_percent': percent(wake_loss),
+        'sector_loss_gwh': float(sector_loss),
+        'sector_loss_percent': percent(sector_loss),
+        'other_loss_gwh': float(other_loss),
+        'other_loss_percent': percent(other_loss),
+        'total_loss_percent': percent(wake_loss + sector_loss + other_loss),
+        'net_aep_gwh': float(net),
+        'capacity_factor': float(net * 1000 / (capacity_mw * 8760)) if capacity_mw else 0.0,
+        'full_load_hours': float(net * 1000 / capacity_mw) if capacity_mw else 0.0,
+        'runtime_s': time.perf_counter() - start
+    }
+
+    return row, per_turbine_losses_dataframe(result), result
+
+
+def _file_label(label: str) -> str:
+    """File-name-safe form of a configuration label."""
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in label).strip('_')
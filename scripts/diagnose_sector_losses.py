@@ -14,7 +14,6 @@ from latam_hybrid.wind import WindSite
 from latam_hybrid.wind.turbine import TurbineModel
 from latam_hybrid.wind.layout import TurbineLayout
 from latam_hybrid.Inputdata.sector_config import SECTOR_MANAGEMENT_CONFIG
-from latam_hybrid.core.data_models import WindData
 
 def main():
     """Diagnose sector management losses."""
@@ -44,29 +43,12 @@ def main():
         source_type='vortex',
         height=164.0,
         skiprows=3,
-        column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'}
+        column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'},
+        cache_dir=project_root / ".cache" / "ingest"
     )
 
-    # Filter to year 2020
-    years_from_2014 = ANALYSIS_YEAR - 2014
-    start_idx = 4 + (years_from_2014 * 8760)
-    leap_days = sum(1 for y in range(2014, ANALYSIS_YEAR)
-                   if (y % 4 == 0 and y % 100 != 0) or (y % 400 == 0))
-    start_idx += leap_days * 24
-    is_leap = ((ANALYSIS_YEAR % 4 == 0 and ANALYSIS_YEAR % 100 != 0) or
-              (ANALYSIS_YEAR % 400 == 0))
-    year_hours = 8784 if is_leap else 8760
-    end_idx = start_idx + year_hours
-
-    filtered_timeseries = site.wind_data.timeseries.iloc[start_idx:end_idx].copy()
-    filtered_wind_data = WindData(
-        timeseries=filtered_timeseries,
-        height=site.wind_data.height,
-        timezone_offset=site.wind_data.timezone_offset,
-        source=site.wind_data.source,
-        metadata=site.wind_data.metadata
-    )
-    object.__setattr__(site, 'wind_data', filtered_wind_data)
+    # Filter to the analysis year (zero-copy window view)
+    site.wind_data = site.wind_data.window(str(ANALYSIS_YEAR), str(ANALYSIS_YEAR))
 
     # Check sector availability from actual wind data
     print("1. SECTOR AVAILABILITY ANALYSIS")
@@ -118,6 +100,7 @@ def main():
             )
         )
         .set_sector_management(SECTOR_MANAGEMENT_CONFIG)
+        .enable_cache(cache_dir=project_root / ".cache" / "pywake")
     )
 
     result = (
@@ -21,7 +21,6 @@ from latam_hybrid.wind import WindSite
 from latam_hybrid.wind.turbine import TurbineModel
 from latam_hybrid.wind.layout import TurbineLayout
 from latam_hybrid.Inputdata.sector_config import SECTOR_MANAGEMENT_CONFIG
-from latam_hybrid.core.data_models import WindData
 
 # Color palette from legacy code
 PALETTE = {
@@ -74,53 +73,20 @@ def main():
             source_type='vortex',
             height=164.0,
             skiprows=3,
-            column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'}
+            column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'},
+            cache_dir=project_root / ".cache" / "ingest"
         )
 
         # Filter to specific year if requested (for faster testing)
-        # Note: Vortex file starts at 2013-12-31 20:00 UTC
-        # Data is hourly, so we can calculate row indices for specific years
+        # Zero-copy window view selected by the timestamp index
         if ANALYSIS_YEAR is not None:
-            # Calculate start index for requested year
-            # File starts: 2013-12-31 20:00
-            # 2014-01-01 00:00 is at index 4 (4 hours offset)
-            years_from_2014 = ANALYSIS_YEAR - 2014
-            start_idx = 4 + (years_from_2014 * 8760)  # 4 hours offset + years * hours_per_year
-
-            # For leap years, add extra days
-            # Count leap years between 2014 and ANALYSIS_YEAR
-            leap_days = sum(1 for y in range(2014, ANALYSIS_YEAR)
-                           if (y % 4 == 0 and y % 100 != 0) or (y % 400 == 0))
-            start_idx += leap_days * 24
-
-            # One year of data (account for leap year)
-            is_leap = ((ANALYSIS_YEAR % 4 == 0 and ANALYSIS_YEAR % 100 != 0) or
-                      (ANALYSIS_YEAR % 400 == 0))
-            year_hours = 8784 if is_leap else 8760
-
-            end_idx = start_idx + year_hours
-
-            # Filter timeseries
-            filtered_timeseries = site.wind_data.timeseries.iloc[start_idx:end_idx].copy()
-
-            print(f"Filtered to year {ANALYSIS_YEAR} (indices {start_idx}:{end_idx}): " +
-                  f"{len(filtered_timeseries)} hours")
+            site.wind_data = site.wind_data.window(str(ANALYSIS_YEAR), str(ANALYSIS_YEAR))
+            print(f"Filtered to year {ANALYSIS_YEAR}: {len(site.wind_data.timeseries)} hours")
         else:
-            filtered_timeseries = site.wind_data.timeseries.copy()
-            print(f"Using full dataset: {len(filtered_timeseries)} hours")
+            print(f"Using full dataset: {len(site.wind_data.timeseries)} hours")
 
         print()
 
-        # Create filtered WindData object
-        filtered_wind_data = WindData(
-            timeseries=filtered_timeseries,
-            height=site.wind_data.height,
-            timezone_offset=site.wind_data.timezone_offset,
-            source=site.wind_data.source,
-            metadata=site.wind_data.metadata
-        )
-        object.__setattr__(site, 'wind_data', filtered_wind_data)
-
         # Build the site with turbine and layout
         site = (
             site
@@ -142,6 +108,7 @@ def main():
                 )
             )
             .set_sector_management(SECTOR_MANAGEMENT_CONFIG)
+            .enable_cache(cache_dir=project_root / ".cache" / "pywake")
         )
 
         # Run simulation and apply losses
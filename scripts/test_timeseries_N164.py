@@ -63,28 +63,18 @@ def main():
         turbine_df.to_csv(temp_turbine_path, index=False)
 
         # Load wind data and filter to first year only (for testing)
-        from latam_hybrid.core.data_models import WindData
-
         site = WindSite.from_file(
             str(wind_data_path),
             source_type='vortex',
             height=164.0,
             skiprows=3,  # Skip header rows
-            column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'}  # Map standard names to Vortex columns
-        )
-
-        # Filter to first year only (8760 hours) - create new WindData object
-        filtered_timeseries = site.wind_data.timeseries.iloc[:8760].copy()
-        filtered_wind_data = WindData(
-            timeseries=filtered_timeseries,
-            height=site.wind_data.height,
-            timezone_offset=site.wind_data.timezone_offset,
-            source=site.wind_data.source,
-            metadata=site.wind_data.metadata
+            column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'},  # Map standard names to Vortex columns
+            cache_dir=project_root / ".cache" / "ingest"
         )
 
-        # Replace wind_data using object.__setattr__ (since WindSite is frozen)
-        object.__setattr__(site, 'wind_data', filtered_wind_data)
+        # Filter to first year only (8760 hours) - zero-copy window view
+        timeseries = site.wind_data.timeseries
+        site.wind_data = site.wind_data.window(timeseries.index[0], timeseries.index[8759])
 
         result = (
             site
@@ -0,0 +1,101 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from latam_hybrid.core import TurbineSpec, WindData
+from latam_hybrid.wind import TurbineModel
+
+
+def pytest_runtest_setup(item):
+    """Skip tests marked requires_pywake when PyWake is not installed."""
+    if item.get_closest_marker('requires_pywake') and importlib.util.find_spec('py_wake') is None:
+        pytest.skip("requires py_wake")
+
+
+@pytest.fixture
+def synthetic_turbine():
+    """
+    Factory of a synthetic 3 MW turbine (120 m rotor).
+
+    Returns:
+        Function (name, hub_height, curve_ws, cut_in_ws, metadata) returning a
+        TurbineModel with power (ws - cut_in_ws)³ × 5 kW clipped to 3 MW and
+        Ct falling from 0.8, both zero below cut_in_ws, tabulated at curve_ws
+        (default 0-25 m/s every 1 m/s)
+
+    Example:
+        >>> turbine = synthetic_turbine(hub_height=140)
+    """
+    def make(name='Synthetic 3MW', hub_height=120, curve_ws=None, cut_in_ws=3.0, metadata=None):
+        curve_ws = np.arange(0, 26, 1.0) if curve_ws is None else np.asarray(curve_ws, dtype=float)
+        below_cut_in = curve_ws < cut_in_ws
+        curve_power = np.where(below_cut_in, 0.0, np.clip((curve_ws - cut_in_ws) ** 3 * 5, 0, 3000))
+        curve_ct = np.where(below_cut_in, 0.0, np.clip(0.8 - 0.02 * curve_ws, 0.1, 0.8))
+        return TurbineModel(TurbineSpec(
+            name=name,
+            hub_height=hub_height,
+            rotor_diameter=120,
+            rated_power=3000,
+            power_curve=pd.DataFrame({'ws': curve_ws, 'power': curve_power}),
+            ct_curve=pd.DataFrame({'ws': curve_ws, 'ct': curve_ct}),
+            metadata=metadata or {}
+        ))
+
+    return make
+
+
+@pytest.fixture
+def synthetic_wind_data():
+    """
+    Factory of reproducible hourly WindData.
+
+    Returns:
+        Function (n_hours, seed, height, start, **columns) returning WindData
+        with Weibull wind speeds (A = 9 m/s, k = 2, rounded to 0.1 m/s) and
+        integer-degree directions; columns add or replace series (e.g. ws,
+        wd, rmol) as arrays of n_hours values or scalars
+
+    Example:
+        >>> wind_data = synthetic_wind_data(n_hours=240, rmol=0.0)
+    """
+    def make(n_hours=500, seed=0, height=120.0, start='2014-01-01', **columns):
+        rng = np.random.default_rng(seed)
+        timeseries = pd.DataFrame(
+            {
+                'ws': np.round(rng.weibull(2.0, n_hours) * 9.0, 1),
+                'wd': np.round(rng.uniform(0, 360, n_hours)) % 360,
+                **columns
+            },
+            index=pd.date_range(start, periods=n_hours, freq='h')
+        )
+        return WindData(timeseries=timeseries, height=height)
+
+    return make
+
+
+@pytest.fixture
+def hourly_power():
+    """
+    Factory of synthetic Weibull-like hourly power per turbine.
+
+    Returns:
+        Function (n_turbines, years, seed, start, scale_w, rated_w) returning
+        (power_w, index): power in W of shape (n_turbines, n_hours), clipped
+        to rated_w, on an hourly DatetimeIndex starting at start
+
+    Example:
+        >>> power, index = hourly_power(n_turbines=3, years=1)
+    """
+    def make(n_turbines=8, years=3, seed=0, start='2020-01-01', scale_w=1.2e6, rated_w=3.0e6):
+        index = pd.date_range(start, periods=years * 8760, freq='h')
+        rng = np.random.default_rng(seed)
+        power = np.clip(rng.weibull(2.0, (n_turbines, len(index))) * scale_w, 0, rated_w)
+        return power, index
+
+    return make
@@ -14,7 +14,8 @@ from latam_hybrid.wind.sector_management import (
     calculate_sector_availability,
     validate_sector_ranges,
     create_sector_mask,
-    get_sector_statistics
+    get_sector_statistics,
+    SectorEngine
 )
 
 
@@ -329,3 +330,42 @@ class TestSectorManagementConfig:
             SectorManagementConfig(
                 turbine_sectors={1: [(120, 60)]}
             )
+
+
+class TestSectorEngine:
+    """Test the compiled lookup-table sector engine."""
+
+    def test_matches_scalar_check(self):
+        """Test engine mask equals is_direction_in_sectors for every direction."""
+        turbine_sectors = {1: [(60, 120), (240, 300)], 3: [(0.05, 45.35), (359.9, 360)]}
+        rng = np.random.default_rng(0)
+        wind_dirs = np.concatenate([
+            rng.uniform(-360, 720, 5000),
+            [0, 0.05, 45.35, 60, 120, 240, 300, 359.9, 360, -10, np.nan],
+            np.nextafter([60.0, 120.0, 45.35], 0),
+            np.nextafter([60.0, 120.0, 45.35], 400)
+        ])
+
+        engine = SectorEngine(turbine_sectors)
+        mask = engine.operating_mask(wind_dirs, n_turbines=3)
+
+        for turbine_id, sectors in turbine_sectors.items():
+            expected = [is_direction_in_sectors(wd, sectors) for wd in wind_dirs]
+            np.testing.assert_array_equal(mask[:, turbine_id - 1], expected)
+        assert mask[:, 1].all()
+
+    def test_prohibited_energy(self):
+        """Test energy is summed over prohibited timesteps only."""
+        wind_dirs = np.array([45, 90, 150, 270])
+        power = np.array([[1.0, 2.0, 4.0, 8.0], [1.0, 1.0, 1.0, 1.0]])
+
+        engine = SectorEngine({1: [(60, 120), (240, 300)]})
+        losses = engine.prohibited_energy(power, wind_dirs)
+
+        np.testing.assert_allclose(losses, [5.0, 0.0])
+
+    def test_invalid_turbine_id(self):
+        """Test error when turbine ID out of range."""
+        engine = SectorEngine({5: [(60, 120)]})
+        with pytest.raises(ValueError, match="out of range"):
+            engine.prohibited_energy(np.ones((2, 3)), np.array([10, 20, 30]))
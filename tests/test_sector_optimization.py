@@ -0,0 +1,136 @@
+"""
+Tests for sector-configuration what-if evaluation and optimization.
+
+Uses the shared synthetic hourly power (conftest) so no PyWake run is needed.
+Tests verify:
+- Batch evaluation matches direct hour-by-hour sector losses
+- Optimized configurations meet their stop requirements
+- Optimized sectors prohibit only the stopped directions
+- Overlapping requirements on one turbine share their stops
+"""
+
+import pytest
+import numpy as np
+
+from latam_hybrid.core import SectorManagementConfig
+from latam_hybrid.wind import SectorScenarioEngine, StopRequirement
+from latam_hybrid.wind.sector_management import SectorEngine, _directions_in_sectors
+
+
+@pytest.fixture
+def scenario_inputs(hourly_power):
+    """Three turbines, one year of hourly power and integer-degree directions."""
+    power_w, index = hourly_power(n_turbines=3, years=1, seed=3)
+    wind_directions = np.random.default_rng(3).integers(0, 360, len(index)).astype(float)
+    return power_w, wind_directions
+
+
+class TestScenarioEvaluation:
+    """Test batch evaluation of candidate configurations."""
+
+    def test_matches_hourly_losses(self, scenario_inputs):
+        """Test grouped evaluation equals summing prohibited hours directly."""
+        power_w, wind_directions = scenario_inputs
+        configs = [
+            None,
+            SectorManagementConfig(turbine_sectors={1: [(60, 120), (240, 300)]}),
+            {2: [(0, 180)], 3: [(90.5, 270)]},
+        ]
+
+        results = SectorScenarioEngine(power_w, wind_directions).evaluate(configs)
+
+        annual = 1e-9 * 8760 / len(wind_directions)
+        for c, config in enumerate(configs[1:], start=1):
+            sectors = config.turbine_sectors if hasattr(config, 'turbine_sectors') else config
+            expected = SectorEngine(sectors).prohibited_energy(power_w, wind_directions) * annual
+            np.testing.assert_allclose(results.turbine_loss_gwh[c], expected, rtol=1e-12)
+
+        assert results.farm_loss_gwh[0] == 0.0
+        assert results.farm_aep_gwh[0] == pytest.approx(power_w.sum() * annual)
+
+    def test_dataframe_summary(self, scenario_inputs):
+        """Test the summary table has one row per configuration."""
+        engine = SectorScenarioEngine(*scenario_inputs)
+        df = engine.evaluate([None, {1: [(0, 90)]}], labels=['none', 'narrow']).to_dataframe()
+
+        assert list(df.index) == ['none', 'narrow']
+        assert 'T1_loss_gwh' in df.columns
+        assert df.loc['narrow', 'sector_loss_gwh'] > 0
+
+
+class TestSectorOptimization:
+    """Test the stop-requirement optimizer."""
+
+    @pytest.mark.parametrize("strategy", ['greedy', 'contiguous'])
+    def test_requirements_met(self, scenario_inputs, strategy):
+        """Test optimized configuration satisfies every stop requirement."""
+        engine = SectorScenarioEngine(*scenario_inputs)
+        requirements = [
+            StopRequirement(turbine_id=1, directions=[(150, 210)], min_hours_per_year=400),
+            StopRequirement(turbine_id=3, directions=[(0, 45)], min_hours_per_year=200),
+        ]
+
+        result = engine.optimize(requirements, strategy=strategy)
+
+        assert set(result.config.turbine_sectors) == {1, 3}
+        for requirement, achieved in zip(requirements, result.stopped_hours_per_year, strict=True):
+            assert achieved >= requirement.min_hours_per_year
+        assert result.turbine_loss_gwh[1] == 0.0
+
+    def test_greedy_not_worse_than_contiguous(self, scenario_inputs):
+        """Test the unconstrained-shape greedy stop set loses no more energy."""
+        engine = SectorScenarioEngine(*scenario_inputs)
+        requirements = [StopRequirement(1, [(100, 260)], 800)]
+
+        greedy = engine.optimize(requirements, strategy='greedy')
+        contiguous = engine.optimize(requirements, strategy='contiguous')
+
+        assert greedy.farm_loss_gwh <= contiguous.farm_loss_gwh
+
+    def test_default_strategy_is_contiguous(self, scenario_inputs):
+        """Test the default stops one window per requirement; greedy fragments it."""
+        engine = SectorScenarioEngine(*scenario_inputs)
+        requirements = [StopRequirement(1, [(100, 260)], 800)]
+
+        default = engine.optimize(requirements)
+        greedy = engine.optimize(requirements, strategy='greedy')
+
+        assert default.config.metadata['source'].endswith('(contiguous)')
+        # One stop window leaves at most two allowed ranges around it
+        assert len(default.config.turbine_sectors[1]) <= 2
+        assert len(greedy.config.turbine_sectors[1]) > 2
+
+    def test_sector_edges_on_direction_grid(self, hourly_power):
+        """Test only stopped directions are prohibited, not the gaps between data."""
+        power_w, index = hourly_power(n_turbines=2, years=1, seed=4)
+        wind_directions = np.random.default_rng(4).integers(0, 36, len(index)) * 10.0
+        engine = SectorScenarioEngine(power_w, wind_directions)
+
+        result = engine.optimize([StopRequirement(1, [(100, 260)], 800)])
+        sectors = result.config.turbine_sectors[1]
+
+        observed_stops = engine.directions[~engine.allowed_directions(sectors)]
+        grid = np.arange(0, 360, 0.1)
+        grid_stops = grid[~_directions_in_sectors(grid, sectors)]
+        assert grid_stops.min() > observed_stops.min() - 0.1
+        assert grid_stops.max() < observed_stops.max() + 0.1
+        assert result.stopped_hours_per_year[0] >= 800
+
+    @pytest.mark.parametrize("strategy", ['greedy', 'contiguous'])
+    def test_overlapping_requirements(self, scenario_inputs, strategy):
+        """Test requirements on one turbine share stops instead of adding up."""
+        engine = SectorScenarioEngine(*scenario_inputs)
+        larger = StopRequirement(1, [(100, 260)], 800)
+        smaller = StopRequirement(1, [(100, 260)], 400)
+
+        alone = engine.optimize([larger], strategy=strategy)
+        both = engine.optimize([smaller, larger], strategy=strategy)
+
+        assert both.config.turbine_sectors == alone.config.turbine_sectors
+        assert both.farm_loss_gwh == pytest.approx(alone.farm_loss_gwh)
+
+    def test_infeasible_requirement(self, scenario_inputs):
+        """Test requirement exceeding available hours is rejected."""
+        engine = SectorScenarioEngine(*scenario_inputs)
+        with pytest.raises(ValueError, match="required"):
+            engine.optimize([StopRequirement(2, [(10, 12)], 5000)])
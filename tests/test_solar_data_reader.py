@@ -0,0 +1,96 @@
+"""
+Tests for the PVGIS solar data reader.
+
+Uses small PVGIS-format CSV files written to a temporary directory.
+Tests verify:
+- Header and legend footer are located without a fixed skiprows
+- PVGIS 'YYYYMMDD:HHMM' timestamps become the DatetimeIndex
+- Chunked parsing gives the same frame as a single pass
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from latam_hybrid.input.solar_data_reader import PVGISReader
+
+
+PVGIS_HEADER = """Latitude (decimal degrees):\t19.718
+Longitude (decimal degrees):\t-71.356
+Elevation (m):\t120
+Radiation database:\tPVGIS-SARAH2
+
+
+Slope: 15 deg. (optimum)
+Azimuth: 0 deg.
+Nominal power of the PV system (c-Si) (kWp):\t1.0
+System losses (%):\t14.0
+time,P,G(i),H_sun,T2m,WS10m,Int
+"""
+
+PVGIS_FOOTER = """
+P: PV system power (W)
+G(i): Global irradiance on the inclined plane (plane of the array) (W/m2)
+H_sun: Sun height (degree)
+T2m: 2-m air temperature (degree Celsius)
+WS10m: 10-m total wind speed (m/s)
+Int: 1 means solar radiation values are reconstructed
+
+PVGIS (c) European Union, 2001-2024
+"""
+
+
+def write_pvgis_file(path, n_hours=48):
+    """Write a PVGIS-format file starting 2020-01-01 00:10."""
+    index = pd.date_range('2020-01-01 00:10', periods=n_hours, freq='h')
+    lines = [
+        f"{t:%Y%m%d:%H%M},{max(0, 600 - abs(t.hour - 12) * 100)}.25,"
+        f"{max(0, 900 - abs(t.hour - 12) * 150)}.5,{t.hour}.0,24.5,3.2,0.0"
+        for t in index
+    ]
+    path.write_text(PVGIS_HEADER + "\n".join(lines) + "\n" + PVGIS_FOOTER)
+    return index
+
+
+class TestPVGISReader:
+    """Single-pass reading of PVGIS hourly series."""
+
+    def read(self, path, **kwargs):
+        return PVGISReader.read_pvgis_csv(
+            path, capacity_kw=1.0, apply_time_shift=False, validate=False, **kwargs
+        )
+
+    def test_header_footer_and_timestamps(self, tmp_path):
+        """Only the data block is parsed and stamps use the PVGIS format."""
+        path = tmp_path / "pvgis.csv"
+        expected = write_pvgis_file(path)
+
+        df = self.read(path).timeseries
+
+        pd.testing.assert_index_equal(df.index, expected, check_names=False)
+        assert list(df.columns) == ['P', 'G(i)', 'H_sun', 'T2m', 'WS10m', 'Int']
+        assert df['P'].dtype == np.float64
+        assert df['G(i)'].dtype == np.float32
+        assert df['P'].iloc[12] == pytest.approx(600.25)
+
+    def test_explicit_skiprows(self, tmp_path):
+        """A fixed number of header rows still works."""
+        path = tmp_path / "pvgis.csv"
+        write_pvgis_file(path)
+
+        auto = self.read(path).timeseries
+        fixed = self.read(path, skiprows=10).timeseries
+
+        pd.testing.assert_frame_equal(auto, fixed)
+
+    def test_chunked_matches_single_pass(self, tmp_path):
+        """Streaming in chunks reproduces the single-pass frame."""
+        path = tmp_path / "pvgis.csv"
+        write_pvgis_file(path, n_hours=100)
+
+        single = self.read(path).timeseries
+        chunked = self.read(path, chunksize=30).timeseries
+        chunks = list(PVGISReader.iter_pvgis_chunks(path, chunksize=30))
+
+        pd.testing.assert_frame_equal(chunked, single)
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
@@ -0,0 +1,87 @@
+"""
+Tests for Monte Carlo turbine availability.
+
+Uses the shared synthetic hourly power (conftest) for up to 13 turbines.
+Tests verify:
+- Outage energy from the cumulative power equals an hour-by-hour mask
+- Mean availability converges to MTBF / (MTBF + MTTR)
+- Per-year energies and P-values of the realization distribution
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from latam_hybrid.wind import OutageModel, simulate_availability
+from latam_hybrid.wind.availability import _sample_outages
+
+
+class TestOutageModel:
+    """Failure and repair parameters."""
+
+    def test_from_availability(self):
+        """MTBF follows from the availability and MTTR."""
+        model = OutageModel.from_availability(0.97, mttr_hours=96)
+
+        assert model.mtbf_hours == pytest.approx(3104.0)
+        assert model.availability == pytest.approx(0.97)
+
+    def test_validation(self):
+        """Availability and times must be in range."""
+        with pytest.raises(ValueError):
+            OutageModel.from_availability(1.0)
+        with pytest.raises(ValueError):
+            OutageModel(mtbf_hours=1000, mttr_hours=0)
+
+
+class TestSimulateAvailability:
+    """Energy distribution over realizations."""
+
+    def test_matches_hourly_mask(self, hourly_power):
+        """Lost energy equals the power × outage overlap of every hour."""
+        power, index = hourly_power(n_turbines=3, years=1)
+        model = OutageModel(mtbf_hours=300, mttr_hours=40)
+
+        result = simulate_availability(power, index, model, n_realizations=2, seed=4)
+
+        sequence, start, end = _sample_outages(model, 2 * 3, len(index), np.random.default_rng(4))
+        hours = np.arange(len(index))
+        expected = np.full(2, power.sum())
+        for seq, a, b in zip(sequence, start, end, strict=True):
+            overlap = np.clip(np.minimum(hours + 1, b) - np.maximum(hours, a), 0, None)
+            expected[seq // 3] -= (overlap * power[seq % 3]).sum()
+
+        np.testing.assert_allclose(result.annual_energy_gwh, expected / 1e9, rtol=1e-10)
+
+    def test_constant_power_and_convergence(self):
+        """With constant power, energy and time availability agree and approach A."""
+        index = pd.date_range('2014-01-01', periods=5 * 8760, freq='h')
+        power = np.full((13, len(index)), 2e6)
+        model = OutageModel.from_availability(0.97, mttr_hours=96)
+
+        result = simulate_availability(power, index, model, n_realizations=2000, seed=1)
+
+        np.testing.assert_allclose(result.energy_availability, result.availability, rtol=1e-10)
+        assert result.availability.mean() == pytest.approx(0.97, abs=0.002)
+        assert result.gross_energy_gwh == pytest.approx(13 * 2e6 * 8760 / 1e9)
+
+    def test_yearly_distribution(self, hourly_power):
+        """Years sum to the record; P90 is below P50 and the gross energy."""
+        power, index = hourly_power(n_turbines=13)
+        model = OutageModel.from_availability(0.95, mttr_hours=120)
+
+        result = simulate_availability(power, index, model, n_realizations=500, seed=2)
+
+        assert list(result.yearly_energy_gwh.columns) == [2020, 2021, 2022]
+        np.testing.assert_allclose(
+            result.yearly_energy_gwh.sum(axis=1) * 8760 / len(index), result.annual_energy_gwh
+        )
+        levels = result.exceedance_levels((50, 90), by='year')
+        assert levels['P90'] < levels['P50'] < result.gross_energy_gwh
+        assert result.summary()['realizations'] == 500
+
+    def test_shape_validation(self, hourly_power):
+        """Power must match the index."""
+        power, index = hourly_power(n_turbines=13, years=1)
+        with pytest.raises(ValueError):
+            simulate_availability(power[:, 1:], index, OutageModel(1000, 50))
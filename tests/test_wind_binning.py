@@ -0,0 +1,60 @@
+"""
+Tests for binned compression of wind timeseries.
+
+Uses short hand-written wind records. Tests verify:
+- Bins cover every hour and scatter restores the hourly timeline
+- Hours with non-finite ws or wd are left out of the bins
+- Direction resolutions must divide 360°
+- The power-curve AEP proxy vanishes when the data is already on the grid
+"""
+
+import numpy as np
+import pytest
+
+from latam_hybrid.wind import bin_wind_timeseries
+from latam_hybrid.wind.timeseries_binning import estimate_binning_aep_error
+
+
+class TestBinWindTimeseries:
+    """Test quantization of (ws, wd) pairs to unique bins."""
+
+    def test_binning_round_trip(self):
+        """Test that bins cover every hour and scatter restores the timeline."""
+        ws = np.array([5.01, 5.02, 7.4, 5.0, 12.6])
+        wd = np.array([359.8, 0.2, 90.0, 0.0, 180.4])
+        binned = bin_wind_timeseries(ws, wd, ws_resolution=0.25, wd_resolution=1.0)
+
+        assert binned.n_bins == 3
+        assert binned.counts.sum() == len(ws)
+        np.testing.assert_allclose(binned.scatter(binned.ws), [5.0, 5.0, 7.5, 5.0, 12.5])
+        np.testing.assert_allclose(binned.scatter(binned.wd), [0.0, 0.0, 90.0, 0.0, 180.0])
+
+    def test_non_finite_hours_are_not_binned(self):
+        """Test that NaN ws or wd creates no flow case and scatters back as NaN."""
+        binned = bin_wind_timeseries([5.0, np.nan, 7.0], [10.0, 20.0, np.nan])
+
+        assert binned.n_bins == 1
+        np.testing.assert_allclose(binned.ws, [5.0])
+        np.testing.assert_allclose(binned.wd, [10.0])
+        np.testing.assert_array_equal(binned.valid, [True, False, False])
+        power = binned.scatter(np.array([[1.5e6], [2.0e6]]))
+        np.testing.assert_array_equal(power, [[1.5e6, np.nan, np.nan], [2.0e6, np.nan, np.nan]])
+
+    def test_invalid_resolution(self):
+        """Test that a direction step not dividing 360 is rejected."""
+        with pytest.raises(ValueError):
+            bin_wind_timeseries(np.ones(3), np.zeros(3), wd_resolution=7.0)
+
+
+class TestBinningAepError:
+    """Test the power-curve proxy for the quantization error."""
+
+    def test_on_grid_data_has_no_error(self):
+        """Test zero error on-grid and a non-zero error for a coarse grid."""
+        ws = np.array([4.0, 6.5, 8.25, 11.0])
+        binned = bin_wind_timeseries(ws, np.zeros(4), ws_resolution=0.25)
+
+        assert estimate_binning_aep_error(ws, binned, lambda v: v ** 3) == pytest.approx(0.0)
+
+        coarse = bin_wind_timeseries(ws, np.zeros(4), ws_resolution=2.0)
+        assert estimate_binning_aep_error(ws, coarse, lambda v: v ** 3) != pytest.approx(0.0)
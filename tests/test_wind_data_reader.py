@@ -0,0 +1,262 @@
+"""
+Tests for the Vortex wind data reader.
+
+Uses small Vortex-format text files written to a temporary directory.
+Tests verify:
+- Timestamps are parsed from the native YYYYMMDD and HHMM columns
+- Window and shear views share the loaded buffers
+- The binary ingest cache reproduces the parsed file and tracks edits
+- The memoized ws × wd histogram matches a direct count
+- Atmospheric columns are kept for the air density correction
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from latam_hybrid.core import WindHistogram
+from latam_hybrid.input.ingest_cache import ingest_cache_key, load_cached_frame
+from latam_hybrid.input.wind_data_reader import VortexWindReader
+
+
+VORTEX_HEADER = """Lat=19.71814  Lon=-71.35602  Hub-Height=164  Timezone=-04.0
+VORTEX (www.vortexfdc.com) - Computed at 3km resolution based on ERA5 data
+
+YYYYMMDD HHMM  M(m/s) D(deg)  T(C)  De(k/m3) PRE(hPa)      RiNumber  RH(%)   RMOL(1/m)
+"""
+
+
+def write_vortex_file(path, n_hours=30):
+    """Write a Vortex-format file starting 2023-12-31 22:00."""
+    index = pd.date_range('2023-12-31 22:00', periods=n_hours, freq='h')
+    lines = [
+        f"{t:%Y%m%d} {t:%H%M}    {5 + i % 7:.1f}  {(i * 13) % 360:5d}   24.6    1.15     981.2"
+        f"           0.16   83.3      0.0000"
+        for i, t in enumerate(index)
+    ]
+    path.write_text(VORTEX_HEADER + "\n".join(lines) + "\n")
+    return index
+
+
+def read_vortex_file(directory, height=164.0, cache_dir=None, write=True):
+    """Write (unless write=False) and read back a Vortex-format file."""
+    path = directory / "vortex.serie.txt"
+    if write:
+        write_vortex_file(path)
+    return VortexWindReader.read_vortex_timeseries(
+        path,
+        height=height,
+        skiprows=3,
+        column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'},
+        validate=False,
+        cache_dir=cache_dir
+    )
+
+
+class TestVortexTimestamps:
+    """Vortex date and time-of-day columns become the DatetimeIndex."""
+
+    def test_index_from_date_and_time_columns(self, tmp_path):
+        """Hourly timestamps, including the year change, are parsed exactly."""
+        path = tmp_path / "vortex.serie.txt"
+        expected = write_vortex_file(path)
+
+        wind_data = VortexWindReader.read_vortex_timeseries(
+            path,
+            height=164.0,
+            skiprows=3,
+            column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'},
+            validate=False
+        )
+
+        pd.testing.assert_index_equal(wind_data.timeseries.index, expected, check_names=False)
+        assert list(wind_data.timeseries.columns) == [
+            'ws', 'wd', 'temperature', 'air_density', 'pressure', 'richardson', 'rmol'
+        ]
+        assert wind_data.metadata['date_range'][0] == pd.Timestamp('2023-12-31 22:00')
+
+
+class TestWindDataViews:
+    """WindData.window / scaled / at_height avoid copying the timeseries."""
+
+    def test_window_shares_buffers(self, tmp_path):
+        """A calendar window is a view of the loaded columns."""
+        wind_data = read_vortex_file(tmp_path)
+
+        year = wind_data.window('2024', '2024')
+
+        assert year.timeseries.index[0] == pd.Timestamp('2024-01-01 00:00')
+        assert len(year.timeseries) == 28
+        assert np.shares_memory(year.timeseries['wd'].values, wind_data.timeseries['wd'].values)
+        assert year.metadata['window'][0] == pd.Timestamp('2024-01-01 00:00')
+
+    def test_empty_window_raises(self, tmp_path):
+        """Selecting outside the record is an error rather than empty data."""
+        wind_data = read_vortex_file(tmp_path)
+
+        with pytest.raises(ValueError):
+            wind_data.window('2030', '2030')
+
+    def test_at_height_scales_only_wind_speed(self, tmp_path):
+        """Power-law shift replaces 'ws' and keeps 'wd' shared."""
+        wind_data = read_vortex_file(tmp_path, height=100.0)
+
+        hub = wind_data.at_height(125.0, alpha=0.2)
+        factor = 1.25 ** 0.2
+
+        assert hub.height == 125.0
+        assert hub.metadata['correction_factor'] == pytest.approx(factor)
+        np.testing.assert_allclose(hub.timeseries['ws'], wind_data.timeseries['ws'] * factor)
+        assert np.shares_memory(hub.timeseries['wd'].values, wind_data.timeseries['wd'].values)
+        assert wind_data.at_height(100.0, alpha=0.2) is wind_data
+
+
+class TestIngestCache:
+    """Parsed Vortex files are cached as memory-mapped binary columns."""
+
+    def test_cached_read_matches_text_parse(self, tmp_path):
+        """Second read comes from the cache and equals the parsed file."""
+        cache_dir = tmp_path / "ingest"
+        parsed = read_vortex_file(tmp_path)
+        first = read_vortex_file(tmp_path, cache_dir=cache_dir, write=False)
+        second = read_vortex_file(tmp_path, cache_dir=cache_dir, write=False)
+
+        assert len(list(cache_dir.glob('*/index.json'))) == 1
+        pd.testing.assert_frame_equal(first.timeseries, parsed.timeseries)
+        pd.testing.assert_frame_equal(second.timeseries, parsed.timeseries)
+
+    def test_all_columns_stored(self, tmp_path):
+        """The entry keeps every Vortex column, not only ws and wd."""
+        cache_dir = tmp_path / "ingest"
+        path = tmp_path / "vortex.serie.txt"
+        write_vortex_file(path)
+        key = ingest_cache_key(
+            path, skiprows=3, column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'}
+        )
+        read_vortex_file(tmp_path, cache_dir=cache_dir, write=False)
+
+        frame = load_cached_frame(cache_dir, key)
+
+        assert {'ws', 'wd', 'T(C)', 'De(k/m3)', 'PRE(hPa)', 'RMOL(1/m)'} <= set(frame.columns)
+        assert isinstance(frame['ws'].values, np.memmap)
+
+    def test_edited_file_is_reparsed(self, tmp_path):
+        """Changing the source file invalidates the entry."""
+        cache_dir = tmp_path / "ingest"
+        read_vortex_file(tmp_path, cache_dir=cache_dir)
+
+        write_vortex_file(tmp_path / "vortex.serie.txt", n_hours=48)
+        wind_data = read_vortex_file(tmp_path, cache_dir=cache_dir, write=False)
+
+        assert len(wind_data.timeseries) == 48
+
+
+class TestMultipleHeights:
+    """Vortex files for several heights are read concurrently."""
+
+    def test_read_multiple_heights(self, tmp_path):
+        """Each height gets its own WindData, in the requested order."""
+        for height in (100, 150):
+            write_vortex_file(tmp_path / f"vortex.serie.{height}m.txt")
+
+        records = VortexWindReader.read_vortex_multiple_heights(
+            str(tmp_path / "vortex.serie.{height}m.txt"),
+            heights=[150.0, 100.0],
+            skiprows=3,
+            column_mapping={'ws': 'M(m/s)', 'wd': 'D(deg)'},
+            validate=False
+        )
+
+        assert list(records) == [150.0, 100.0]
+        assert records[100.0].height == 100.0
+        assert len(records[150.0].timeseries) == 30
+
+
+class TestWindHistogram:
+    """Joint ws × wd histogram computed once per binning."""
+
+    def test_counts_match_direct_binning(self, tmp_path):
+        """Cell counts and sector means equal a plain per-sector count."""
+        wind_data = read_vortex_file(tmp_path)
+        ws = wind_data.timeseries['ws'].to_numpy()
+        wd = wind_data.timeseries['wd'].to_numpy()
+
+        hist = wind_data.histogram(ws_bins=2.0, n_sectors=4)
+
+        sector = (wd // 90).astype(int) % 4
+        assert hist.counts.shape == (4, len(hist.ws_edges) - 1)
+        assert hist.counts.sum(axis=1).tolist() == np.bincount(sector, minlength=4).tolist()
+        assert hist.counts.sum(axis=0)[2] == np.sum((ws >= 4) & (ws < 6))
+        np.testing.assert_allclose(hist.sector_mean_ws[0], ws[sector == 0].mean())
+        assert hist.sector_frequency.sum() == pytest.approx(1.0)
+
+    def test_memoized_per_binning(self, tmp_path):
+        """Repeated calls reuse the histogram; new binnings are new objects."""
+        wind_data = read_vortex_file(tmp_path)
+
+        first = wind_data.histogram(n_sectors=12)
+
+        assert wind_data.histogram(n_sectors=12) is first
+        assert wind_data.histogram(n_sectors=16) is not first
+        assert wind_data.window('2024', '2024').histogram(n_sectors=12) is not first
+
+    def test_missing_and_high_values(self):
+        """NaN timesteps are skipped and speeds above the edges go to the last bin."""
+        hist = WindHistogram.from_arrays(
+            ws=[1.0, np.nan, 30.0, 5.0],
+            wd=[10.0, 20.0, 370.0, np.nan],
+            ws_bins=[0.0, 10.0, 20.0],
+            n_sectors=12
+        )
+
+        assert hist.n_samples == 2
+        assert hist.counts[0].tolist() == [1, 1]
+
+
+class TestAtmosphereColumns:
+    """Temperature, density and pressure are kept for density correction."""
+
+    def test_columns_and_dtype(self, tmp_path):
+        """Standard names, optional float32, and the same columns from cache."""
+        path = tmp_path / "vortex.serie.txt"
+        write_vortex_file(path)
+        options = {
+            'height': 164.0, 'skiprows': 3, 'column_mapping': {'ws': 'M(m/s)', 'wd': 'D(deg)'},
+            'validate': False, 'atmosphere_dtype': 'float32', 'cache_dir': tmp_path / "ingest"
+        }
+
+        parsed = VortexWindReader.read_vortex_timeseries(path, **options)
+        cached = VortexWindReader.read_vortex_timeseries(path, **options)
+
+        for wind_data in (parsed, cached):
+            timeseries = wind_data.timeseries
+            assert timeseries['air_density'].dtype == np.float32
+            assert timeseries['ws'].dtype == np.float64
+            assert timeseries['pressure'].iloc[0] == pytest.approx(981.2)
+        np.testing.assert_allclose(parsed.air_density(), 1.15, rtol=1e-6)
+
+        ws_only = VortexWindReader.read_vortex_timeseries(path, **{**options, 'atmosphere_columns': ()})
+        assert list(ws_only.timeseries.columns) == ['ws', 'wd']
+
+    def test_density_normalized(self, tmp_path):
+        """V_n = V × (rho / rho_ref)^(1/3); idempotent for the same reference."""
+        wind_data = read_vortex_file(tmp_path)
+
+        normalized = wind_data.density_normalized(1.225)
+
+        np.testing.assert_allclose(
+            normalized.timeseries['ws'],
+            wind_data.timeseries['ws'] * (1.15 / 1.225) ** (1 / 3)
+        )
+        assert normalized.timeseries['wd'].values.base is wind_data.timeseries['wd'].values.base
+        assert normalized.density_normalized(1.225) is normalized
+        with pytest.raises(ValueError):
+            normalized.density_normalized(1.2)
+
+    def test_density_from_pressure_and_temperature(self, tmp_path):
+        """Without a density column, rho follows from B / (R T)."""
+        wind_data = read_vortex_file(tmp_path)
+        timeseries = wind_data.timeseries.drop(columns='air_density')
+        derived = wind_data._derive(timeseries)
+
+        assert derived.air_density()[0] == pytest.approx(98120 / (287.05 * 297.75))
@@ -0,0 +1,112 @@
+"""
+Tests for the time-resolved operational loss engine.
+
+Uses the shared synthetic hourly power (conftest) for 8 turbines.
+Tests verify:
+- Calibrated transforms reproduce the nominal category values
+- Deterministic losses reconcile with WindFarmLosses' multiplicative total
+- Results do not depend on the chunk size
+- Outage masks (per turbine and farm-wide) and the degradation ramp
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from latam_hybrid.wind import (
+    WindFarmLosses, OperationalLossEngine, LossTransform, UniformLoss, OutageLoss,
+    DegradationRamp, create_default_losses
+)
+
+
+RATED_KW = 3000.0
+
+
+class TestCalibration:
+    """Annual summary against the nominal loss values."""
+
+    def test_shaped_losses_reconcile(self, hourly_power):
+        """Without outages every category removes exactly its nominal fraction."""
+        losses = create_default_losses()
+        engine = OperationalLossEngine.from_losses(losses, transforms={
+            'availability_turbines': UniformLoss(),
+            'availability_grid': UniformLoss()
+        })
+        power, index = hourly_power()
+
+        result = engine.apply(power, index, RATED_KW)
+
+        np.testing.assert_allclose(
+            result.summary['realized_percent'], result.summary['nominal_percent'], rtol=1e-9
+        )
+        breakdown = losses.get_loss_breakdown()
+        for name in result.summary.index:
+            assert result.summary.loc[name, 'nominal_percent'] == breakdown[name]['percentage']
+        assert result.remaining_factor == pytest.approx(losses.calculate_total_loss_factor(), rel=1e-9)
+
+    def test_hourly_shapes(self, hourly_power):
+        """Electrical losses are relatively larger at full load."""
+        engine = OperationalLossEngine.from_losses(WindFarmLosses().add_loss('electrical_losses', 0.02))
+        power, index = hourly_power()
+
+        result = engine.apply(power, index, RATED_KW)
+
+        fraction = 1 - result.net_power_w / np.where(power > 0, power, np.nan)
+        full_load = power >= RATED_KW * 1000
+        assert np.nanmean(fraction[full_load]) > 0.02 > np.nanmean(fraction[power < 3e5])
+
+    def test_chunk_independent(self, hourly_power):
+        """Stochastic and calibrated results are the same for any chunk size."""
+        power, index = hourly_power()
+        losses = create_default_losses()
+
+        whole = OperationalLossEngine.from_losses(losses, seed=3).apply(power, index, RATED_KW)
+        chunked = OperationalLossEngine.from_losses(losses, seed=3, chunk_hours=1000).apply(
+            power, index, RATED_KW
+        )
+
+        np.testing.assert_allclose(chunked.net_power_w, whole.net_power_w, rtol=1e-12)
+        pd.testing.assert_frame_equal(chunked.summary, whole.summary)
+
+
+class TestTransforms:
+    """Individual hourly transforms."""
+
+    def test_outages(self, hourly_power):
+        """Per-turbine outages differ between turbines, grid outages do not."""
+        power, index = hourly_power(years=10)
+        losses = WindFarmLosses().add_loss('availability_turbines', 0.05).add_loss('availability_grid', 0.02)
+
+        result = OperationalLossEngine.from_losses(losses).apply(power, index, RATED_KW)
+
+        turbine_loss = result.turbine_loss_gwh.loc['availability_turbines']
+        grid_down = result.hourly_loss_mwh['availability_grid'].values > 0
+        assert turbine_loss.nunique() == len(turbine_loss)
+        assert (result.net_power_w[:, grid_down] == 0).all()
+        assert result.summary.loc['availability_turbines', 'realized_percent'] == pytest.approx(5.0, abs=1.0)
+        assert not result.summary['calibrated'].any()
+
+    def test_degradation_ramp(self, hourly_power):
+        """Losses grow with the operating year and average to the nominal value."""
+        power, index = hourly_power(years=4)
+        losses = WindFarmLosses().add_loss('environmental_performance_degradation', 0.03)
+
+        result = OperationalLossEngine.from_losses(losses).apply(power, index, RATED_KW)
+
+        yearly = result.hourly_loss_mwh.iloc[:, 0].groupby(index.year).sum()
+        assert yearly.is_monotonic_increasing
+        assert result.summary['realized_percent'].iloc[0] == pytest.approx(3.0)
+        assert isinstance(
+            OperationalLossEngine.from_losses(losses).categories[0][1], DegradationRamp
+        )
+
+    def test_shape_validation(self, hourly_power):
+        """Power must be (n_turbines, n_hours) on the index; outages need a duration."""
+        power, index = hourly_power()
+        engine = OperationalLossEngine.from_losses(create_default_losses())
+        with pytest.raises(ValueError):
+            engine.apply(power[:, :-1], index, RATED_KW)
+        with pytest.raises(ValueError):
+            OutageLoss(mean_outage_hours=0)
+        with pytest.raises(TypeError):
+            type('NoShape', (LossTransform,), {})()
@@ -6,6 +6,7 @@ Tests the WindPRO-compliant losses calculation including:
 - Multiplicative loss formula
 - Loss application to AEP
 - Integration with WindSite
+- High-wind hysteresis state machine
 """
 
 import pytest
@@ -14,7 +15,8 @@ from latam_hybrid.wind.losses import (
     WindFarmLosses,
     LossCategory,
     LossType,
-    create_default_losses
+    create_default_losses,
+    simulate_high_wind_hysteresis
 )
 
 
@@ -485,5 +487,56 @@ class TestFutureSectorManagement:
         assert breakdown['curtailment_sector_management']['is_computed'] is True
 
 
+class TestHighWindHysteresis:
+    """Cut-out/restart state machine as an array scan."""
+
+    @staticmethod
+    def reference_stopped(ws, cut_out, restart):
+        """Per-sample state machine."""
+        stopped = np.zeros(ws.shape, dtype=bool)
+        for turbine in range(ws.shape[0]):
+            state = False
+            for i, value in enumerate(ws[turbine]):
+                if state and not value >= restart:
+                    state = False
+                if not state and value >= cut_out:
+                    state = True
+                stopped[turbine, i] = state
+        return stopped
+
+    def test_matches_state_machine(self):
+        """The scan reproduces the per-sample loop, NaN wind speeds restart."""
+        rng = np.random.default_rng(1)
+        ws = rng.uniform(15, 30, (3, 2000))
+        ws[1, 10] = np.nan
+        power = rng.uniform(0, 3e6, ws.shape)
+
+        result = simulate_high_wind_hysteresis(ws, power, cut_out_ws=25.0, restart_ws=22.0)
+
+        np.testing.assert_array_equal(result.stopped, self.reference_stopped(ws, 25.0, 22.0))
+        assert result.episodes['lost_energy_mwh'].sum() == pytest.approx((power * result.stopped).sum() / 1e6)
+        assert result.episodes['samples'].sum() == result.stopped.sum()
+
+    def test_episode_and_loss(self):
+        """One stop from the cut-out sample until the wind drops below restart."""
+        ws = np.array([20.0, 24.0, 26.0, 23.0, 22.5, 21.0, 23.0])
+        power = np.full((2, len(ws)), 1e6)
+
+        result = simulate_high_wind_hysteresis(ws, power, cut_out_ws=25.0, restart_ws=22.0)
+
+        assert result.episodes[['turbine', 'start', 'stop']].values.tolist() == [[0, 2, 5], [1, 2, 5]]
+        assert result.loss_fraction == pytest.approx(3 / 7)
+        category = result.to_loss_category()
+        assert category.name == LossType.HIGH_HYSTERESIS.value and category.is_computed
+
+        losses = create_default_losses().add_category(category)
+        assert losses.get_loss_breakdown()['high_hysteresis_losses']['value'] == pytest.approx(3 / 7)
+
+    def test_restart_below_cut_out(self):
+        """Restart must be below cut-out."""
+        with pytest.raises(ValueError):
+            simulate_high_wind_hysteresis(np.ones(3), np.ones((1, 3)), cut_out_ws=25.0, restart_ws=25.0)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
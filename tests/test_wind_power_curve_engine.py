@@ -0,0 +1,98 @@
+"""
+Tests for the no-wake power-curve screening engine.
+
+Uses the shared synthetic turbine and wind record (conftest), so nothing
+here runs PyWake. Tests verify:
+- The power matrix equals one power-curve lookup per model and hour
+- Farm arrays are annualized like a PyWake time-series run
+- Screening energy with and without sector management
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from latam_hybrid.core import SectorManagementConfig
+from latam_hybrid.wind import TurbineModel, TurbineLayout, screen_turbine_models
+from latam_hybrid.wind.power_curve_engine import power_curve_arrays, power_curve_matrix
+
+
+LAYOUT = TurbineLayout.from_coordinates(
+    np.array([[0.0, 0.0], [500.0, 0.0], [1000.0, 0.0]]), crs='EPSG:32719'
+)
+
+
+class TestPowerCurveMatrix:
+    """Test the (n_models, n_hours) power lookup."""
+
+    def test_rows_match_power_curves(self, synthetic_turbine):
+        """Each row is the model's power curve in W; missing wind gives zero."""
+        turbines = [synthetic_turbine(), synthetic_turbine('Small', 100)]
+        turbines[1] = TurbineModel(replace(
+            turbines[1].spec,
+            power_curve=turbines[1].spec.power_curve.assign(power=lambda df: df['power'] / 2)
+        ))
+        ws = np.array([2.0, 5.5, 9.0, 14.0, np.nan])
+
+        power = power_curve_matrix(turbines, ws)
+
+        assert power.shape == (2, 5)
+        np.testing.assert_allclose(power[0, :4], turbines[0].power_at_wind_speed(ws[:4]) * 1000)
+        np.testing.assert_allclose(power[1], power[0] / 2)
+        assert power[0, 4] == 0.0
+
+        with pytest.raises(ValueError, match="Expected wind speeds for 2 models"):
+            power_curve_matrix(turbines, np.ones((3, 5)))
+
+    def test_farm_arrays_are_annualized(self, synthetic_turbine, synthetic_wind_data):
+        """Per-turbine AEP is the hourly energy scaled to 8760 hours."""
+        ws = synthetic_wind_data(n_hours=240).timeseries['ws'].to_numpy()
+        arrays = power_curve_arrays(synthetic_turbine(), ws, n_turbines=3)
+
+        assert arrays.dims == ('wt', 'time')
+        assert arrays.power_w.shape == (3, len(ws))
+        np.testing.assert_allclose(
+            arrays.aep_per_turbine(), arrays.power_w.sum(axis=1) * 8760 / len(ws) * 1e-9
+        )
+
+
+class TestScreenTurbineModels:
+    """Test gross and curtailed energy of several models in one call."""
+
+    def test_sector_curtailment(self, synthetic_turbine, synthetic_wind_data):
+        """Net energy drops only for curtailed turbines and matches the mask."""
+        wind_data = synthetic_wind_data(n_hours=240)
+        turbine = synthetic_turbine()
+        sector_management = SectorManagementConfig(turbine_sectors={2: [(0, 180)]})
+
+        free = screen_turbine_models(wind_data, LAYOUT, [turbine]).results[turbine.name]
+        curtailed = screen_turbine_models(
+            wind_data, LAYOUT, [turbine], sector_management=sector_management
+        ).results[turbine.name]
+
+        assert free.sector_loss_percent == 0.0
+        np.testing.assert_allclose(free.metadata['ideal_per_turbine_gwh'], free.turbine_production_gwh)
+
+        ws = wind_data.timeseries['ws'].to_numpy()
+        wd = wind_data.timeseries['wd'].to_numpy()
+        # Turbine 2 only runs for wind from 0-180°
+        expected = power_curve_arrays(turbine, np.where(wd < 180, ws, 0.0), 1).aep_per_turbine()[0]
+        assert curtailed.turbine_production_gwh[0] == pytest.approx(free.turbine_production_gwh[0])
+        assert curtailed.turbine_production_gwh[1] == pytest.approx(expected)
+        assert curtailed.sector_loss_percent > 0
+
+    def test_summary_per_model(self, synthetic_turbine, synthetic_wind_data):
+        """One summary row per model; duplicate names need explicit labels."""
+        wind_data = synthetic_wind_data(n_hours=240)
+        base, taller = synthetic_turbine(), synthetic_turbine('Synthetic 3MW @ 140m', 140)
+
+        screening = screen_turbine_models(wind_data, LAYOUT, [base, taller], shear_alpha=0.2)
+
+        summary = screening.summary.set_index('configuration')
+        assert list(summary.index) == [base.name, taller.name]
+        assert summary.loc[taller.name, 'shear_factor'] == pytest.approx((140 / 120) ** 0.2)
+        assert summary.loc[taller.name, 'net_aep_gwh'] > summary.loc[base.name, 'net_aep_gwh']
+
+        with pytest.raises(ValueError, match="unique"):
+            screen_turbine_models(wind_data, LAYOUT, [base, base])
@@ -0,0 +1,65 @@
+"""
+Tests for the wake-aware power lookup table.
+
+Uses small hand-filled tables, so no PyWake run is needed. Tests verify:
+- Bilinear lookup at and between grid nodes, with wrap-around at 360°
+- Cut-in/cut-out grid nodes of a power curve
+- Save/load round trip and grid validation
+"""
+
+import numpy as np
+import pytest
+
+from latam_hybrid.wind import WakePowerTable
+from latam_hybrid.wind.power_table import cut_in_out_nodes
+
+
+def make_table():
+    """One turbine on a 4 × 4 (wd, ws) grid with power = 4 wd_index + ws_index."""
+    return WakePowerTable(
+        ws=np.arange(0, 4.0),
+        wd=np.arange(0, 360, 90.0),
+        power_w=np.arange(16.0).reshape(1, 4, 4),
+        metadata={'wake_model': 'NOJ'}
+    )
+
+
+class TestWakePowerTable:
+    """Test lookup, persistence and validation of the table."""
+
+    def test_grid_points_are_exact(self):
+        """Lookup at grid nodes returns the stored power, NaN wind gives zero."""
+        table = make_table()
+
+        np.testing.assert_allclose(table.power([1, 3, 2], [90, 270, 450]), [[5, 15, 6]])
+        # Halfway between 270° and 0° (wraps), halfway between 1 and 2 m/s
+        np.testing.assert_allclose(table.power([1.5], [315]), [[(13.5 + 1.5) / 2]])
+        np.testing.assert_allclose(table.power([np.nan, 2], [0, np.nan]), [[0, 0]])
+
+    def test_save_and_load(self, tmp_path):
+        """A saved table loads with identical grids, power and metadata."""
+        table = make_table()
+        loaded = WakePowerTable.load(table.save(tmp_path / 'table.npz'))
+
+        np.testing.assert_array_equal(loaded.ws, table.ws)
+        np.testing.assert_array_equal(loaded.power_w, table.power_w)
+        assert loaded.metadata == {'wake_model': 'NOJ'}
+
+    def test_invalid_grid(self):
+        """Shapes must match the grids and wd must cover 360° from 0°."""
+        with pytest.raises(ValueError, match="shape"):
+            WakePowerTable(ws=np.arange(0, 4.0), wd=np.arange(0, 360, 90.0), power_w=np.zeros((1, 4, 3)))
+        with pytest.raises(ValueError, match="wd grid"):
+            WakePowerTable(ws=np.arange(0, 4.0), wd=np.arange(10, 370, 90.0), power_w=np.zeros((1, 4, 4)))
+
+
+class TestCutInOutNodes:
+    """Test the extra wind speed nodes at the power curve ramps."""
+
+    def test_nodes_bracket_both_ramps(self):
+        """The first/last producing speeds and their zero-power neighbours."""
+        curve_ws = np.array([0.0, 3.1, 3.2, 8.0, 24.8, 24.9, 30.0])
+        curve_power = np.array([0.0, 0.0, 50.0, 1200.0, 3000.0, 0.0, 0.0])
+
+        np.testing.assert_allclose(cut_in_out_nodes(curve_ws, curve_power), [3.1, 3.2, 24.8, 24.9])
+        assert len(cut_in_out_nodes(curve_ws, np.zeros_like(curve_ws))) == 0
@@ -0,0 +1,82 @@
+"""
+Tests for the temporal breakdown of wind farm energy.
+
+Uses a synthetic hourly energy table, so no PyWake run is needed.
+Tests verify:
+- Calendar periods sum the hourly energy and annualize partial periods
+- Profiles (hour of day, month of year) sum to the AEP
+- Normal and empirical P50/P90 from yearly values
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from latam_hybrid.wind import exceedance_levels
+from latam_hybrid.wind.production_breakdown import ENERGY_COLUMNS, energy_breakdown
+
+
+def make_hourly_energy(n_hours=2 * 8760 + 744, seed=0):
+    """Hourly farm energy (MWh) consistent with ideal = losses + net."""
+    rng = np.random.default_rng(seed)
+    ideal = rng.uniform(0, 15.0, n_hours)
+    wake = ideal * 0.08
+    sector = ideal * rng.uniform(0, 0.05, n_hours)
+    other = (ideal - wake - sector) * 0.1
+    return pd.DataFrame(
+        dict(zip(ENERGY_COLUMNS, (ideal, wake, sector, other, ideal - wake - sector - other), strict=True)),
+        index=pd.date_range('2014-01-01', periods=n_hours, freq='h')
+    )
+
+
+class TestEnergyBreakdown:
+    """Test grouping of the hourly energy by period."""
+
+    def test_calendar_periods(self):
+        """Yearly totals equal the hourly sums; the partial year is annualized."""
+        hourly = make_hourly_energy()
+        yearly = energy_breakdown(hourly, 'year')
+
+        assert list(yearly.index) == [2014, 2015, 2016]
+        assert yearly['hours'].tolist() == [8760, 8760, 744]
+        assert yearly['net_gwh'].sum() == pytest.approx(hourly['net_mwh'].sum() / 1000)
+        assert yearly['annualized_net_gwh'].iloc[2] == pytest.approx(
+            yearly['net_gwh'].iloc[2] * 8760 / 744
+        )
+        assert yearly['wake_loss_percent'].tolist() == pytest.approx([8.0] * 3)
+        assert len(energy_breakdown(hourly, 'month')) == 25
+
+    def test_profiles_sum_to_aep(self):
+        """Hour-of-day and month-of-year groups are contributions to the AEP."""
+        hourly = make_hourly_energy()
+        aep_gwh = hourly['net_mwh'].sum() / 1000 * 8760 / len(hourly)
+
+        for by, n_groups in (('hour', 24), ('month_of_year', 12)):
+            profile = energy_breakdown(hourly, by)
+            assert len(profile) == n_groups
+            assert profile['net_gwh'].sum() == pytest.approx(aep_gwh)
+
+    def test_invalid_input(self):
+        """Unknown periods and tables without a time index are rejected."""
+        hourly = make_hourly_energy(n_hours=48)
+        with pytest.raises(ValueError, match="Unknown period"):
+            energy_breakdown(hourly, 'week')
+        with pytest.raises(ValueError, match="DatetimeIndex"):
+            energy_breakdown(hourly.reset_index(drop=True))
+
+
+class TestExceedanceLevels:
+    """Test P-values from yearly energy."""
+
+    def test_exceedance_levels(self):
+        """Normal P90 is mean - 1.2816 sigma; empirical uses sample quantiles."""
+        values = [100.0, 110.0, 90.0, 105.0, 95.0]
+        levels = exceedance_levels(values, levels=(50, 90))
+        assert levels['P50'] == pytest.approx(100.0)
+        assert levels['P90'] == pytest.approx(100.0 - 1.28155 * np.std(values, ddof=1), rel=1e-4)
+
+        empirical = exceedance_levels(values, levels=(50,), method='empirical')
+        assert empirical == {'P50': 100.0}
+
+        with pytest.raises(ValueError):
+            exceedance_levels([100.0])
@@ -0,0 +1,113 @@
+"""
+Tests for shear estimation from multi-height wind data.
+
+Uses synthetic power-law profiles with a known exponent per direction
+sector, built on the shared synthetic wind data (conftest). Tests verify:
+- Hourly, sector and hour-of-day exponents recover the imposed shear
+- Extrapolation to several hub heights in one call
+- Partially overlapping records are aligned on common timestamps
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from latam_hybrid.core import WindData
+from latam_hybrid.wind.shear import ShearProfile
+
+
+SECTOR_ALPHA = {0: 0.10, 1: 0.25}  # wd < 180° and wd >= 180°
+
+
+@pytest.fixture
+def profile_records(synthetic_wind_data):
+    """Factory of wind data at several heights following V = V_100 × (h / 100)^alpha."""
+    def make(heights=(100.0, 150.0, 175.0), n_hours=480, offset_hours=0):
+        rng = np.random.default_rng(1)
+        ws_100 = 4.0 + 8.0 * rng.random(n_hours)
+        wd = rng.uniform(0, 360, n_hours)
+        alpha = np.where(wd < 180, SECTOR_ALPHA[0], SECTOR_ALPHA[1])
+
+        start = pd.Timestamp('2020-01-01') + pd.Timedelta(hours=offset_hours)
+        return {
+            height: synthetic_wind_data(
+                n_hours=n_hours - offset_hours,
+                height=height,
+                start=start,
+                ws=(ws_100 * (height / 100.0) ** alpha)[offset_hours:],
+                wd=wd[offset_hours:]
+            )
+            for height in heights
+        }
+
+    return make
+
+
+class TestShearProfile:
+    """Shear exponents and extrapolation from a multi-height profile."""
+
+    def test_hourly_and_sector_alpha(self, profile_records):
+        """Vectorized log-log fits recover the imposed exponents."""
+        profile = ShearProfile.from_wind_data(profile_records(), n_sectors=2)
+
+        alpha = profile.alpha_timeseries()
+        expected = np.where(profile.wd < 180, SECTOR_ALPHA[0], SECTOR_ALPHA[1])
+        np.testing.assert_allclose(alpha.to_numpy(), expected, atol=1e-12)
+
+        table = profile.alpha_by_sector()
+        assert table['alpha'].tolist() == pytest.approx([SECTOR_ALPHA[0], SECTOR_ALPHA[1]], abs=1e-3)
+        assert table['hours'].sum() == len(alpha)
+        assert len(profile.alpha_by_hour()) == 24
+
+    def test_extrapolate_several_heights(self, profile_records):
+        """All target heights are produced at once from the nearest height."""
+        records = profile_records()
+        profile = ShearProfile.from_wind_data(records, n_sectors=2)
+
+        sweep = profile.extrapolate([125.0, 164.0, 175.0], alpha='timeseries')
+
+        truth = profile_records(heights=(125.0, 164.0))
+        np.testing.assert_allclose(sweep[125.0].timeseries['ws'], truth[125.0].timeseries['ws'])
+        np.testing.assert_allclose(sweep[164.0].timeseries['ws'], truth[164.0].timeseries['ws'])
+        assert sweep[164.0].metadata['extrapolated_from'] == 175.0
+        assert sweep[175.0] is profile.wind_data[175.0]
+
+    def test_constant_alpha_matches_at_height(self, profile_records):
+        """A constant exponent reproduces WindData.at_height."""
+        records = profile_records()
+        profile = ShearProfile.from_wind_data(records)
+
+        hub = profile.extrapolate(110.0, alpha=0.2)
+
+        expected = records[100.0].at_height(110.0, 0.2)
+        np.testing.assert_allclose(hub.timeseries['ws'], expected.timeseries['ws'])
+
+    def test_records_aligned_on_common_index(self, profile_records):
+        """Records with different spans are cut to their shared hours."""
+        records = profile_records()
+        records[150.0] = profile_records(heights=(150.0,), offset_hours=24)[150.0]
+
+        profile = ShearProfile.from_wind_data(records)
+
+        assert profile.ws.shape == (3, 456)
+        assert profile.index[0] == pd.Timestamp('2020-01-02')
+
+    def test_missing_directions_excluded_from_sectors(self, profile_records):
+        """Hours without a direction fall in no sector and use the profile alpha."""
+        records = profile_records()
+        top = records[175.0].timeseries.copy()
+        top.iloc[:10, top.columns.get_loc('wd')] = np.nan
+        records[175.0] = WindData(timeseries=top, height=175.0)
+        profile = ShearProfile.from_wind_data(records, n_sectors=2)
+
+        table = profile.alpha_by_sector()
+        assert table['hours'].sum() == profile.ws.shape[1] - 10
+        assert table['alpha'].tolist() == pytest.approx([SECTOR_ALPHA[0], SECTOR_ALPHA[1]], abs=1e-3)
+
+        alpha = profile.alpha_per_timestep('sector')
+        np.testing.assert_allclose(alpha[:10], profile.profile_alpha())
+
+    def test_needs_two_heights(self, profile_records):
+        """A single height cannot define shear."""
+        with pytest.raises(ValueError):
+            ShearProfile.from_wind_data(profile_records(heights=(100.0,)))
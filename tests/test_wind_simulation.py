@@ -0,0 +1,888 @@
+"""
+Tests for WindSite simulation orchestration.
+
+Uses a small synthetic site (5 turbines, 500 hours) so the PyWake runs
+complete in seconds. Tests that run PyWake carry the requires_pywake marker
+and are skipped without it. Tests verify:
+- Each distinct PyWake configuration runs once per run_simulation() call
+- Loss decomposition consistency (ideal = net + wake + sector)
+- Content-addressed result cache (memory and disk tiers)
+- Binned timeseries simulation against the full hourly run
+- Chunked and parallel timeseries simulation parity
+- Sector-aware wakes (stopped turbines cast no wake)
+- Compact float32 results without the embedded PyWake object
+- Multi-configuration turbine comparison (shared inputs, process pool)
+- Wake-aware power lookup table against direct simulation
+- Per-year/month/hour energy breakdown and P50/P90 from one run
+- Pooled PyWake site and wind farm model objects across runs
+- Power-curve screening engine against the PyWake no-wake run
+- Air density correction from hourly density (on by default)
+- Stability-dependent turbulence intensity (opt-in)
+- Hourly operational losses, simulated hysteresis and Monte Carlo availability
+"""
+
+from dataclasses import replace
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from latam_hybrid.core import TurbineSpec, SectorManagementConfig
+from latam_hybrid.wind import (
+    WindSite, TurbineModel, TurbineLayout, compare_turbine_configurations,
+    screen_turbine_models, UniformLoss
+)
+from latam_hybrid.wind.chunked_simulation import DEFAULT_CHUNK_HOURS
+from latam_hybrid.wind.turbine_comparison import wind_at_hub_height
+
+
+@pytest.fixture
+def make_site(synthetic_wind_data, synthetic_turbine):
+    """Factory of a small synthetic wind site with reproducible wind data."""
+    def make(n_hours: int = 500, seed: int = 0, sector_management: bool = True) -> WindSite:
+        coordinates = np.array([[i * 500.0, (i % 2) * 300.0] for i in range(5)])
+        site = (
+            WindSite.from_wind_data(synthetic_wind_data(n_hours=n_hours, seed=seed))
+            .with_turbine(synthetic_turbine())
+            .set_layout(TurbineLayout.from_coordinates(coordinates, crs='EPSG:32719'))
+        )
+
+        if sector_management:
+            site.set_sector_management(SectorManagementConfig(
+                turbine_sectors={1: [(60, 120), (240, 300)], 3: [(0, 90)]}
+            ))
+
+        return site
+
+    return make
+
+
+@pytest.mark.requires_pywake
+class TestSimulationPlanning:
+    """Test that run_simulation runs each distinct PyWake configuration once."""
+
+    def test_two_distinct_pywake_runs(self, make_site):
+        """Test that no-wake and wake runs are each executed exactly once."""
+        site = make_site()
+        calls = []
+        original = site._run_pywake_simulation
+
+        def counting_run(wake_model, *args, **kwargs):
+            calls.append(wake_model)
+            return original(wake_model, *args, **kwargs)
+
+        site._run_pywake_simulation = counting_run
+        site.run_simulation(wake_model='NOJ', compute_losses=True)
+
+        assert len(calls) == 2
+        assert len(set(calls)) == 2
+
+    def test_loss_decomposition_balances(self, make_site):
+        """Test ideal = production + wake loss + sector loss per turbine."""
+        result = make_site().run_simulation(wake_model='NOJ').calculate_production()
+
+        ideal = np.array(result.metadata['ideal_per_turbine_gwh'])
+        wake_loss = np.array(result.metadata['wake_loss_per_turbine_gwh'])
+        sector_loss = np.array(result.metadata['sector_loss_per_turbine_gwh'])
+        production = np.array(result.turbine_production_gwh)
+
+        np.testing.assert_allclose(ideal, production + wake_loss + sector_loss, rtol=1e-9)
+        assert result.metadata['aep_ideal'] == pytest.approx(ideal.sum())
+
+    def test_farm_percentages_match_per_turbine_arrays(self, make_site):
+        """Test farm-level percentages derive from the shared per-turbine arrays."""
+        result = make_site().run_simulation(wake_model='NOJ').calculate_production()
+
+        ideal = np.array(result.metadata['ideal_per_turbine_gwh'])
+        wake_loss = np.array(result.metadata['wake_loss_per_turbine_gwh'])
+        sector_loss = np.array(result.metadata['sector_loss_per_turbine_gwh'])
+        with_wake = ideal - wake_loss
+
+        assert result.wake_loss_percent == pytest.approx(wake_loss.sum() / ideal.sum() * 100)
+        assert result.sector_loss_percent == pytest.approx(
+            sector_loss.sum() / with_wake.sum() * 100
+        )
+
+    def test_weibull_per_turbine_production(self, make_site):
+        """Test Weibull simulation returns one production value per turbine."""
+        result = make_site().run_simulation(
+            wake_model='NOJ',
+            simulation_method='weibull'
+        ).calculate_production()
+
+        assert len(result.turbine_production_gwh) == 5
+        assert result.aep_gwh == pytest.approx(sum(result.turbine_production_gwh))
+
+
+@pytest.mark.requires_pywake
+class TestSimulationCache:
+    """Test the content-addressed PyWake result cache."""
+
+    def test_warm_run_skips_pywake(self, make_site, tmp_path):
+        """Test that a rerun with identical inputs is served from cache."""
+        from latam_hybrid.wind import SimulationCache
+
+        cache = SimulationCache(cache_dir=tmp_path)
+        cold = make_site().enable_cache(cache).run_simulation(wake_model='NOJ')
+
+        warm_site = make_site().enable_cache(cache)
+        warm_site._execute_pywake_simulation = None  # Would fail if called
+        warm = warm_site.run_simulation(wake_model='NOJ')
+
+        assert cache.stats['misses'] == 2
+        assert cache.stats['memory_hits'] == 2
+        assert warm.calculate_production().aep_gwh == cold.calculate_production().aep_gwh
+
+    def test_disk_tier_survives_new_cache(self, make_site, tmp_path):
+        """Test that a fresh cache instance reads results from disk."""
+        from latam_hybrid.wind import SimulationCache
+
+        first = make_site().enable_cache(SimulationCache(cache_dir=tmp_path))
+        expected = first.run_simulation(wake_model='NOJ').calculate_production()
+
+        cache = SimulationCache(cache_dir=tmp_path)
+        result = make_site().enable_cache(cache).run_simulation(
+            wake_model='NOJ'
+        ).calculate_production()
+
+        assert cache.stats['disk_hits'] == 2
+        assert result.turbine_production_gwh == expected.turbine_production_gwh
+
+    def test_changed_inputs_miss(self, make_site, tmp_path):
+        """Test that different wind data produces a different cache key."""
+        from latam_hybrid.wind import SimulationCache
+
+        cache = SimulationCache(cache_dir=tmp_path)
+        make_site(seed=0).enable_cache(cache).run_simulation(wake_model='NOJ')
+        make_site(seed=1).enable_cache(cache).run_simulation(wake_model='NOJ')
+
+        assert cache.stats['misses'] == 4
+
+    def test_disk_size_eviction(self, make_site, tmp_path):
+        """Test that the disk tier stays under its size limit."""
+        from latam_hybrid.wind import SimulationCache
+
+        cache = SimulationCache(cache_dir=tmp_path, max_disk_mb=0.05)
+        for seed in range(3):
+            make_site(seed=seed).enable_cache(cache).run_simulation(wake_model='NOJ')
+
+        total_bytes = sum(p.stat().st_size for p in tmp_path.glob('*.npz'))
+        assert total_bytes <= 0.05 * 1024 * 1024
+
+
+@pytest.mark.requires_pywake
+class TestBinnedSimulation:
+    """Test the binned timeseries simulation method."""
+
+    def test_binned_matches_timeseries(self, make_site):
+        """Test binned AEP and losses stay close to the full hourly run."""
+        reference = make_site().run_simulation(wake_model='NOJ').calculate_production()
+        binned = make_site().run_simulation(
+            wake_model='NOJ',
+            simulation_method='binned',
+            ws_bin_width=0.25,
+            wd_bin_width=1.0
+        ).calculate_production()
+
+        assert binned.aep_gwh == pytest.approx(reference.aep_gwh, rel=0.01)
+        assert binned.sector_loss_percent == pytest.approx(reference.sector_loss_percent, abs=0.5)
+        assert binned.metadata['binning']['n_bins'] <= 500
+
+    def test_evaluate_binning_error(self, make_site):
+        """Test the resolution report against the timeseries reference."""
+        errors = make_site().evaluate_binning_error([(0.1, 1.0), (1.0, 5.0)])
+
+        assert len(errors) == 2
+        # Input wind speeds are on a 0.1 m/s grid and directions on 1°
+        assert errors['aep_error_percent'].iloc[0] == pytest.approx(0.0, abs=1e-9)
+        assert errors['n_bins'].iloc[1] < errors['n_bins'].iloc[0]
+
+
+class TestChunkedSimulation:
+    """Test chunked and parallel time-series simulation."""
+
+    @pytest.mark.requires_pywake
+    def test_chunked_matches_single_run(self, make_site):
+        """Test reduced chunk accumulation reproduces the unchunked losses."""
+        reference = make_site().run_simulation(wake_model='NOJ').calculate_production()
+        chunked = make_site().run_simulation(
+            wake_model='NOJ',
+            chunk_hours=120
+        ).calculate_production()
+
+        np.testing.assert_allclose(
+            chunked.turbine_production_gwh, reference.turbine_production_gwh, rtol=1e-9
+        )
+        assert chunked.sector_loss_percent == pytest.approx(reference.sector_loss_percent)
+        assert chunked.metadata['chunking']['n_chunks'] == 5
+
+    @pytest.mark.requires_pywake
+    def test_parallel_keeps_hourly_power(self, make_site):
+        """Test chunks merged from worker processes equal the serial run."""
+        kwargs = {'wake_model': 'NOJ', 'chunk_hours': 100, 'keep_hourly_power': True}
+        serial = make_site().run_simulation(n_workers=1, **kwargs).calculate_production()
+        parallel = make_site().run_simulation(n_workers=2, **kwargs).calculate_production()
+
+        assert parallel.metadata['chunking'] == {'chunk_hours': 100, 'n_chunks': 5, 'n_workers': 2}
+        np.testing.assert_array_equal(
+            parallel.metadata['hourly_power_w'], serial.metadata['hourly_power_w']
+        )
+        assert parallel.turbine_production_gwh == serial.turbine_production_gwh
+
+        reference = make_site().run_simulation(wake_model='NOJ').calculate_production()
+        expected = reference.metadata['pywake_sim_result'].Power
+        np.testing.assert_allclose(
+            parallel.metadata['hourly_power_w'], expected.transpose('wt', 'time').values
+        )
+
+    @pytest.mark.requires_pywake
+    def test_default_chunk_size(self, make_site):
+        """Test the default chunk is a fixed year, not split across workers."""
+        production = make_site().run_simulation(
+            wake_model='NOJ',
+            n_workers=2
+        ).calculate_production()
+
+        assert production.metadata['chunking']['chunk_hours'] == DEFAULT_CHUNK_HOURS
+        assert production.metadata['chunking']['n_chunks'] == 1
+
+    def test_chunking_requires_timeseries(self, make_site):
+        """Test chunking is rejected for Weibull simulations."""
+        with pytest.raises(ValueError):
+            make_site().run_simulation(simulation_method='weibull', chunk_hours=100)
+
+
+@pytest.mark.requires_pywake
+class TestSectorAwareWakes:
+    """Test passing the sector operating mask into PyWake."""
+
+    def test_stopped_turbines_cast_no_wake(self, make_site):
+        """Test sector-aware production is at least the post-processed one."""
+        post = make_site().run_simulation(wake_model='NOJ').calculate_production()
+        aware = make_site().run_simulation(
+            wake_model='NOJ',
+            sector_aware_wakes=True
+        ).calculate_production()
+
+        # Less wake from stopped turbines → more energy for the others
+        assert aware.aep_gwh > post.aep_gwh
+        assert aware.metadata['sector_aware_wakes'] is True
+
+        ideal = np.array(aware.metadata['ideal_per_turbine_gwh'])
+        wake_loss = np.array(aware.metadata['wake_loss_per_turbine_gwh'])
+        sector_loss = np.array(aware.metadata['sector_loss_per_turbine_gwh'])
+        np.testing.assert_allclose(
+            ideal, np.array(aware.turbine_production_gwh) + wake_loss + sector_loss, rtol=1e-9
+        )
+
+    def test_composes_with_chunking(self, make_site):
+        """Test chunked sector-aware runs reproduce the single run."""
+        single = make_site().run_simulation(
+            wake_model='NOJ',
+            sector_aware_wakes=True
+        ).calculate_production()
+        chunked = make_site().run_simulation(
+            wake_model='NOJ',
+            sector_aware_wakes=True,
+            chunk_hours=150
+        ).calculate_production()
+
+        np.testing.assert_allclose(
+            chunked.turbine_production_gwh, single.turbine_production_gwh, rtol=1e-9
+        )
+        assert chunked.wake_loss_percent == pytest.approx(single.wake_loss_percent)
+
+
+class TestCompactResults:
+    """Compact results keep selected float32 arrays instead of the PyWake object."""
+
+    @pytest.mark.requires_pywake
+    def test_compact_matches_full_result(self, make_site):
+        """Same AEP figures, typed arrays, no PyWake result."""
+        full = make_site().run_simulation().calculate_production()
+        compact = (
+            make_site()
+            .enable_compact_results(('Power', 'WS_eff'))
+            .run_simulation()
+            .calculate_production()
+        )
+
+        assert compact.metadata['pywake_sim_result'] is None
+        assert compact.aep_gwh == pytest.approx(full.aep_gwh, rel=1e-12)
+        assert compact.turbine_production_gwh.dtype == np.float32
+        assert compact.metadata['wake_loss_per_turbine_gwh'].dtype == np.float32
+        assert isinstance(full.turbine_production_gwh, list)
+        np.testing.assert_allclose(compact.turbine_production, full.turbine_production_gwh)
+        np.testing.assert_allclose(
+            compact.per_turbine('wake_loss'), full.metadata['wake_loss_per_turbine_gwh']
+        )
+
+        power = compact.arrays['Power']
+        assert power.dtype == np.float32
+        assert power.shape == (5, 500)
+        np.testing.assert_allclose(
+            power, full.metadata['pywake_sim_result'].Power.values, rtol=1e-6
+        )
+        assert compact.arrays['WS_eff'].shape == (5, 500)
+
+    @pytest.mark.requires_pywake
+    def test_memmap_survives_apply_losses(self, make_site, tmp_path):
+        """Arrays are memory-mapped from disk and carried through apply_losses."""
+        result = (
+            make_site()
+            .enable_compact_results(memmap_dir=tmp_path)
+            .run_simulation(chunk_hours=200)
+            .apply_losses()
+            .calculate_production()
+        )
+
+        assert isinstance(result.arrays['Power'], np.memmap)
+        assert len(list(tmp_path.glob('Power_*.npy'))) == 1
+        assert 'hourly_power_w' not in result.metadata
+
+    @pytest.mark.requires_pywake
+    def test_operational_losses_read_compact_power(self, make_site, tmp_path):
+        """Hourly losses use the memory-mapped power, not a held float64 copy."""
+        full = make_site().run_simulation().apply_operational_losses().calculate_production()
+        site = make_site().enable_compact_results(memmap_dir=tmp_path).run_simulation()
+
+        assert site._hourly_power[0] is None
+        compact = site.apply_operational_losses().calculate_production()
+        assert compact.aep_gwh == pytest.approx(full.aep_gwh, rel=1e-5)
+
+    @pytest.mark.requires_pywake
+    def test_operational_losses_need_compact_power(self, make_site):
+        """Compact results without 'Power' cannot feed hourly losses."""
+        site = make_site().enable_compact_results(('WS_eff',)).run_simulation()
+        with pytest.raises(ValueError, match="need 'Power'"):
+            site.apply_operational_losses()
+
+    def test_export_to_json_skips_arrays(self, make_site, tmp_path):
+        """JSON export writes per-turbine arrays as lists and leaves out hourly data."""
+        import json
+        from latam_hybrid.output.export import export_to_json
+
+        # The power-curve engine produces the same compact result without PyWake
+        result = (
+            make_site()
+            .enable_compact_results(('Power',))
+            .run_simulation(simulation_method='power_curve')
+            .apply_losses()
+            .calculate_production()
+        )
+        export_to_json(result, tmp_path / 'wind.json')
+        data = json.loads((tmp_path / 'wind.json').read_text())
+
+        assert 'arrays' not in data and 'hourly_energy' not in data
+        assert 'pywake_sim_result' not in data['metadata']
+        np.testing.assert_allclose(data['turbine_production_gwh'], result.turbine_production_gwh)
+        assert len(data['metadata']['other_loss_per_turbine_gwh']) == 5
+
+    def test_export_to_json_operational_losses(self, make_site, tmp_path):
+        """Hourly loss results export their summary, not the hourly arrays."""
+        import json
+        from latam_hybrid.output.export import export_to_json
+
+        result = (
+            make_site()
+            .enable_compact_results(('Power',))
+            .run_simulation(simulation_method='power_curve')
+            .apply_operational_losses()
+            .calculate_production()
+        )
+        export_to_json(result, tmp_path / 'wind.json')
+        losses = json.loads((tmp_path / 'wind.json').read_text())['metadata']['operational_losses']
+
+        assert set(losses) == {'summary', 'turbine_loss_gwh'}
+        assert losses['summary'][0]['loss_category'] == 'availability_turbines'
+        assert all(len(values) == 5 for values in losses['turbine_loss_gwh'].values())
+        assert result.arrays['NetPower'].dtype == np.float32
+
+    def test_chunked_rejects_extra_variables(self, make_site):
+        """Only hourly power is reduced from chunked runs."""
+        site = make_site().enable_compact_results(('Power', 'CT'))
+        with pytest.raises(ValueError, match="only keep 'Power'"):
+            site.run_simulation(chunk_hours=200)
+
+
+class TestTurbineComparison:
+    """compare_turbine_configurations shares inputs across configurations."""
+
+    @staticmethod
+    def configurations(make_site):
+        """Reference site plus the same turbine at two hub heights."""
+        site = make_site()
+        spec = site.turbine.spec
+        turbines = {
+            f'{height} m': TurbineModel(replace(spec, hub_height=height))
+            for height in (120, 100)
+        }
+        return site, turbines
+
+    @pytest.mark.requires_pywake
+    def test_parallel_matches_individual_runs(self, make_site):
+        """Each row equals a WindSite run on shear-shifted wind data."""
+        site, turbines = self.configurations(make_site)
+        kwargs = {
+            'shear_alpha': 0.2, 'sector_management': site.sector_management, 'apply_losses': False
+        }
+        serial = compare_turbine_configurations(
+            site.wind_data, site.layout, turbines, n_workers=1, **kwargs
+        )
+        parallel = compare_turbine_configurations(
+            site.wind_data, site.layout, turbines, n_workers=2, **kwargs
+        )
+
+        pd.testing.assert_frame_equal(
+            serial.summary.drop(columns='runtime_s'),
+            parallel.summary.drop(columns='runtime_s')
+        )
+
+        low = turbines['100 m']
+        direct = (
+            WindSite(wind_at_hub_height(site.wind_data, 100, 0.2), turbine=low, layout=site.layout)
+            .set_sector_management(site.sector_management)
+            .run_simulation()
+            .calculate_production()
+        )
+        row = serial.summary.set_index('configuration').loc['100 m']
+        assert row['net_aep_gwh'] == pytest.approx(direct.aep_gwh, rel=1e-12)
+        assert row['shear_factor'] == pytest.approx((100 / 120) ** 0.2)
+        assert list(serial.per_turbine) == ['120 m', '100 m']
+        assert serial.per_turbine['100 m']['Turbine_ID'].iloc[-1] == 'TOTAL'
+
+    def test_missing_shear_exponent(self, make_site):
+        """Hub heights away from the data height require shear_alpha."""
+        site, turbines = self.configurations(make_site)
+        with pytest.raises(ValueError, match="shear_alpha is required"):
+            compare_turbine_configurations(site.wind_data, site.layout, turbines)
+
+
+@pytest.mark.requires_pywake
+class TestPowerTable:
+    """Lookup table P_i(ws, wd) reproduces the time-series simulation."""
+
+    def test_lookup_matches_direct_simulation(self, make_site):
+        """Farm AEP from the table is within 0.1% of the PyWake run."""
+        site = make_site()
+        table = site.build_power_table('NOJ')
+        report = site.validate_power_table(table)
+
+        assert table.power_w.shape == (5, 360, 61)
+        assert abs(report.loc['TOTAL', 'aep_error_percent']) < 0.1
+
+        # Sector curtailment on top of the lookup matches run_simulation()
+        timeseries = site.wind_data.timeseries
+        aep = table.aep_per_turbine(
+            timeseries['ws'].values, timeseries['wd'].values, site.sector_management
+        )
+        result = site.run_simulation().calculate_production()
+        np.testing.assert_allclose(aep, result.turbine_production_gwh, rtol=2e-3)
+
+    def test_cut_in_and_cut_out_nodes(self, make_site):
+        """Off-grid cut-in/cut-out ramps are reproduced, not smeared over a cell."""
+        curve_ws = np.array([0.0, 3.1, 3.2, 8.0, 12.0, 24.8, 24.9, 30.0])
+        curve_power = np.array([0.0, 0.0, 50.0, 1200.0, 3000.0, 3000.0, 0.0, 0.0])
+        turbine = TurbineModel(TurbineSpec(
+            name='Off-grid 3MW',
+            hub_height=120,
+            rotor_diameter=120,
+            rated_power=3000,
+            power_curve=pd.DataFrame({'ws': curve_ws, 'power': curve_power}),
+            ct_curve=pd.DataFrame({'ws': curve_ws, 'ct': np.where(curve_power > 0, 0.7, 0.0)})
+        ))
+        site = make_site(n_hours=50).with_turbine(turbine)
+        table = site.build_power_table('NOJ', wd_step=10.0)
+
+        ws = np.array([3.15, 3.2, 24.8, 24.85, 24.9, 27.0, 40.0])
+        power = table.power(ws, np.zeros_like(ws))
+        # Unwaked front turbine sees the free-stream power curve
+        np.testing.assert_allclose(power.max(axis=0), turbine.to_pywake().power(ws), atol=1e-6)
+
+        with pytest.raises(ValueError, match="cut-out"):
+            site.build_power_table('NOJ', ws_max=20.0)
+
+    def test_persisted_table_is_reused(self, make_site, tmp_path, monkeypatch):
+        """A stored table is loaded instead of re-running PyWake."""
+        site = make_site(n_hours=50)
+        table = site.build_power_table('NOJ', ws_step=1.0, wd_step=10.0, table_dir=tmp_path)
+        assert len(list(tmp_path.glob('power_table_*.npz'))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("PyWake should not run")
+
+        monkeypatch.setattr(site, '_execute_pywake_simulation', fail)
+        loaded = site.build_power_table('NOJ', ws_step=1.0, wd_step=10.0, table_dir=tmp_path)
+
+        np.testing.assert_array_equal(loaded.power_w, table.power_w)
+        assert loaded.metadata == table.metadata
+
+
+@pytest.mark.requires_pywake
+class TestTemporalBreakdown:
+    """Grouped energy and losses come from the single time-series run."""
+
+    def test_breakdown_reconciles_with_totals(self, make_site):
+        """Yearly sums and the hour-of-day profile match the per-turbine losses."""
+        site = make_site(n_hours=2 * 8760)
+        result = site.run_simulation().apply_losses().calculate_production()
+
+        yearly = site.energy_breakdown('year')
+        assert list(yearly.index) == [2014, 2015]
+        assert yearly['hours'].tolist() == [8760, 8760]
+
+        # Two full years: mean yearly energy equals the annual figures
+        assert yearly['net_gwh'].mean() == pytest.approx(result.aep_gwh, rel=1e-9)
+        assert yearly['wake_loss_gwh'].mean() == pytest.approx(
+            sum(result.metadata['wake_loss_per_turbine_gwh']), rel=1e-9
+        )
+        assert yearly['sector_loss_gwh'].mean() == pytest.approx(
+            sum(result.metadata['sector_loss_per_turbine_gwh']), rel=1e-9
+        )
+        assert yearly['other_loss_gwh'].mean() == pytest.approx(
+            sum(result.metadata['other_loss_per_turbine_gwh']), rel=1e-9
+        )
+
+        profile = site.energy_breakdown('hour')
+        assert len(profile) == 24
+        assert profile['net_gwh'].sum() == pytest.approx(result.aep_gwh, rel=1e-9)
+        assert len(site.energy_breakdown('month')) == 24
+
+        levels = site.exceedance_levels((50, 90))
+        assert levels['P90'] < levels['P50']
+        assert levels['P50'] == pytest.approx(yearly['annualized_net_gwh'].mean())
+
+    def test_requires_hourly_power(self, make_site):
+        """Weibull results carry no time index."""
+        site = make_site().run_simulation(simulation_method='weibull')
+        with pytest.raises(ValueError, match="needs hourly power"):
+            site.energy_breakdown('year')
+
+
+@pytest.mark.requires_pywake
+class TestModelPool:
+    """PyWake site and wind farm models are reused until inputs change."""
+
+    def test_runs_share_site_and_models(self, make_site):
+        """Repeated runs reuse one XRSite and one model per configuration."""
+        site = make_site()
+        first = site.run_simulation().calculate_production()
+        pool = dict(site._model_pool)
+
+        second = site.run_simulation().calculate_production()
+
+        assert site._model_pool == pool
+        assert sum(key[0] == 'site' for key in pool) == 1
+        assert sum(key[0] == 'wfm' for key in pool) == 2  # no-wake and NOJ
+        assert second.turbine_production_gwh == first.turbine_production_gwh
+
+    def test_mutation_resets_pool(self, make_site):
+        """New wind data, turbine or layout drops the pooled objects."""
+        site = make_site(sector_management=False)
+        site.run_simulation(wake_model='NOJ')
+        assert site._model_pool
+
+        site.wind_data = site.wind_data.scaled(1.1)
+        assert not site._model_pool
+        scaled = site.run_simulation(wake_model='NOJ').calculate_production()
+
+        reference = make_site(sector_management=False)
+        reference.wind_data = reference.wind_data.scaled(1.1)
+        expected = reference.run_simulation(wake_model='NOJ').calculate_production()
+        assert scaled.aep_gwh == pytest.approx(expected.aep_gwh, rel=1e-12)
+
+        site.with_turbine(site.turbine)
+        assert not site._model_pool
+        site.run_simulation(wake_model='NOJ')
+        site.set_layout(site.layout)
+        assert not site._model_pool
+
+
+class TestPowerCurveEngine:
+    """Gross no-wake energy straight from the power curve."""
+
+    @pytest.mark.requires_pywake
+    def test_matches_pywake_no_wake_run(self, make_site):
+        """Energy and sector losses equal the PyWake ideal baseline."""
+        def clipped_site():
+            # PyWake holds the last power-curve value above 25 m/s, the
+            # power curve lookup cuts out; compare within the curve's range
+            site = make_site()
+            site.wind_data = replace(
+                site.wind_data, timeseries=site.wind_data.timeseries.clip(upper=25.0)
+            )
+            return site
+
+        reference = clipped_site().run_simulation().calculate_production()
+
+        site = clipped_site()
+        site._execute_pywake_simulation = None  # Would fail if called
+        result = site.run_simulation(simulation_method='power_curve').calculate_production()
+
+        assert result.metadata['simulation_type'] == 'power_curve'
+        assert result.wake_loss_percent == 0.0
+        np.testing.assert_allclose(
+            result.metadata['ideal_per_turbine_gwh'],
+            reference.metadata['ideal_per_turbine_gwh'],
+            rtol=1e-9
+        )
+        assert result.sector_loss_percent > 0
+        assert result.hourly_energy['net_mwh'].sum() / 1000 * 8760 / 500 == pytest.approx(
+            result.aep_gwh
+        )
+
+    def test_screening_matches_site_runs(self, make_site):
+        """Screening several models in one call equals one site run per model."""
+        site = make_site()
+        base = site.turbine
+        taller = TurbineModel(replace(base.spec, name='Synthetic 3MW @ 140m', hub_height=140))
+
+        screening = screen_turbine_models(
+            site.wind_data, site.layout, [base, taller],
+            shear_alpha=0.2, sector_management=site.sector_management
+        )
+
+        assert list(screening.summary['configuration']) == [base.name, taller.name]
+        for turbine in (base, taller):
+            single = make_site()
+            single.wind_data = wind_at_hub_height(single.wind_data, turbine.hub_height, 0.2)
+            expected = single.with_turbine(turbine).run_simulation(
+                simulation_method='power_curve', validate=False
+            ).calculate_production()
+
+            result = screening.results[turbine.name]
+            np.testing.assert_allclose(
+                result.turbine_production_gwh, expected.turbine_production_gwh, rtol=1e-12
+            )
+            assert result.sector_loss_percent == pytest.approx(expected.sector_loss_percent)
+            assert result.capacity_factor == pytest.approx(expected.capacity_factor)
+
+
+class TestAirDensityCorrection:
+    """Hourly air density normalizes the wind speeds before simulation."""
+
+    def with_density(self, site, density):
+        site.wind_data = replace(
+            site.wind_data,
+            timeseries=site.wind_data.timeseries.assign(air_density=density)
+        )
+        return site
+
+    @pytest.mark.requires_pywake
+    def test_equals_prescaled_wind(self, make_site):
+        """PyWake sees V × (rho / 1.225)^(1/3); disabling restores standard density."""
+        density = np.random.default_rng(5).uniform(1.05, 1.2, 500)
+        site = self.with_density(make_site(), density)
+        result = site.run_simulation().calculate_production()
+
+        reference = make_site()
+        reference.wind_data = replace(
+            reference.wind_data,
+            timeseries=reference.wind_data.timeseries.assign(
+                ws=reference.wind_data.timeseries['ws'] * np.cbrt(density / 1.225)
+            )
+        )
+        expected = reference.run_simulation().calculate_production()
+
+        assert result.metadata['air_density_normalized']
+        assert result.aep_gwh == pytest.approx(expected.aep_gwh, rel=1e-12)
+
+        standard = site.set_air_density_correction(False).run_simulation().calculate_production()
+        assert standard.aep_gwh == pytest.approx(make_site().run_simulation().calculate_production().aep_gwh)
+        assert standard.aep_gwh > result.aep_gwh
+
+    def test_power_curve_and_screening_agree(self, make_site):
+        """The power-curve engine and the screening apply the same correction."""
+        site = self.with_density(make_site(), 1.1)
+        result = site.run_simulation(simulation_method='power_curve').calculate_production()
+
+        screening = screen_turbine_models(
+            site.wind_data, site.layout, [site.turbine], sector_management=site.sector_management
+        )
+
+        np.testing.assert_allclose(
+            screening.results[site.turbine.name].turbine_production_gwh,
+            result.turbine_production_gwh,
+            rtol=1e-12
+        )
+
+
+class TestStabilityTurbulence:
+    """Stability-dependent turbulence intensity in the timeseries site."""
+
+    def with_stability(self, site):
+        rmol = np.random.default_rng(6).uniform(-0.03, 0.03, len(site.wind_data.timeseries))
+        site.wind_data = replace(
+            site.wind_data,
+            timeseries=site.wind_data.timeseries.assign(rmol=rmol)
+        )
+        return site.set_stability_model()
+
+    @pytest.mark.requires_pywake
+    def test_site_turbulence_and_cache_key(self, make_site):
+        """The XRSite carries the hourly stability TI and the cache key changes."""
+        site = self.with_stability(make_site(sector_management=False))
+        site.run_simulation(wake_model='Niayifar_Gaussian')
+
+        pywake_site = site._model_pool[('site', ('timeseries',))]
+        ws = site.wind_data.timeseries['ws'].to_numpy()
+        np.testing.assert_allclose(pywake_site.ds['TI'].values, site._turbulence_intensity(ws))
+
+        key = site._simulation_cache_key(None, 12, 'timeseries')
+        assert key != site.set_stability_model(None)._simulation_cache_key(None, 12, 'timeseries')
+
+    @pytest.mark.requires_pywake
+    def test_ti_dependent_wake_model(self, make_site):
+        """Stability TI changes wake losses with Niayifar; TI-blind models warn."""
+        site = self.with_stability(make_site(sector_management=False))
+        stable = site.run_simulation(wake_model='Niayifar_Gaussian').calculate_production()
+        ntm = make_site(sector_management=False).run_simulation(
+            wake_model='Niayifar_Gaussian'
+        ).calculate_production()
+
+        assert stable.wake_loss_percent != pytest.approx(ntm.wake_loss_percent, rel=1e-6)
+
+        with pytest.warns(UserWarning, match="ignores turbulence intensity"):
+            site.run_simulation(wake_model='NOJ')
+
+    @pytest.mark.requires_pywake
+    def test_chunked_parity(self, make_site):
+        """Chunked runs pass each chunk's stability TI to the workers."""
+        site = self.with_stability(make_site(sector_management=False))
+
+        full = site.run_simulation(wake_model='Niayifar_Gaussian').calculate_production()
+        chunked = site.run_simulation(
+            wake_model='Niayifar_Gaussian', chunk_hours=120
+        ).calculate_production()
+
+        assert full.metadata['stability_ti']
+        assert chunked.aep_gwh == pytest.approx(full.aep_gwh, rel=1e-9)
+
+    @pytest.mark.requires_pywake
+    def test_power_table_validation_uses_table_turbulence(self, make_site, monkeypatch):
+        """The direct run of validate_power_table gets the table's NTM, not stability TI."""
+        site = self.with_stability(make_site(n_hours=100, sector_management=False))
+        table = site.build_power_table('NOJ', wd_step=10.0)
+
+        turbulence = []
+        create_site = site._create_timeseries_site
+
+        def record(ws=None, wd=None, P=None, ti=None):
+            pywake_site = create_site(ws, wd, P, ti=ti)
+            turbulence.append(pywake_site.ds['TI'].values)
+            return pywake_site
+
+        monkeypatch.setattr(site, '_create_timeseries_site', record)
+        site.validate_power_table(table)
+
+        ws = site.simulation_wind_data.timeseries['ws'].to_numpy()
+        np.testing.assert_allclose(turbulence[-1], site._ntm_turbulence_intensity(ws))
+
+    @pytest.mark.requires_pywake
+    def test_binning_error_reference_uses_ntm(self, make_site, monkeypatch):
+        """The reference and the binned runs all get the NTM, not stability TI."""
+        site = self.with_stability(make_site(sector_management=False))
+
+        sites = []
+        create_site = site._create_timeseries_site
+
+        def record(ws=None, wd=None, P=None, ti=None):
+            pywake_site = create_site(ws, wd, P, ti=ti)
+            sites.append(pywake_site.ds)
+            return pywake_site
+
+        monkeypatch.setattr(site, '_create_timeseries_site', record)
+        site.evaluate_binning_error([(0.1, 1.0)])
+
+        assert len(sites) == 2
+        for ds in sites:
+            np.testing.assert_allclose(
+                ds['TI'].values, site._ntm_turbulence_intensity(ds['wind_speed'].values)
+            )
+
+    def test_requires_stability_columns(self, make_site):
+        """Enabling the model without RMOL/Richardson data is an error."""
+        with pytest.raises(ValueError):
+            make_site().set_stability_model()
+
+
+@pytest.mark.requires_pywake
+class TestOperationalLosses:
+    """Hourly loss engine on the simulated power."""
+
+    def test_uniform_transforms_match_apply_losses(self, make_site):
+        """With uniform transforms the hourly engine equals the scalar losses."""
+        uniform = {name: UniformLoss() for name in ('availability_turbines', 'availability_grid',
+                                                    'electrical_losses',
+                                                    'environmental_performance_degradation')}
+        scalar = make_site().run_simulation().apply_losses().calculate_production()
+        hourly = make_site().run_simulation().apply_operational_losses(transforms=uniform)
+
+        result = hourly.calculate_production()
+        assert result.aep_gwh == pytest.approx(scalar.aep_gwh, rel=1e-9)
+        np.testing.assert_allclose(result.turbine_production_gwh, scalar.turbine_production_gwh, rtol=1e-9)
+
+    def test_hourly_energy_and_breakdown(self, make_site):
+        """Hourly net energy sums to the AEP; the breakdown lists realized losses."""
+        site = make_site().run_simulation().apply_operational_losses(seed=2)
+        result = site.calculate_production()
+
+        annual_net = result.hourly_energy['net_mwh'].sum() * 8760 / 500 / 1000
+        assert annual_net == pytest.approx(result.aep_gwh, rel=1e-9)
+        assert 'realized_percentage' in result.loss_breakdown['availability_turbines']
+        assert result.arrays['NetPower'].shape == (5, 500)
+        assert result.arrays['NetPower'].sum() / 1e6 == pytest.approx(
+            result.hourly_energy['net_mwh'].sum(), rel=1e-5
+        )
+
+        with pytest.raises(ValueError):
+            site.apply_operational_losses()
+
+    def test_simulated_hysteresis(self, make_site):
+        """Simulated hysteresis replaces the configured value in both loss paths."""
+        site = make_site().run_simulation()
+        hysteresis = site.simulate_hysteresis(cut_out_ws=15.0, restart_ws=12.0)
+        assert len(hysteresis.episodes) > 0
+
+        scalar = site.apply_losses().calculate_production()
+        entry = scalar.loss_breakdown['high_hysteresis_losses']
+        assert entry['is_computed']
+        assert entry['value'] == pytest.approx(hysteresis.loss_fraction)
+
+        site.run_simulation()
+        site.simulate_hysteresis(cut_out_ws=15.0, restart_ws=12.0)
+        losses = site.apply_operational_losses().calculate_production().metadata['operational_losses']
+        summary = pd.DataFrame(losses['summary']).set_index('loss_category')
+        assert summary.loc['high_hysteresis_losses', 'transform'] == 'StoppedMaskLoss'
+        assert summary.loc['high_hysteresis_losses', 'realized_percent'] > 0
+
+    def test_hysteresis_wind_speed_basis(self, make_site):
+        """WS_eff of a density-normalized run and the free stream give the same stops."""
+        density = np.random.default_rng(5).uniform(1.0, 1.1, 500)
+        sites = []
+        for variables in (('Power', 'WS_eff'), ('Power',)):
+            site = make_site(sector_management=False)
+            site.wind_data = replace(
+                site.wind_data, timeseries=site.wind_data.timeseries.assign(air_density=density)
+            )
+            # One turbine, so WS_eff is the free-stream wind speed
+            site.set_layout(TurbineLayout.from_coordinates(np.zeros((1, 2)), crs='EPSG:32719'))
+            sites.append(site.enable_compact_results(variables).run_simulation())
+
+        ws_eff, free_stream = (s.simulate_hysteresis(cut_out_ws=15.0, restart_ws=12.0) for s in sites)
+
+        assert 'WS_eff' in sites[0].calculate_production().arrays
+        np.testing.assert_array_equal(ws_eff.stopped, free_stream.stopped)
+        assert ws_eff.loss_fraction == pytest.approx(free_stream.loss_fraction)
+        assert free_stream.loss_fraction > 0
+
+    def test_availability_monte_carlo(self, make_site):
+        """Outage realizations start from the simulated net hourly power."""
+        site = make_site().run_simulation()
+        aep = site.calculate_production().aep_gwh
+
+        outages = site.simulate_availability(n_realizations=200, mttr_hours=24)
+
+        assert outages.gross_energy_gwh == pytest.approx(aep, rel=1e-9)
+        assert outages.model.availability == pytest.approx(0.985)
+        assert (outages.annual_energy_gwh <= aep + 1e-12).all()
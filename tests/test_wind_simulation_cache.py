@@ -0,0 +1,113 @@
+"""
+Tests for the content-addressed simulation result cache.
+
+Uses small hand-made SimulationArrays, so no PyWake run is needed.
+Tests verify:
+- Memory tier round trip and LRU eviction
+- Disk tier round trip through a fresh cache instance
+- Writers use their own temp file and leave none behind
+- Corrupt disk entries are dropped and reported as misses
+- Cache keys change with every simulation input
+"""
+
+import os
+
+import numpy as np
+
+from latam_hybrid.wind import SimulationCache
+from latam_hybrid.wind.simulation_cache import SimulationArrays, compute_simulation_key
+
+
+def make_arrays(seed=0, n_turbines=3, n_hours=24):
+    """Timeseries arrays with one extra variable."""
+    rng = np.random.default_rng(seed)
+    power = rng.uniform(0, 3.0e6, (n_turbines, n_hours))
+    return SimulationArrays(
+        aep_gwh=power * 8760 / n_hours / 1e9,
+        power_w=power,
+        dims=('wt', 'time'),
+        variables={'WS_eff': rng.uniform(3, 12, (n_turbines, n_hours)).astype(np.float32)},
+        pywake_result=object()
+    )
+
+
+class TestSimulationCache:
+    """Test the memory and disk tiers."""
+
+    def test_memory_lru(self):
+        """Test memory hits and eviction of the least recently used entry."""
+        cache = SimulationCache(max_memory_entries=2)
+        for key in ('a', 'b'):
+            cache.put(key, make_arrays())
+        assert cache.get('a') is not None  # 'b' is now least recently used
+        cache.put('c', make_arrays())
+
+        assert cache.get('b') is None
+        assert cache.get('c').pywake_result is None
+        assert cache.stats == {'memory_hits': 2, 'disk_hits': 0, 'misses': 1}
+
+    def test_disk_round_trip(self, tmp_path):
+        """Test that a fresh cache instance reads every stored array from disk."""
+        arrays = make_arrays()
+        SimulationCache(cache_dir=tmp_path).put('key', arrays)
+
+        cache = SimulationCache(cache_dir=tmp_path)
+        loaded = cache.get('key')
+
+        assert cache.stats['disk_hits'] == 1
+        assert loaded.dims == arrays.dims
+        np.testing.assert_array_equal(loaded.power_w, arrays.power_w)
+        np.testing.assert_array_equal(loaded.variables['WS_eff'], arrays.variables['WS_eff'])
+
+    def test_writers_use_own_temp_file(self, tmp_path):
+        """Test that another process's temp file for the same key is left alone."""
+        foreign = tmp_path / f"key.npz.tmp{os.getpid() + 1}"
+        foreign.write_bytes(b'partial write of another process')
+
+        SimulationCache(cache_dir=tmp_path).put('key', make_arrays())
+
+        assert foreign.read_bytes() == b'partial write of another process'
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['key.npz', foreign.name]
+        assert SimulationCache(cache_dir=tmp_path).get('key') is not None
+
+    def test_corrupt_entry_is_dropped(self, tmp_path):
+        """Test that an unreadable file counts as a miss and is removed."""
+        (tmp_path / 'key.npz').write_bytes(b'not an npz file')
+
+        cache = SimulationCache(cache_dir=tmp_path)
+
+        assert cache.get('key') is None
+        assert cache.stats['misses'] == 1
+        assert not (tmp_path / 'key.npz').exists()
+
+    def test_disk_size_eviction(self, tmp_path):
+        """Test that the disk tier keeps the newest entries under its size limit."""
+        SimulationCache(cache_dir=tmp_path / 'probe').put('probe', make_arrays(n_hours=48))
+        entry_mb = (tmp_path / 'probe' / 'probe.npz').stat().st_size / 1024 / 1024
+
+        cache = SimulationCache(cache_dir=tmp_path / 'cache', max_disk_mb=2.5 * entry_mb)
+        for seed in range(4):
+            cache.put(f'key{seed}', make_arrays(seed=seed, n_hours=48))
+
+        assert sorted(p.name for p in (tmp_path / 'cache').glob('*.npz')) == ['key2.npz', 'key3.npz']
+
+
+class TestSimulationKey:
+    """Test the content hash of simulation inputs."""
+
+    def test_key_changes_with_inputs(self, synthetic_turbine):
+        """Test that wind, layout, wake model and options all enter the key."""
+        spec = synthetic_turbine().spec
+        ws, wd = np.array([5.0, 8.0]), np.array([0.0, 90.0])
+        x, y = np.array([0.0, 500.0]), np.zeros(2)
+
+        key = compute_simulation_key(ws, wd, spec, x, y, 'NOJ', 'timeseries')
+        variants = [
+            compute_simulation_key(ws * 1.01, wd, spec, x, y, 'NOJ', 'timeseries'),
+            compute_simulation_key(ws, wd, spec, x + 1, y, 'NOJ', 'timeseries'),
+            compute_simulation_key(ws, wd, spec, x, y, None, 'timeseries'),
+            compute_simulation_key(ws, wd, spec, x, y, 'NOJ', 'timeseries', ti=0.1),
+        ]
+
+        assert key == compute_simulation_key(ws, wd, spec, x, y, 'NOJ', 'timeseries')
+        assert len(set(variants + [key])) == 5
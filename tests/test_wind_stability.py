@@ -0,0 +1,109 @@
+"""
+Tests for stability classification and stability-dependent flow properties.
+
+Uses synthetic hourly RMOL and Richardson number series on the shared
+synthetic wind data (conftest).
+Tests verify:
+- Class limits, the Richardson fallback and neutral hours without data
+- Classes are computed once per dataset and model
+- Turbulence intensity and shear exponent per class
+"""
+
+import numpy as np
+import pytest
+
+from latam_hybrid.core import WindData
+from latam_hybrid.wind import StabilityModel, stability_classes, stability_at_height, stability_table
+from latam_hybrid.wind.stability import DEFAULT_STABILITY_MODEL, NEUTRAL
+
+
+@pytest.fixture
+def stability_data(synthetic_wind_data):
+    """Factory of constant-wind hourly data with stability columns."""
+    def make(rmol, richardson=None, ws=8.0) -> WindData:
+        columns = {'rmol': rmol} if richardson is None else {'rmol': rmol, 'richardson': richardson}
+        return synthetic_wind_data(
+            n_hours=len(rmol), height=100.0, start='2020-01-01', ws=ws, wd=0.0, **columns
+        )
+
+    return make
+
+
+class TestClassification:
+    """Hourly stability classes from RMOL and the Richardson number."""
+
+    def test_rmol_limits(self, stability_data):
+        """|L| bands of 100 m and 500 m separate the five classes."""
+        rmol = np.array([-0.05, -0.005, 0.0, 0.005, 0.05, -1 / 500, 1 / 100])
+
+        classes = stability_classes(stability_data(rmol))
+
+        assert classes.tolist() == [0, 1, 2, 3, 4, 2, 4]
+
+    def test_richardson_fallback(self, stability_data):
+        """Richardson is used where RMOL is missing; hours with neither are neutral."""
+        rmol = np.array([np.nan, np.nan, 0.05])
+        richardson = np.array([0.5, np.nan, -0.5])
+
+        classes = stability_classes(stability_data(rmol, richardson))
+
+        assert classes.tolist() == [4, NEUTRAL, 4]
+
+    def test_memoized(self, stability_data):
+        """Repeated calls return the same array; another model is classified anew."""
+        wind_data = stability_data(np.linspace(-0.02, 0.02, 50))
+
+        first = stability_classes(wind_data)
+
+        assert stability_classes(wind_data) is first
+        other = StabilityModel(rmol_limits=(-0.02, -0.01, 0.01, 0.02))
+        assert stability_classes(wind_data, other) is not first
+
+    def test_invalid_model(self):
+        """Limits must be ascending and factors given per class."""
+        with pytest.raises(ValueError):
+            StabilityModel(rmol_limits=(0.01, -0.01, 0.002, 0.1))
+        with pytest.raises(ValueError):
+            StabilityModel(alpha=(0.1, 0.2))
+
+    def test_missing_columns(self, synthetic_wind_data):
+        """Wind data without stability columns are rejected."""
+        wind_data = synthetic_wind_data(n_hours=1, height=100.0)
+        with pytest.raises(ValueError):
+            stability_classes(wind_data)
+
+
+class TestFlowProperties:
+    """Turbulence intensity and shear per class."""
+
+    def test_turbulence_intensity(self):
+        """Neutral hours get the IEC NTM, other classes scale it."""
+        model = DEFAULT_STABILITY_MODEL
+        classes = np.arange(5)
+
+        ti = model.turbulence_intensity(np.full(5, 10.0), classes)
+
+        ntm = 0.12 * (0.75 + 0.56)
+        np.testing.assert_allclose(ti, ntm * np.array(model.ti_factor))
+
+    def test_at_height(self, stability_data):
+        """Each hour is shifted with its class's shear exponent."""
+        wind_data = stability_data(np.array([-0.05, 0.0, 0.05]))
+
+        shifted = stability_at_height(wind_data, 200.0)
+
+        expected = 8.0 * 2.0 ** np.array(DEFAULT_STABILITY_MODEL.alpha)[[0, 2, 4]]
+        np.testing.assert_allclose(shifted.timeseries['ws'], expected)
+        assert shifted.height == 200.0
+        assert shifted.metadata['alpha'] == 'stability'
+        assert stability_at_height(wind_data, 100.0) is wind_data
+
+    def test_table(self, stability_data):
+        """Hours per class add up to the record length."""
+        wind_data = stability_data(np.array([-0.05, 0.0, 0.0, 0.05]))
+
+        table = stability_table(wind_data)
+
+        assert table['hours'].tolist() == [1, 0, 2, 0, 1]
+        assert table['frequency'].sum() == pytest.approx(1.0)
+        assert table.loc['neutral', 'mean_ws'] == pytest.approx(8.0)
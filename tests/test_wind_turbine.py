@@ -0,0 +1,77 @@
+"""
+Tests for turbine power and thrust curve evaluation.
+
+Uses the shared synthetic 3 MW turbine (conftest) tabulated every 0.5 m/s
+from 3 m/s, where its power is already non-zero.
+Tests verify:
+- The uniform-grid lookup reproduces np.interp, including edges and NaN
+- Curves with off-grid breakpoints fall back to np.interp
+- Air-density correction via the IEC equivalent wind speed
+"""
+
+import numpy as np
+import pytest
+
+from latam_hybrid.wind.curve_lookup import CurveLookup
+
+
+CURVE_WS = np.arange(3.0, 25.5, 0.5)
+CURVE_POWER = np.clip((CURVE_WS - 2.5) ** 3 * 5, 0, 3000)
+
+# synthetic_turbine arguments giving the CURVE_WS / CURVE_POWER table
+CURVE = {'curve_ws': CURVE_WS, 'cut_in_ws': 2.5}
+
+
+class TestCurveLookup:
+    """Uniform-grid evaluation against np.interp."""
+
+    def test_matches_interp(self, synthetic_turbine):
+        """Random samples, both curve ends, out-of-range and NaN."""
+        rng = np.random.default_rng(0)
+        ws = np.concatenate([
+            rng.uniform(-1, 30, 100_000),
+            [np.nan, 2.995, 3.0, 3.005, 24.995, 25.0, 25.005, 0.0]
+        ])
+
+        power = synthetic_turbine(**CURVE).power_at_wind_speed(ws)
+
+        expected = np.interp(ws, CURVE_WS, CURVE_POWER, left=0.0, right=0.0)
+        np.testing.assert_allclose(power, expected, rtol=0, atol=1e-9)
+        assert np.isnan(power[100_000])
+
+    def test_shape_and_scalar(self, synthetic_turbine):
+        """Multi-dimensional input keeps its shape; scalars stay scalars."""
+        turbine = synthetic_turbine(**CURVE)
+        grid = np.linspace(0, 26, 24).reshape(4, 6)
+
+        assert turbine.power_at_wind_speed(grid).shape == (4, 6)
+        assert turbine.power_at_wind_speed(10.0) == pytest.approx(np.interp(10.0, CURVE_WS, CURVE_POWER))
+        assert turbine.ct_at_wind_speed(np.array([3.0]))[0] == pytest.approx(0.8 - 0.02 * 3.0)
+
+    def test_off_grid_breakpoints(self):
+        """Curves that don't align with the grid use np.interp."""
+        lookup = CurveLookup.from_curve([0.0, 3.333, 25.0], [0.0, 1.0, 2.0])
+        assert lookup.n_intervals == 0
+        assert lookup(np.array([3.333]))[0] == pytest.approx(1.0)
+
+
+class TestAirDensity:
+    """IEC 61400-12-1 density correction of the power curve."""
+
+    def test_equivalent_wind_speed(self, synthetic_turbine):
+        """Power at rho equals reference power at V × (rho / rho_ref)^(1/3)."""
+        turbine = synthetic_turbine(**CURVE, metadata={'air_density': 1.2})
+        rho = np.array([1.2 * 1.331, 1.2, 1.2 / 1.331])
+
+        power = turbine.power_at_wind_speed(np.full(3, 10.0), air_density=rho)
+
+        np.testing.assert_allclose(power, turbine.power_at_wind_speed(np.array([11.0, 10.0, 10.0 / 1.1])))
+
+    def test_family(self, synthetic_turbine):
+        """One column per density, the reference column equals the curve."""
+        turbine = synthetic_turbine(**CURVE)
+        family = turbine.power_curve_family([1.0, 1.1, 1.225])
+
+        assert family.shape == (len(CURVE_WS), 3)
+        np.testing.assert_allclose(family[1.225], CURVE_POWER)
+        assert (family[1.0] <= family[1.225] + 1e-9).all()
@@ -0,0 +1,94 @@
+"""
+Tests for batched Weibull estimation.
+
+Uses Weibull samples with a known scale and shape per group.
+Tests verify:
+- Maximum likelihood agrees with scipy's per-group fit
+- The WAsP fit preserves the mean cube of the wind speed
+- weibull_table groups by sector and year in one call
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+from scipy.special import gamma
+
+from latam_hybrid.wind.weibull import fit_weibull, weibull_table
+
+
+def weibull_samples(n=20000, n_groups=6, seed=3):
+    """Samples with A = 6 + g and k = 1.5 + 0.25 g for group g."""
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, n_groups, n)
+    A = 6.0 + groups
+    k = 1.5 + 0.25 * groups
+    return A * rng.weibull(k), groups
+
+
+class TestFitWeibull:
+    """All groups fitted together."""
+
+    def test_ml_matches_scipy(self):
+        """Batched ML equals scipy.stats.weibull_min.fit(floc=0) per group."""
+        ws, groups = weibull_samples()
+
+        A, k = fit_weibull(ws, groups, n_groups=6, method='ml')
+
+        for g in (0, 3, 5):
+            k_ref, _, A_ref = stats.weibull_min.fit(ws[groups == g], floc=0)
+            assert k[g] == pytest.approx(k_ref, rel=1e-4)
+            assert A[g] == pytest.approx(A_ref, rel=1e-4)
+
+    def test_wasp_preserves_energy(self):
+        """The WAsP fit reproduces <u^3> of each group."""
+        ws, groups = weibull_samples()
+
+        A, k = fit_weibull(ws, groups, n_groups=6, method='wasp')
+
+        for g in range(6):
+            observed = np.mean(ws[groups == g] ** 3)
+            assert A[g] ** 3 * gamma(1 + 3 / k[g]) == pytest.approx(observed, rel=1e-6)
+
+    def test_moments_close_to_truth(self):
+        """Moment estimates recover the generating parameters."""
+        ws, groups = weibull_samples()
+
+        A, k = fit_weibull(ws, groups, n_groups=6, method='moments')
+
+        np.testing.assert_allclose(k, 1.5 + 0.25 * np.arange(6), rtol=0.05)
+        np.testing.assert_allclose(A, 6.0 + np.arange(6), rtol=0.03)
+
+    def test_small_and_empty_groups(self):
+        """Groups below min_samples are NaN; zeros and NaN are ignored."""
+        ws = np.array([0.0, np.nan, 5.0, 6.0, 7.0, 8.0])
+        groups = np.array([0, 0, 1, 1, 1, 1])
+
+        A, k = fit_weibull(ws, groups, n_groups=3, min_samples=3)
+
+        assert np.isnan(A[0]) and np.isnan(A[2])
+        assert np.isfinite(k[1])
+
+    def test_unknown_method(self):
+        """Only the documented estimators are accepted."""
+        with pytest.raises(ValueError):
+            fit_weibull(np.ones(20), method='least_squares')
+
+
+class TestWeibullTable:
+    """Tidy table of fits per sector and year."""
+
+    def test_sector_by_year(self, synthetic_wind_data):
+        """One row per (year, sector) with frequencies summing to 1 per year."""
+        ws, _ = weibull_samples(n=2 * 8760)
+        wd = np.random.default_rng(4).uniform(0, 360, len(ws))
+        wind_data = synthetic_wind_data(
+            n_hours=len(ws), height=100.0, start='2020-01-01', ws=ws, wd=wd
+        )
+
+        table = weibull_table(wind_data, by=('year', 'sector'), n_sectors=12, method='wasp')
+
+        assert len(table) == 24
+        assert list(table.columns[:4]) == ['year', 'sector', 'wd_start', 'wd_end']
+        assert table.groupby('year')['frequency'].sum().tolist() == pytest.approx([1.0, 1.0])
+        assert table['hours'].sum() == len(ws)
+        assert table['k'].notna().all()